@@ -5,7 +5,7 @@ a = Analysis(
     ['main.py'],
     pathex=[],
     binaries=[],
-    datas=[('media', 'media'), ('highscores.json', '.')],
+    datas=[('media', 'media'), ('locales', 'locales'), ('highscores.json', '.')],
     hiddenimports=[],
     hookspath=[],
     hooksconfig={},
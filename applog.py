@@ -0,0 +1,154 @@
+"""
+Application logging
+-------------------
+Every module logs through `get_logger(__name__)` with the standard logging
+API. Messages are formatted lazily (`log.debug("Word %s", word)`), so a
+disabled level costs a single level check.
+
+Records are kept in an in-memory ring buffer instead of being written to
+the console, which is slow on the Windows kiosks. The buffer is written to
+~/.kelime_oyunu/logs/ when the application crashes or when dump_log() is
+called (Ctrl+Shift+L in the game window).
+
+Chatty modules can be sampled: with sample_rates={'game': 10} only every
+10th DEBUG/INFO record of the 'game' logger is kept. Warnings and errors
+are never sampled.
+
+    KELIME_LOG_LEVEL=DEBUG    Record debug messages too
+    KELIME_LOG_CONSOLE=1      Also write the log to stderr
+
+Structured data goes in `extra={'fields': {...}}` and is appended to the
+message as key=value pairs.
+"""
+import os
+import sys
+import time
+import logging
+import threading
+import traceback
+from collections import deque
+
+ROOT_LOGGER = "kelime"
+DEFAULT_CAPACITY = 2000  # Records kept in the ring buffer
+LOG_FORMAT = "%(asctime)s %(levelname)-7s %(name)s [%(threadName)s] %(message)s"
+
+_ring = None
+
+
+class RingBufferHandler(logging.Handler):
+    """Keeps the last `capacity` records; they are only formatted when dumped"""
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        super().__init__()
+        self.records = deque(maxlen=capacity)
+
+    def emit(self, record):
+        self.records.append(record)  # deque.append is atomic, no lock needed
+
+    def dump(self, stream):
+        for record in list(self.records):
+            stream.write(self.format(record) + "\n")
+
+
+class SamplingFilter(logging.Filter):
+    """Keep one in `rate` DEBUG/INFO records per logger name"""
+
+    def __init__(self, sample_rates=None):
+        super().__init__()
+        self.sample_rates = dict(sample_rates or {})
+        self._counters = {}
+
+    def filter(self, record):
+        if record.levelno >= logging.WARNING or not self.sample_rates:
+            return True
+        name = record.name[len(ROOT_LOGGER) + 1:] if record.name.startswith(ROOT_LOGGER + ".") else record.name
+        rate = self.sample_rates.get(name)
+        if not rate or rate <= 1:
+            return True
+        count = self._counters.get(name, 0)
+        self._counters[name] = count + 1
+        return count % rate == 0
+
+
+class FieldsFormatter(logging.Formatter):
+    """Appends the record's structured fields as key=value pairs"""
+
+    def format(self, record):
+        message = super().format(record)
+        fields = getattr(record, 'fields', None)
+        if fields:
+            message += " " + " ".join(f"{key}={value!r}" for key, value in fields.items())
+        return message
+
+
+def get_logger(name):
+    """Logger for a module, e.g. get_logger(__name__)"""
+    return logging.getLogger(f"{ROOT_LOGGER}.{name}")
+
+
+def setup_logging(level=None, capacity=DEFAULT_CAPACITY, sample_rates=None, console=None):
+    """Route the application's logs into the ring buffer (call once at startup)"""
+    global _ring
+    level = level or os.environ.get('KELIME_LOG_LEVEL', 'INFO')
+    console = console if console is not None else bool(os.environ.get('KELIME_LOG_CONSOLE'))
+
+    logger = logging.getLogger(ROOT_LOGGER)
+    logger.setLevel(level.upper() if isinstance(level, str) else level)
+    logger.propagate = False
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+
+    formatter = FieldsFormatter(LOG_FORMAT)
+    sampling = SamplingFilter(sample_rates)
+    _ring = RingBufferHandler(capacity)
+    _ring.setFormatter(formatter)
+    _ring.addFilter(sampling)
+    logger.addHandler(_ring)
+    if console:
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(formatter)
+        stream_handler.addFilter(sampling)
+        logger.addHandler(stream_handler)
+    return logger
+
+
+def get_log_dir():
+    from config import get_app_dir  # Late import: config logs through this module
+    log_dir = get_app_dir() / "logs"
+    os.makedirs(str(log_dir), exist_ok=True)
+    return log_dir
+
+
+def dump_log(path=None, reason="on demand"):
+    """Write the ring buffer to a file, returns its path (None if logging is not set up)"""
+    if _ring is None:
+        return None
+    if path is None:
+        path = get_log_dir() / time.strftime("kelime-%Y%m%d-%H%M%S.log")
+    with open(str(path), 'w', encoding='utf-8') as f:
+        f.write(f"# Log dump ({reason}), last {len(_ring.records)} records\n")
+        _ring.dump(f)
+    return path
+
+
+def _dump_on_crash(exc_type, exc_value, exc_traceback, where):
+    if issubclass(exc_type, SystemExit):
+        return
+    log = get_logger("crash")
+    log.critical("Unhandled exception in %s", where, exc_info=(exc_type, exc_value, exc_traceback))
+    try:
+        path = dump_log(reason=f"crash in {where}")
+        sys.stderr.write(f"Unhandled exception, log written to {path}\n")
+    except OSError:
+        pass
+    traceback.print_exception(exc_type, exc_value, exc_traceback)
+
+
+def install_crash_handler(root=None):
+    """Dump the ring buffer on any unhandled exception (main thread, other threads and Tk callbacks)"""
+    sys.excepthook = lambda *exc: _dump_on_crash(*exc, where="main thread")
+    threading.excepthook = lambda args: _dump_on_crash(
+        args.exc_type, args.exc_value, args.exc_traceback,
+        where=f"thread {args.thread.name if args.thread else '?'}")
+    if root is not None:
+        root.report_callback_exception = lambda *exc: _dump_on_crash(*exc, where="Tk callback")
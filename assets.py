@@ -0,0 +1,141 @@
+"""
+Resized image cache
+-------------------
+The UI shows its images at fixed sizes, so every (image, size) it asks for
+is rendered once and kept on disk in ~/.kelime_oyunu/image_cache as a small
+PNG named after the source's content hash, the size and the resampling
+filter. Tk loads those PNGs directly, so a normal launch neither decodes
+the large originals nor resamples them, and PIL is only imported to fill
+a cache miss.
+
+    python assets.py        Pre-render every size listed in UI_IMAGES
+"""
+import os
+import json
+import hashlib
+import threading
+import tkinter as tk
+
+from config import get_app_dir
+from applog import get_logger
+
+log = get_logger(__name__)
+
+MEDIA_DIR = "media"
+# Every image size the UI requests: name -> (source, (width, height))
+UI_IMAGES = {
+    'logo': (os.path.join(MEDIA_DIR, "logo.png"), (200, 200)),
+}
+DEFAULT_FILTER = 'LANCZOS'
+HASH_INDEX_FILE = "hashes.json"
+
+
+class ImageCache:
+    """Disk cache of resized images, handed out as PhotoImage objects"""
+
+    def __init__(self, cache_dir=None):
+        self.cache_dir = str(cache_dir or get_app_dir() / "image_cache")
+        self._photos = {}  # In-memory PhotoImages, Tk keeps them alive only while referenced
+        self._lock = threading.Lock()
+        self._hashes = None
+
+    # --- Source hashes -----------------------------------------------------
+
+    def _hash_index_path(self):
+        return os.path.join(self.cache_dir, HASH_INDEX_FILE)
+
+    def _load_hashes(self):
+        if self._hashes is None:
+            try:
+                with open(self._hash_index_path(), 'r', encoding='utf-8') as f:
+                    self._hashes = json.load(f)
+            except (OSError, ValueError):
+                self._hashes = {}
+        return self._hashes
+
+    def source_hash(self, source):
+        """Content hash of a source image, re-computed only when its mtime or size changes"""
+        st = os.stat(source)
+        stamp = f"{st.st_mtime_ns}:{st.st_size}"
+        path = os.path.abspath(source)
+        with self._lock:
+            hashes = self._load_hashes()
+            entry = hashes.get(path)
+            if entry and entry[0] == stamp:
+                return entry[1]
+        digest = hashlib.sha1()
+        with open(source, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 16), b''):
+                digest.update(chunk)
+        content_hash = digest.hexdigest()
+        with self._lock:
+            hashes[path] = [stamp, content_hash]
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = self._hash_index_path() + ".tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(hashes, f)
+            os.replace(tmp_path, self._hash_index_path())
+        return content_hash
+
+    # --- Rendering ---------------------------------------------------------
+
+    def cached_path(self, source, size, resample=DEFAULT_FILTER):
+        width, height = size
+        return os.path.join(self.cache_dir, f"{self.source_hash(source)}-{width}x{height}-{resample.lower()}.png")
+
+    def render(self, source, size, resample=DEFAULT_FILTER):
+        """Return the path of the resized image, rendering it first if it is not cached (safe on any thread)"""
+        path = self.cached_path(source, size, resample)
+        if os.path.exists(path):
+            return path
+        from PIL import Image  # Only needed on a cache miss
+
+        with Image.open(source) as img:
+            if img.mode not in ('RGB', 'RGBA'):
+                img = img.convert('RGBA')
+            resized = img.resize(size, getattr(Image.Resampling, resample))
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        resized.save(tmp_path, format='PNG', compress_level=1)  # Fast to decode for Tk
+        os.replace(tmp_path, path)
+        log.info("Rendered %s at %dx%d", source, size[0], size[1])
+        return path
+
+    def photo(self, source, size, resample=DEFAULT_FILTER):
+        """PhotoImage of `source` at `size` (call on the Tk thread)"""
+        key = (os.path.abspath(source), tuple(size), resample)
+        photo = self._photos.get(key)
+        if photo is None:
+            photo = tk.PhotoImage(file=self.render(source, size, resample))
+            self._photos[key] = photo
+        return photo
+
+    def ui_photo(self, name):
+        """PhotoImage of one of the UI_IMAGES"""
+        source, size = UI_IMAGES[name]
+        return self.photo(source, size)
+
+    def prerender(self, images=None):
+        """Render every missing size of `images` (UI_IMAGES by default), returns the paths"""
+        paths = []
+        for name, (source, size) in (images or UI_IMAGES).items():
+            try:
+                paths.append(self.render(source, size))
+            except (OSError, ImportError) as e:
+                log.warning("Could not pre-render %s: %s", name, e)
+        return paths
+
+    def prerender_async(self, images=None):
+        """Fill the cache in the background so that later launches start from it"""
+        thread = threading.Thread(target=self.prerender, args=(images,), name="image-prerender", daemon=True)
+        thread.start()
+        return thread
+
+
+def main():
+    for path in ImageCache().prerender():
+        print(path)
+
+
+if __name__ == "__main__":
+    main()
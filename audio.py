@@ -0,0 +1,247 @@
+"""
+Audio engine
+------------
+Sound effects are played by one long-lived thread that takes commands from
+a queue, so triggering a sound from the UI is a queue put and never blocks
+or spawns a thread.
+
+With pygame installed, the effects are decoded into memory once at startup
+and mixed by pygame's mixer, so playback starts immediately and sounds can
+overlap. Without it, the engine falls back to playsound on the same thread.
+
+Triggers that pile up are coalesced: everything queued is drained at once,
+each sound plays at most once per batch, and a sound re-triggered within
+RETRIGGER_MS of its last start is dropped.
+
+Background music (pygame only) is streamed by pygame.mixer.music, which
+decodes the file a small buffer at a time instead of loading the whole
+track, and loops it without a gap. While a sound effect plays the music is
+ducked to its duck volume and brought back once the effect has finished.
+It is off by default; settings['music']['enabled'] turns it on.
+"""
+import os
+import time
+import queue
+import threading
+
+from applog import get_logger
+from localization import get_text
+
+log = get_logger(__name__)
+
+pygame = None  # Imported on the playback thread, it takes longer to import than the window takes to appear
+
+MEDIA_DIR = "media"
+SOUND_EFFECTS = ("dogru.mp3", "yanlis.mp3", "son.mp3")
+BACKGROUND_MUSIC = "background_music.mp3"
+RETRIGGER_MS = 80
+
+
+def apply_music_settings(engine, music_settings):
+    """Start, stop or re-level the background music from settings['music']"""
+    if music_settings.get('enabled'):
+        engine.play_music(music_settings.get('file', BACKGROUND_MUSIC),
+                          music_settings.get('volume'), music_settings.get('duck_volume'))
+    else:
+        engine.stop_music()
+
+
+class AudioEngine:
+    """Preloaded sound effects played from a single command queue"""
+
+    def __init__(self, media_dir=MEDIA_DIR, effects=SOUND_EFFECTS):
+        self.media_dir = media_dir
+        self.effects = effects
+        self._commands = queue.Queue()
+        self._sounds = {}        # file name -> pygame Sound
+        self._last_started = {}  # file name -> monotonic ms
+        self._effect_listeners = []
+        self._thread = None
+        self.backend = None
+        self._music = None            # File name of the music being streamed
+        self._music_volume = 0.4
+        self._duck_volume = 0.15
+        self._duck_until = None       # Monotonic seconds when the last effect ends
+
+    def start(self):
+        """Start the playback thread; the effects are decoded there, off the UI thread"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="audio", daemon=True)
+            self._thread.start()
+        return self
+
+    def add_effect_listener(self, callback):
+        """Register callback(file_name, seconds), called on the audio thread when an effect starts"""
+        self._effect_listeners.append(callback)
+
+    def play(self, file_name):
+        """Queue a sound effect from the media directory (any thread, never blocks)"""
+        self._commands.put(('play', file_name))
+
+    def play_music(self, file_name=BACKGROUND_MUSIC, volume=None, duck_volume=None):
+        """Stream and loop background music (replaces any music already playing)"""
+        self._commands.put(('music', (file_name, volume, duck_volume)))
+
+    def set_music_volume(self, volume=None, duck_volume=None):
+        self._commands.put(('volume', (volume, duck_volume)))
+
+    def stop_music(self):
+        self._commands.put(('stop_music', None))
+
+    def close(self):
+        if self._thread is not None:
+            self._commands.put(('quit', None))
+            self._thread.join(timeout=2.0)
+            self._thread = None
+
+    # --- Playback thread ---------------------------------------------------
+
+    def _import_pygame(self):
+        global pygame
+        if pygame is None:
+            os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+            try:
+                import pygame
+            except ImportError:  # Optional: the playsound fallback decodes on every play
+                return None
+        return pygame
+
+    def _init_backend(self):
+        if self._import_pygame() is not None:
+            try:
+                if not pygame.mixer.get_init():
+                    pygame.mixer.init()
+                pygame.mixer.set_num_channels(8)
+                for name in self.effects:
+                    self._load(name)
+                self.backend = 'pygame'
+                log.info("Audio engine ready (pygame, %d effects preloaded)", len(self._sounds))
+                return
+            except pygame.error as e:
+                log.warning("pygame mixer unavailable, falling back to playsound: %s", e)
+        self.backend = 'playsound'
+        log.info("Audio engine ready (playsound)")
+
+    def _load(self, name):
+        path = os.path.join(self.media_dir, name)
+        try:
+            self._sounds[name] = pygame.mixer.Sound(path)
+        except (pygame.error, FileNotFoundError) as e:
+            log.error("Could not load sound '%s': %s", path, e)
+        return self._sounds.get(name)
+
+    def _run(self):
+        self._init_backend()
+        while True:
+            try:
+                timeout = None if self._duck_until is None else max(0.0, self._duck_until - time.monotonic())
+                batch = [self._commands.get(timeout=timeout)]
+            except queue.Empty:
+                batch = []
+            while True:  # Coalesce everything that queued up meanwhile
+                try:
+                    batch.append(self._commands.get_nowait())
+                except queue.Empty:
+                    break
+            names = []
+            for command, arg in batch:
+                if command == 'quit':
+                    self._stop_music()
+                    return
+                if command == 'play':
+                    if arg not in names:
+                        names.append(arg)
+                else:
+                    self._music_command(command, arg)
+            for name in names:
+                now = time.monotonic() * 1000
+                if now - self._last_started.get(name, -RETRIGGER_MS) < RETRIGGER_MS:
+                    continue
+                self._last_started[name] = now
+                self._play_now(name)
+            if self._duck_until is not None and time.monotonic() >= self._duck_until:
+                self._duck_until = None
+                self._set_music_volume(self._music_volume)
+
+    def _play_now(self, name):
+        try:
+            if self.backend == 'pygame':
+                sound = self._sounds.get(name) or self._load(name)
+                if sound is None:
+                    return
+                length = sound.get_length()
+                self._notify(name, length)
+                self._duck(length)
+                sound.play()
+            else:
+                path = os.path.join(self.media_dir, name)
+                if not os.path.exists(path):
+                    log.error("Sound file not found: %s", path)
+                    return
+                self._notify(name, None)
+                from playsound import playsound
+                playsound(os.path.abspath(path), block=True)  # This thread is the only player
+        except Exception as e:
+            # Device or format problems must not stop the audio thread
+            log.error("Could not play sound '%s': %s", name, e)
+            if "codec can't decode byte" in str(e):
+                log.info(get_text('sound_fix_hint'))
+
+    def _notify(self, name, seconds):
+        for callback in list(self._effect_listeners):
+            try:
+                callback(name, seconds)
+            except Exception as e:
+                log.error("Effect listener error: %s", e)
+
+    # --- Background music (playback thread) -------------------------------
+
+    def _music_command(self, command, arg):
+        if command == 'music':
+            file_name, volume, duck_volume = arg
+            self._update_volumes(volume, duck_volume)
+            self._start_music(file_name)
+        elif command == 'volume':
+            self._update_volumes(*arg)
+            self._set_music_volume(self._duck_volume if self._duck_until else self._music_volume)
+        elif command == 'stop_music':
+            self._stop_music()
+
+    def _update_volumes(self, volume, duck_volume):
+        if volume is not None:
+            self._music_volume = max(0.0, min(1.0, float(volume)))
+        if duck_volume is not None:
+            self._duck_volume = max(0.0, min(1.0, float(duck_volume)))
+
+    def _start_music(self, file_name):
+        if self.backend != 'pygame':
+            log.info("Background music needs pygame, skipping %s", file_name)
+            return
+        path = os.path.join(self.media_dir, file_name)
+        try:
+            pygame.mixer.music.load(path)  # Opens a decoder stream, the track is not decoded up front
+            pygame.mixer.music.set_volume(self._music_volume)
+            pygame.mixer.music.play(loops=-1)
+            self._music = file_name
+            log.info("Streaming background music %s", path)
+        except (pygame.error, FileNotFoundError) as e:
+            self._music = None
+            log.error("Could not play background music '%s': %s", path, e)
+
+    def _stop_music(self):
+        if self._music is not None:
+            pygame.mixer.music.stop()
+            pygame.mixer.music.unload()
+            self._music = None
+
+    def _set_music_volume(self, volume):
+        if self._music is not None:
+            pygame.mixer.music.set_volume(volume)
+
+    def _duck(self, seconds):
+        """Lower the music until an effect of `seconds` has finished"""
+        if self._music is None:
+            return
+        if self._duck_until is None:
+            self._set_music_volume(self._duck_volume)
+        self._duck_until = max(self._duck_until or 0.0, time.monotonic() + seconds)
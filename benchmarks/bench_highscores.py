@@ -0,0 +1,60 @@
+"""
+Shared scoreboard benchmark
+---------------------------
+Starts many game instances (processes) that record scores into the same
+highscores file at once, then checks that no score was lost.
+
+    python benchmarks/bench_highscores.py [writers] [scores_per_writer]
+"""
+import os
+import sys
+import time
+import tempfile
+from multiprocessing import Process, Barrier
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import highscores  # noqa: E402
+
+
+def writer(filepath, writer_id, count, barrier):
+    barrier.wait()
+    for i in range(count):
+        highscores.save_highscore(filepath, f"player{writer_id}", i, 'quiz')
+        highscores.save_highscore(filepath, f"shared{i % 10}", writer_id * count + i, 'anagram')
+
+
+def main():
+    writers = int(sys.argv[1]) if len(sys.argv) > 1 else 32
+    per_writer = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        filepath = os.path.join(tmp_dir, "highscores.json")
+        barrier = Barrier(writers + 1)
+        processes = [Process(target=writer, args=(filepath, w, per_writer, barrier)) for w in range(writers)]
+        for p in processes:
+            p.start()
+        barrier.wait()
+        start = time.perf_counter()
+        for p in processes:
+            p.join()
+        elapsed = time.perf_counter() - start
+
+        highscores.compact_highscores(filepath)
+        scores = highscores.load_highscores(filepath)
+
+    total_writes = writers * per_writer * 2
+    lost = [w for w in range(writers) if scores.get(f"player{w}", {}).get('quiz') != per_writer - 1]
+    expected_shared = {f"shared{k}": max(w * per_writer + i for w in range(writers)
+                                         for i in range(per_writer) if i % 10 == k)
+                       for k in range(min(10, per_writer))}
+    lost += [u for u, best in expected_shared.items() if scores.get(u, {}).get('anagram') != best]
+
+    print(f"{writers} writers, {total_writes} scores in {elapsed:.2f}s "
+          f"({total_writes / elapsed:.0f} writes/s)")
+    print("No scores lost" if not lost else f"LOST UPDATES: {lost}")
+    return 1 if lost else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,79 @@
+"""
+Time-to-first-frame benchmark
+-----------------------------
+Launches the game several times with KELIME_STARTUP_PROFILE set, so each
+run writes its startup marks (see startup.py) and closes as soon as the
+username prompt is on screen, then reports the median of every phase.
+
+    python benchmarks/bench_startup.py [runs] [budget_ms]
+
+With a budget, the exit status is 1 when the median time to the first frame
+exceeds it, so the benchmark can guard against startup regressions. Needs
+a display (use xvfb-run on a headless machine) and the game's dependencies.
+"""
+import os
+import sys
+import json
+import time
+import tempfile
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from startup import PROFILE_ENV  # noqa: E402
+
+
+def run_once(profile_path):
+    env = dict(os.environ, **{PROFILE_ENV: profile_path})
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, "main.py"], cwd=ROOT, env=env,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, timeout=60)
+    wall = (time.perf_counter() - start) * 1000
+    if result.returncode != 0 or not os.path.exists(profile_path):
+        raise RuntimeError(f"main.py exited with {result.returncode}: {result.stderr.strip()[-500:]}")
+    with open(profile_path, 'r', encoding='utf-8') as f:
+        marks = json.load(f)
+    os.remove(profile_path)
+    return marks, wall
+
+
+def median(values):
+    values = sorted(values)
+    return values[len(values) // 2]
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    budget_ms = float(sys.argv[2]) if len(sys.argv) > 2 else None
+
+    samples = []
+    walls = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        profile_path = os.path.join(tmp_dir, "startup.json")
+        for _ in range(runs):
+            try:
+                marks, wall = run_once(profile_path)
+            except RuntimeError as e:
+                print(e)
+                return 1
+            samples.append(marks)
+            walls.append(wall)
+
+    print(f"{runs} launches, median ms since main.py started")
+    previous = 0.0
+    for phase in samples[0]:
+        at = median([marks[phase] for marks in samples if phase in marks])
+        print(f"  {phase:<12} {at:8.1f}  (+{at - previous:.1f})")
+        previous = at
+    print(f"  {'process':<12} {median(walls):8.1f}  (spawn to exit, interpreter start included)")
+
+    first_frame = median([marks['first_frame'] for marks in samples])
+    if budget_ms is not None and first_frame > budget_ms:
+        print(f"First frame after {first_frame:.1f} ms, over the {budget_ms:.0f} ms budget")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
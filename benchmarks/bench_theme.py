@@ -0,0 +1,125 @@
+"""
+Theme switch benchmark
+----------------------
+Builds a window with as many themed widgets as the game screen (times a
+multiplier) and measures how long a theme switch takes, up to the redraw:
+
+  lookup    colors looked up and every widget configured one by one
+            (how the view restyled itself before the theme engine)
+  engine    ThemeEngine.apply with the precompiled style tables
+
+    python benchmarks/bench_theme.py [multiplier] [switches]
+
+Needs a display (use xvfb-run on a headless machine).
+"""
+import os
+import sys
+import time
+import tkinter as tk
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import DEFAULT_SETTINGS  # noqa: E402
+from themes import ThemeEngine  # noqa: E402
+
+# Widget mix of the game screen: role -> (widget class, count)
+SCREEN = {
+    'background': (tk.Frame, 17),
+    'header': (tk.Frame, 3),
+    'label': (tk.Label, 7),
+    'result': (tk.Label, 1),
+    'entry': (tk.Entry, 1),
+    'start_button': (tk.Button, 2),
+    'joker_button': (tk.Button, 2),
+    'guess_button': (tk.Button, 1),
+    'danger_button': (tk.Button, 1),
+    'leaderboard_text': (tk.Text, 2),
+}
+
+
+def build(root, engine, multiplier):
+    widgets = {}
+    for role, (widget_class, count) in SCREEN.items():
+        for _ in range(count * multiplier):
+            widget = widget_class(root)
+            widget.pack()
+            widgets.setdefault(role, []).append(widget)
+            engine.register(widget, role)
+    return widgets
+
+
+def switch_by_lookup(widgets, settings, theme):
+    """The per-widget approach: look the colors up and configure each widget"""
+    colors = settings.get('theme_colors', {}).get(theme, {})
+    bg_color = colors.get('background', '#f0f0f0')
+    primary_color = colors.get('primary', '#4a7abc')
+    accent_color = colors.get('accent', '#FF5722')
+    secondary_color = colors.get('secondary', '#2196F3')
+    text_color = colors.get('text', '#333333')
+    button_text_color = colors.get('button_text', 'white')
+    for widget in widgets['background']:
+        if widget:
+            widget.configure(bg=bg_color)
+    for widget in widgets['header']:
+        widget.configure(bg=primary_color)
+    for widget in widgets['label']:
+        widget.configure(bg=bg_color, fg=text_color)
+    for widget in widgets['result']:
+        widget.configure(bg=bg_color)
+    for widget in widgets['entry']:
+        widget.configure(fg=text_color)
+    for role, bg, active in (('start_button', primary_color, accent_color),
+                             ('joker_button', secondary_color, accent_color),
+                             ('guess_button', accent_color, secondary_color),
+                             ('danger_button', colors.get('danger_button_bg', '#FFA07A'),
+                              colors.get('danger_button_active_bg', '#FA8072'))):
+        for widget in widgets[role]:
+            widget.configure(bg=bg, fg=button_text_color, activebackground=active, activeforeground=button_text_color)
+    for widget in widgets['leaderboard_text']:
+        widget.configure(bg=colors.get('secondary_background', bg_color), fg=text_color)
+        widget.tag_configure("bold_title", foreground=primary_color)
+        widget.tag_configure("score_entry", foreground=text_color)
+        widget.tag_configure("no_score_message", foreground=colors.get('secondary_text', text_color))
+
+
+def measure(root, switch, themes, switches):
+    timings = []
+    for i in range(switches):
+        theme = themes[i % len(themes)]
+        start = time.perf_counter()
+        switch(theme)
+        root.update_idletasks()  # Include the redraw
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+    return timings[len(timings) // 2], timings[int(len(timings) * 0.95)]
+
+
+def main():
+    multiplier = int(sys.argv[1]) if len(sys.argv) > 1 else 1
+    switches = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        print(f"No display available: {e}")
+        return 1
+
+    settings = DEFAULT_SETTINGS
+    themes = list(settings['theme_colors'])
+    engine = ThemeEngine(settings['theme_colors'])
+    widgets = build(root, engine, multiplier)
+    count = sum(len(w) for w in widgets.values())
+
+    results = {
+        'lookup': measure(root, lambda theme: switch_by_lookup(widgets, settings, theme), themes, switches),
+        'engine': measure(root, engine.apply, themes, switches),
+    }
+    root.destroy()
+
+    print(f"{count} widgets, {switches} theme switches")
+    for name, (median, p95) in results.items():
+        print(f"  {name:<8} median {median * 1000:.2f} ms   p95 {p95 * 1000:.2f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
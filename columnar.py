@@ -0,0 +1,273 @@
+"""
+Columnar leaderboard snapshots for read-only displays
+-----------------------------------------------------
+Each game mode is exported to "<dir>/leaderboard_<mode>.col":
+
+    header   magic b'KOLB', version (u16), reserved (u16), count (u32)
+    scores   count x int32, best first (ties ordered by username)
+    offsets  (count + 1) x uint32, start of each username in the blob
+    names    UTF-8 usernames, back to back
+
+All numbers are little-endian. Readers memory-map the file, so ranks are a
+binary search over the score column and the top N needs no parsing. A new
+export replaces the file; readers notice and map the new one on their next
+query. Windows cannot replace a file while it is mapped, so readers there
+only map it for the duration of a query and the writer retries for a moment
+when it collides with one.
+
+    python columnar.py export [dir]          Export every mode from leaderboard.db
+    python columnar.py show MODE [n] [dir]   Print the top n of a snapshot
+"""
+import os
+import sys
+import mmap
+import array
+import time
+import struct
+import sqlite3
+import threading
+
+from highscores import HIGHSCORE_FILE, add_highscore_listener, remove_highscore_listener
+from leaderboard import LEADERBOARD_DB_FILE
+from applog import get_logger
+
+log = get_logger(__name__)
+
+LEADERBOARD_SNAPSHOT_DIR = "leaderboard_snapshots"
+MAGIC = b'KOLB'
+VERSION = 1
+HEADER = struct.Struct('<4sHHI')
+EXPORT_DELAY = 2.0  # Seconds to wait for more score changes before exporting
+REPLACE_RETRIES = 20  # Attempts to replace a snapshot still mapped by a reader (Windows)
+REPLACE_RETRY_DELAY = 0.05
+KEEP_MAPPED = os.name != 'nt'  # Keep snapshots mapped between queries
+
+
+def get_snapshot_path(directory, mode):
+    return os.path.join(directory, f"leaderboard_{mode}.col")
+
+
+def _little_endian(values, typecode):
+    column = array.array(typecode, values)
+    if sys.byteorder != 'little':
+        column.byteswap()
+    return column.tobytes()
+
+
+def write_snapshot(path, entries):
+    """Write (score, username) entries, already sorted best first, as a columnar snapshot"""
+    names = [username.encode('utf-8') for _, username in entries]
+    offsets = [0]
+    for name in names:
+        offsets.append(offsets[-1] + len(name))
+
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, 0, len(entries)))
+        f.write(_little_endian((score for score, _ in entries), 'i'))
+        f.write(_little_endian(offsets, 'I'))
+        f.write(b''.join(names))
+    for attempt in range(REPLACE_RETRIES):
+        try:
+            os.replace(tmp_path, path)
+            return
+        except PermissionError:
+            if attempt == REPLACE_RETRIES - 1:
+                os.remove(tmp_path)
+                raise
+            time.sleep(REPLACE_RETRY_DELAY)
+
+
+def export_snapshots(db_path=LEADERBOARD_DB_FILE, directory=LEADERBOARD_SNAPSHOT_DIR):
+    """Export every mode of the SQLite leaderboard, returns the written paths"""
+    os.makedirs(directory, exist_ok=True)
+    conn = sqlite3.connect(db_path)
+    try:
+        modes = [row[0] for row in conn.execute("SELECT DISTINCT mode FROM scores")]
+        paths = []
+        for mode in modes:
+            entries = conn.execute(
+                "SELECT score, username FROM scores WHERE mode = ? ORDER BY score DESC, username ASC",
+                (mode,)
+            ).fetchall()
+            path = get_snapshot_path(directory, mode)
+            write_snapshot(path, entries)
+            paths.append(path)
+        return paths
+    finally:
+        conn.close()
+
+
+class SnapshotExporter:
+    """Exports the snapshots in the background at startup, then a little after scores change"""
+
+    def __init__(self, db_path=LEADERBOARD_DB_FILE, directory=LEADERBOARD_SNAPSHOT_DIR,
+                 highscore_file=HIGHSCORE_FILE, delay=EXPORT_DELAY):
+        self.db_path = db_path
+        self.directory = directory
+        self.highscore_file = highscore_file
+        self.delay = delay
+        self._timer = None
+        self._lock = threading.Lock()
+        add_highscore_listener(self._on_highscore_saved)
+        self._schedule(0)  # Displays get the scores imported or changed while no game was running
+
+    def _on_highscore_saved(self, filepath, username, game_mode, score, source='game'):
+        if os.path.abspath(filepath) == os.path.abspath(self.highscore_file):
+            self._schedule(self.delay)
+
+    def _schedule(self, delay):
+        with self._lock:
+            if self._timer:
+                self._timer.cancel()  # Coalesce bursts (e.g. a sync merge) into one export
+            self._timer = threading.Timer(delay, self._export)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _export(self):
+        try:
+            export_snapshots(self.db_path, self.directory)
+        except (OSError, sqlite3.Error) as e:
+            log.error("Error exporting leaderboard snapshots: %s", e)
+
+    def close(self):
+        remove_highscore_listener(self._on_highscore_saved)
+        with self._lock:
+            if self._timer:
+                self._timer.cancel()
+
+
+class ColumnarLeaderboard:
+    """Read-only, memory-mapped view of one mode's snapshot, following new exports"""
+
+    def __init__(self, path, keep_mapped=KEEP_MAPPED):
+        self.path = path
+        self.keep_mapped = keep_mapped
+        self._map = None
+        self._stamp = None
+        self._open()
+        self._done()
+
+    def _open(self):
+        with open(self.path, 'rb') as f:
+            st = os.fstat(f.fileno())
+            # The map stays valid on its own; the file handle is not kept open
+            new_map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, _, count = HEADER.unpack_from(new_map, 0)
+        if magic != MAGIC or version != VERSION:
+            new_map.close()
+            raise ValueError(f"{self.path} is not a leaderboard snapshot")
+        self._release()
+        self._map = new_map
+        self._stamp = (st.st_ino, st.st_mtime_ns, st.st_size)
+        self.count = count
+        scores_start = HEADER.size
+        offsets_start = scores_start + 4 * self.count
+        self._names_start = offsets_start + 4 * (self.count + 1)
+        if sys.byteorder == 'little':
+            self._view = memoryview(self._map)
+            self._scores = self._view[scores_start:offsets_start].cast('i')
+            self._offsets = self._view[offsets_start:self._names_start].cast('I')
+        else:
+            self._view = None
+            self._scores = array.array('i', self._map[scores_start:offsets_start])
+            self._scores.byteswap()
+            self._offsets = array.array('I', self._map[offsets_start:self._names_start])
+            self._offsets.byteswap()
+
+    def refresh(self):
+        """Map the snapshot again if it was re-exported since it was mapped, returns True if so"""
+        if self._map is None:
+            self._open()
+            return True
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return False  # Being replaced right now, keep the current map
+        if (st.st_ino, st.st_mtime_ns, st.st_size) == self._stamp:
+            return False
+        self._open()
+        return True
+
+    def _done(self):
+        """End of a query: unmap the snapshot unless it is kept mapped"""
+        if not self.keep_mapped:
+            self._release()
+
+    def __len__(self):
+        return self.count
+
+    def score_at(self, index):
+        if self._map is None:
+            self._open()
+        score = self._scores[index]
+        self._done()
+        return score
+
+    def username_at(self, index):
+        if self._map is None:
+            self._open()
+        username = self._username_at(index)
+        self._done()
+        return username
+
+    def _username_at(self, index):
+        start = self._names_start + self._offsets[index]
+        end = self._names_start + self._offsets[index + 1]
+        return self._map[start:end].decode('utf-8')
+
+    def top(self, n=10):
+        """Return the best n entries as (score, username)"""
+        self.refresh()
+        entries = [(self._scores[i], self._username_at(i)) for i in range(min(n, self.count))]
+        self._done()
+        return entries
+
+    def rank_of_score(self, score):
+        """1-based rank a score would get: one plus the number of strictly higher scores"""
+        self.refresh()
+        lo, hi = 0, self.count
+        while lo < hi:  # Scores are sorted descending
+            mid = (lo + hi) // 2
+            if self._scores[mid] > score:
+                lo = mid + 1
+            else:
+                hi = mid
+        self._done()
+        return lo + 1
+
+    def _release(self):
+        if self._map is None:
+            return
+        if self._view is not None:
+            # The map can only be closed once no memoryview points into it
+            self._scores.release()
+            self._offsets.release()
+            self._view.release()
+        self._map.close()
+        self._map = None
+
+    def close(self):
+        self._release()
+
+
+def main():
+    if len(sys.argv) < 2 or sys.argv[1] not in ('export', 'show'):
+        print(__doc__)
+        return
+    if sys.argv[1] == 'export':
+        directory = sys.argv[2] if len(sys.argv) > 2 else LEADERBOARD_SNAPSHOT_DIR
+        for path in export_snapshots(directory=directory):
+            print(f"[Snapshot] Wrote {path}")
+    else:
+        mode = sys.argv[2]
+        n = int(sys.argv[3]) if len(sys.argv) > 3 else 10
+        directory = sys.argv[4] if len(sys.argv) > 4 else LEADERBOARD_SNAPSHOT_DIR
+        board = ColumnarLeaderboard(get_snapshot_path(directory, mode))
+        for i, (score, username) in enumerate(board.top(n)):
+            print(f"{i+1}. {username}: {score}")
+        board.close()
+
+
+if __name__ == "__main__":
+    main()
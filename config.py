@@ -1,10 +1,30 @@
 import os
 import json
 from pathlib import Path
+from types import MappingProxyType
+from collections.abc import Mapping
+
+from applog import get_logger
+
+log = get_logger(__name__)
 
 DEFAULT_SETTINGS = {
     'language': 'tr',  # 'tr' for Turkish, 'en' for English
     'theme': 'blue',   # 'blue', 'dark', 'light', 'green'
+    'word_board': 'labels',  # 'labels' (pooled Label boxes) or 'canvas' (one animated canvas)
+    'music': {         # Looping background music, needs pygame (see audio.py); off unless enabled
+        'enabled': False,
+        'file': 'background_music.mp3',
+        'volume': 0.4,
+        'duck_volume': 0.15      # Music volume while a sound effect plays
+    },
+    'sync': {          # Leaderboard sync between kiosks (see sync.py), disabled by default
+        'directory': None,       # Shared folder for delta files
+        'peers': [],             # 'host:port' of kiosks to pull deltas from
+        'port': None,            # Port to serve deltas on
+        'host': '127.0.0.1',     # Address to serve on; the socket is unauthenticated, set '0.0.0.0' to let other kiosks in
+        'interval_seconds': 30
+    },
     'theme_colors': {
         'blue': {
             'primary': '#654321',
@@ -38,207 +58,178 @@ DEFAULT_SETTINGS = {
             'text': '#000000',
             'button_text': 'white'
         }
-    },
-    'translations': {
-        'tr': {
-            'app_title': 'Kelime Avı',
-            'start_button': 'OYUNU BAŞLAT',
-            'restart_button': 'YENİDEN BAŞLAT',
-            'word_label': 'Kelime',
-            'remaining_time': 'Kalan Süre',
-            'score': 'Puan',
-            'word_length': 'Kelime Uzunluğu',
-            'description': 'Açıklama',
-            'hint_button': 'Harf Al',
-            'detail_button': 'Detay Aç',
-            'guess_label': 'Tahmininiz',
-            'guess_button': 'Tahmin Et',
-            'correct_guess': 'TEBRİKLER! Doğru Tahmin',
-            'wrong_guess': 'Yanlış tahmin! Tekrar deneyin.',
-            'time_up': 'ZAMAN DOLDU!',
-            'all_words_completed': 'TÜM KELİMELER TAMAMLANDI!',
-            'game_over': 'OYUN SONU - TOPLAM PUAN',
-            'settings': 'Ayarlar',
-            'language': 'Dil',
-            'theme': 'Tema',
-            'save': 'Kaydet',
-            'cancel': 'İptal',
-            'turkish': 'Türkçe',
-            'english': 'İngilizce',
-            'blue_theme': 'Mavi',
-            'dark_theme': 'Koyu',
-            'light_theme': 'Açık',
-            'green_theme': 'Yeşil',
-            'preview': 'Önizleme',
-            'start_button_quiz': 'Klasik Mod Başlat',
-            'start_button_anagram': 'Anagram Mod Başlat',
-            'unscramble_label': 'Harfleri Diz',
-            'exit_label': 'Çıkış',
-            'settings_apply_note': 'Not: Değişiklikler kaydedildiğinde hemen uygulanacaktır.',
-            'settings_saved_success': 'Ayarlar kaydedildi ve uygulandı!',
-            'settings_saved_error': 'Ayarlar kaydedilemedi!',
-            'settings_applied_success': 'Ayarlarınız başarıyla uygulandı!',
-            'word_length_value': '{length} Harf',
-            'detail_prefix': '[Detay]',
-            'final_score_base': 'OYUN SONU - TOPLAM PUAN: {score}',
-            'score_praise_5': '★★★★★ MÜKEMMEL! Harika bir skor!',
-            'score_praise_4': '★★★★☆ ÇOK İYİ! Biraz daha çalışmalısın.',
-            'score_praise_3': '★★★☆☆ İYİ! Orta seviye skor.',
-            'score_praise_2': '★★☆☆☆ DAHA İYİSİNİ YAPABİLİRSİN!',
-            'sound_fix_hint': "[İpucu] Ses dosyalarını WAV formatına dönüştürmeyi veya özel karakter içermeyen dosya adları kullanmayı deneyin.",
-            'username_prompt_title': 'Kullanıcı Adı',
-            'username_prompt_message': 'Lütfen kullanıcı adınızı girin:',
-            'leaderboard_button': 'Skor Tablosu',
-            'leaderboard_title': '🏆 SKOR TABLOSU 🏆',
-            'leaderboard_quiz_title': 'Klasik Mod Skorları',
-            'leaderboard_anagram_title': 'Anagram Mod Skorları',
-            'no_highscores_message': 'Henüz kaydedilmiş skor bulunmamaktadır.',
-            'no_scores_for_mode_message': 'Bu mod için skor yok.',
-            'quiz_mode_label': 'Klasik',
-            'anagram_mode_label': 'Anagram',
-            'ok_button': 'Tamam',
-            'cancel_button': 'İptal',
-            'username_error_title': 'Geçersiz Giriş',
-            'username_empty_error': 'Kullanıcı adı boş olamaz!'
-        },
-        'en': {
-            'app_title': 'Word Hunt',
-            'start_button': 'START GAME',
-            'restart_button': 'RESTART',
-            'word_label': 'Word',
-            'remaining_time': 'Time Left',
-            'score': 'Score',
-            'word_length': 'Word Length',
-            'description': 'Description',
-            'hint_button': 'Get Letter',
-            'detail_button': 'Show Detail',
-            'guess_label': 'Your Guess',
-            'guess_button': 'Guess',
-            'correct_guess': 'CONGRATULATIONS! Correct Guess',
-            'wrong_guess': 'Wrong guess! Try again.',
-            'time_up': 'TIME\'S UP!',
-            'all_words_completed': 'ALL WORDS COMPLETED!',
-            'game_over': 'GAME OVER - TOTAL SCORE',
-            'settings': 'Settings',
-            'language': 'Language',
-            'theme': 'Theme',
-            'save': 'Save',
-            'cancel': 'Cancel',
-            'turkish': 'Turkish',
-            'english': 'English',
-            'blue_theme': 'Blue',
-            'dark_theme': 'Dark',
-            'light_theme': 'Light',
-            'green_theme': 'Green',
-            'preview': 'Preview',
-            'start_button_quiz': 'Start Quiz Mode',
-            'start_button_anagram': 'Start Anagram Mode',
-            'unscramble_label': 'Unscramble',
-            'exit_label': 'Exit',
-            'settings_apply_note': 'Note: Changes will be applied immediately upon saving.',
-            'settings_saved_success': 'Settings saved and applied!',
-            'settings_saved_error': 'Could not save settings!',
-            'settings_applied_success': 'Your settings have been applied successfully!',
-            'word_length_value': '{length} Letters',
-            'detail_prefix': '[Detail]',
-            'final_score_base': 'GAME OVER - TOTAL SCORE: {score}',
-            'score_praise_5': '★★★★★ EXCELLENT! Great score!',
-            'score_praise_4': '★★★★☆ VERY GOOD! Keep practicing.',
-            'score_praise_3': '★★★☆☆ GOOD! Average score.',
-            'score_praise_2': '★★☆☆☆ YOU CAN DO BETTER!',
-            'sound_fix_hint': "[Hint] Try converting sound files to WAV format or using filenames without special characters.",
-            'username_prompt_title': 'Username',
-            'username_prompt_message': 'Please enter your username:',
-            'leaderboard_button': 'Leaderboard',
-            'leaderboard_title': '🏆 LEADERBOARD 🏆',
-            'leaderboard_quiz_title': 'Quiz Mode Scores',
-            'leaderboard_anagram_title': 'Anagram Mode Scores',
-            'no_highscores_message': 'No high scores recorded yet.',
-            'no_scores_for_mode_message': 'No scores for this mode.',
-            'quiz_mode_label': 'Quiz',
-            'anagram_mode_label': 'Anagram',
-            'ok_button': 'OK',
-            'cancel_button': 'Cancel',
-            'username_error_title': 'Invalid Input',
-            'username_empty_error': 'Username cannot be empty!'
-        }
     }
+    # Texts live in locales/<language>.json, see localization.py
 }
 
+_app_dir = None
+_settings_service = None
+
+def get_app_dir():
+    """Get the per-user data directory (~/.kelime_oyunu), creating it on first use"""
+    global _app_dir
+    if _app_dir is None:
+        app_dir = Path(os.path.expanduser("~")) / ".kelime_oyunu"
+        os.makedirs(str(app_dir), exist_ok=True)
+        _app_dir = app_dir
+    return _app_dir
+
 def get_settings_file_path():
     """Get the path to the settings file"""
-    # Use Path to handle cross-platform path creation
-    app_dir = Path(os.path.expanduser("~")) / ".kelime_oyunu"
-    
-    # Create directory if it doesn't exist
-    try:
-        os.makedirs(str(app_dir), exist_ok=True)
-        print(f"[Settings] Directory created/verified: {app_dir}")
-    except Exception as e:
-        print(f"[Settings] Error creating directory: {e}")
-    
-    settings_path = app_dir / "settings.json"
-    print(f"[Settings] Path: {settings_path}") # Debug
-    return settings_path
+    return get_app_dir() / "settings.json"
 
-def load_settings():
-    """Load settings from file or return defaults"""
-    settings_file = get_settings_file_path()
-    print(f"[Settings] Attempting to load from: {settings_file}") # Debug
-    
-    if settings_file.exists():
+def deep_merge(base, override):
+    """Return a new dict with `override` merged into `base` key by key; neither input is modified"""
+    merged = dict(base)
+    for key, value in override.items():
+        if isinstance(value, Mapping) and isinstance(merged.get(key), Mapping):
+            merged[key] = deep_merge(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+def freeze(value):
+    """Read-only copy of a settings value: dicts become mapping proxies, lists tuples"""
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+def thaw(value):
+    """Plain, JSON-serializable copy of a frozen settings value"""
+    if isinstance(value, Mapping):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [thaw(item) for item in value]
+    return value
+
+class SettingsService:
+    """
+    Parsed settings, cached as one immutable structure
+
+    settings.json only holds the user's overrides; they are deep-merged over
+    DEFAULT_SETTINGS once and the result is reused until the file changes.
+    watch() polls the file's mtime from the Tk loop, and subscribers are
+    called with (settings, changed_keys) where changed_keys holds the
+    top-level keys whose value differs.
+    """
+
+    def __init__(self, path=None):
+        self.path = Path(path) if path else get_settings_file_path()
+        self._settings = None
+        self._stamp = None
+        self._subscribers = []
+
+    def _file_stamp(self):
         try:
-            with open(str(settings_file), 'r', encoding='utf-8') as f:
+            st = os.stat(str(self.path))
+            return st.st_mtime_ns, st.st_size
+        except FileNotFoundError:
+            return None
+
+    def _read_user_settings(self):
+        try:
+            with open(str(self.path), 'r', encoding='utf-8') as f:
                 user_settings = json.load(f)
-                # print(f"[Settings] Loaded settings from file: {user_settings}") # Debug
-                
-            # Merge with default settings in case of missing keys
-            merged_settings = DEFAULT_SETTINGS.copy()
-            # Deep merge dictionaries (theme_colors, translations)
-            for key, value in user_settings.items():
-                if isinstance(value, dict) and key in merged_settings and isinstance(merged_settings[key], dict):
-                     merged_settings[key].update(value)
-                else:
-                     merged_settings[key] = value
-
-            # Ensure all essential keys exist after merge
-            if 'theme_colors' not in merged_settings:
-                 merged_settings['theme_colors'] = DEFAULT_SETTINGS['theme_colors']
-            if 'translations' not in merged_settings:
-                 merged_settings['translations'] = DEFAULT_SETTINGS['translations']
-
-            # print(f"[Settings] Merged settings: {merged_settings}") # Debug
-            return merged_settings
-        except Exception as e:
-            print(f"[Settings] Error loading settings: {e}. Using defaults.") # Debug
-            import traceback
-            print(f"[Settings] Error details: {traceback.format_exc()}")
-    else:
-        print("[Settings] Settings file not found. Using defaults.") # Debug
-    
-    return DEFAULT_SETTINGS.copy()
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            log.error("Error loading settings: %s. Using defaults.", e)
+            return {}
+        if not isinstance(user_settings, dict):
+            log.error("settings.json does not hold an object. Using defaults.")
+            return {}
+        return user_settings
+
+    def _build(self, user_settings):
+        return freeze(deep_merge(DEFAULT_SETTINGS, user_settings))
+
+    def get(self):
+        """Return the current settings (read-only mapping)"""
+        if self._settings is None:
+            self._stamp = self._file_stamp()
+            self._settings = self._build(self._read_user_settings())
+        return self._settings
+
+    def subscribe(self, callback):
+        """Register callback(settings, changed_keys), called when the settings change"""
+        self._subscribers.append(callback)
+
+    def unsubscribe(self, callback):
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+
+    def _replace(self, settings):
+        old = self.get()
+        changed = frozenset(key for key in set(old) | set(settings) if old.get(key) != settings.get(key))
+        self._settings = settings
+        if changed:
+            for callback in list(self._subscribers):
+                try:
+                    callback(settings, changed)
+                except Exception as e:
+                    log.exception("Subscriber error: %s", e)
+        return changed
+
+    def reload_if_changed(self):
+        """Re-read settings.json if it changed on disk, returns the changed top-level keys"""
+        self.get()
+        stamp = self._file_stamp()
+        if stamp == self._stamp:
+            return frozenset()
+        self._stamp = stamp
+        changed = self._replace(self._build(self._read_user_settings()))
+        if changed:
+            log.info("Reloaded %s from %s", ", ".join(sorted(changed)), self.path)
+        return changed
+
+    def watch(self, root, interval_ms=1000):
+        """Check settings.json for outside edits every `interval_ms` from the Tk event loop"""
+        def tick():
+            self.reload_if_changed()
+            root.after(interval_ms, tick)
+        root.after(interval_ms, tick)
+
+    def save(self, settings):
+        """
+        Store settings, returns True on success
+
+        `settings` may be complete or only hold the keys to change. Values
+        equal to the defaults are dropped from the file, every other key
+        already in it (e.g. 'sync') is kept.
+        """
+        user_settings = self._read_user_settings()
+        for key, value in settings.items():
+            value = thaw(value)
+            if value == DEFAULT_SETTINGS.get(key):
+                user_settings.pop(key, None)
+            else:
+                user_settings[key] = value
+        try:
+            tmp_path = str(self.path) + ".tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(user_settings, f, ensure_ascii=False, indent=4)
+            os.replace(tmp_path, str(self.path))
+        except OSError as e:
+            log.error("Error saving settings: %s", e)
+            return False
+        self.get()
+        self._stamp = self._file_stamp()  # Our own write, nothing for the watcher to reload
+        self._replace(self._build(user_settings))
+        return True
+
+def get_settings_service():
+    """Get the shared settings service"""
+    global _settings_service
+    if _settings_service is None:
+        _settings_service = SettingsService()
+    return _settings_service
+
+def load_settings():
+    """Load settings (cached, read-only) merged over the defaults"""
+    return get_settings_service().get()
 
 def save_settings(settings):
     """Save settings to file"""
-    settings_file = get_settings_file_path()
-    print(f"[Settings] Attempting to save to: {settings_file}") # Debug
-    print(f"[Settings] Settings to save: {settings}") # Debug
-    
-    try:
-        # Only save language and theme preference, not entire structure
-        settings_to_save = {
-            'language': settings.get('language', DEFAULT_SETTINGS['language']),
-            'theme': settings.get('theme', DEFAULT_SETTINGS['theme'])
-        }
-        
-        # Convert to string path to avoid any potential issues
-        with open(str(settings_file), 'w', encoding='utf-8') as f:
-            json.dump(settings_to_save, f, ensure_ascii=False, indent=4)
-        print("[Settings] Settings saved successfully.") # Debug
-        return True
-    except Exception as e:
-        print(f"[Settings] Error saving settings: {e}") # Debug
-        # Try to get more detailed error information
-        import traceback
-        print(f"[Settings] Error details: {traceback.format_exc()}")
-        return False 
\ No newline at end of file
+    return get_settings_service().save(settings)
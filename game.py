@@ -1,48 +1,28 @@
 import tkinter as tk
-from tkinter import ttk, font, messagebox, simpledialog
+from tkinter import font
 import time
 import os
 import random
-from PIL import Image, ImageTk
-from playsound import playsound
-import json
+from collections import deque
 
 # Moved from config/settings.py - requires config.py
 from config import save_settings
+from localization import get_text, set_language
+from applog import get_logger
+import startup
 
-# WordRepository will be imported where needed (in main.py)
+from highscores import HIGHSCORE_FILE, save_highscore
+from word_board import LetterBoxRow, CanvasWordBoard
+from themes import ThemeEngine
+from render import RenderScheduler
+# The stores, audio, latency tracing and the leaderboard browser are
+# imported where they are first used, after the first frame
 
-HIGHSCORE_FILE = "highscores.json"
-
-def load_highscores(filepath=HIGHSCORE_FILE):
-    """Load high scores from a JSON file."""
-    try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
-        return {}  # Return empty dict if file not found or corrupt
-
-def save_highscore(filepath, username, score, game_mode):
-    """Save or update a high score for a user and game mode."""
-    if not username or not username.strip(): # Don't save if username is empty or just whitespace
-        print("[Highscore] Username is empty, score not saved.")
-        return
-
-    scores = load_highscores(filepath)
-    user_scores = scores.get(username, {})  # Get existing scores for user or empty dict
-
-    # Check if new score is higher for the specific game mode
-    if score > user_scores.get(game_mode, -1):  # -1 ensures any score is higher if mode not played
-        user_scores[game_mode] = score
-        scores[username] = user_scores
-        try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(scores, f, ensure_ascii=False, indent=4)
-            print(f"[Highscore] Score for {username} ({game_mode}) saved: {score}")
-        except Exception as e:
-            print(f"[Highscore] Error saving high score: {e}")
-    else:
-        print(f"[Highscore] New score {score} for {username} ({game_mode}) not higher. Not saved.")
+log = get_logger(__name__)
+
+JOURNAL_TIME_EVERY = 5  # Seconds of play between journal entries when nothing else happens
+
+# WordRepository will be imported where needed (in main.py)
 
 #==============================================================================
 # Domain Models (Moved from app/domain/models.py)
@@ -52,11 +32,12 @@ class Word:
     """
     Represents a word in the game
     """
-    def __init__(self, word, description, details):
+    def __init__(self, word, description, details, scramble=None):
         self.word = word
         self.description = description
         self.details = details
         self.length = len(word)
+        self.scramble = scramble # Precomputed anagram scramble, if any
 
 class GameState:
     """
@@ -78,6 +59,44 @@ class GameState:
         self.revealed_indices = set()
         self.shuffled_letters = "" # For anagram mode
 
+    def to_snapshot(self, username=None):
+        """Returns a JSON-serializable snapshot of the game, used by the session journal"""
+        elapsed = time.time() - self.start_time if self.start_time else 0
+        return {
+            'username': username,
+            'game_mode': self.game_mode,
+            'time_limit': self.time_limit,
+            'words': [[w.word, w.description, w.details, w.scramble] for w in self.flat_words],
+            'current_word_index': self.current_word_index,
+            'score': self.score,
+            'hint_count': self.hint_count,
+            'detail_hint_count': self.detail_hint_count,
+            'current_word_score': self.current_word_score,
+            'revealed_indices': sorted(self.revealed_indices),
+            'shuffled_letters': self.shuffled_letters,
+            'elapsed': round(elapsed, 2)
+        }
+
+    @classmethod
+    def from_snapshot(cls, snapshot):
+        """Rebuilds a running game from a session journal snapshot"""
+        flat_words = [Word(*entry) for entry in snapshot['words']]  # Journals without the scramble have 3 fields
+        state = cls({}, game_mode=snapshot['game_mode'], time_limit=snapshot['time_limit'])
+        state.words = {'resumed': flat_words}
+        state.flat_words = flat_words  # Keep the journaled order, do not reshuffle
+        state.current_word_index = snapshot['current_word_index']
+        state.score = snapshot['score']
+        state.hint_count = snapshot['hint_count']
+        state.detail_hint_count = snapshot['detail_hint_count']
+        state.current_word_score = snapshot['current_word_score']
+        state.revealed_indices = set(snapshot['revealed_indices'])
+        state.shuffled_letters = snapshot['shuffled_letters']
+        # Time spent while the app was down is not charged to the player
+        state.start_time = time.time() - snapshot['elapsed']
+        state.remaining_time = max(0, state.time_limit - int(snapshot['elapsed']))
+        state.is_running = True
+        return state
+
     def _flatten_words(self, words_by_difficulty):
         """Flattens the dictionary of words into a single list"""
         result = []
@@ -103,8 +122,11 @@ class GameState:
         if self.game_mode == 'anagram':
             # Return shuffled letters for anagram mode
             if not self.shuffled_letters: # Shuffle only once per word
-                word_list = list(self.current_word.word)
-                random.shuffle(word_list)
+                if self.current_word.scramble:
+                    word_list = list(self.current_word.scramble)
+                else:
+                    word_list = list(self.current_word.word)
+                    random.shuffle(word_list)
                 self.shuffled_letters = ' '.join(word_list).upper()
             return self.shuffled_letters
         else: # Quiz mode
@@ -117,8 +139,8 @@ class GameState:
                     display_list.append('_')
             return ' '.join(display_list)
 
-    def reveal_character(self):
-        """Reveals a random character at a specific position (Quiz mode only)"""
+    def reveal_character(self, hint_engine=None):
+        """Reveals a character at a specific position (Quiz mode only)"""
         if self.game_mode != 'quiz' or not self.current_word:
             return None
 
@@ -129,8 +151,11 @@ class GameState:
         if not hidden_indices:
             return None 
 
-        
-        index_to_reveal = random.choice(hidden_indices)
+        if hint_engine:
+            # Reveal the letter that narrows down the answer the most
+            index_to_reveal = hint_engine.choose_position(self.current_word.word, self.revealed_indices)
+        else:
+            index_to_reveal = random.choice(hidden_indices)
         
         self.revealed_indices.add(index_to_reveal)
         self.current_word_score -= 20 
@@ -169,18 +194,28 @@ class GameState:
 class GameService:
     """Service for game logic"""
     
-    def __init__(self, word_repository):
+    def __init__(self, word_repository, journal=None, puzzle_table=None, hint_engine=None):
         self.repository = word_repository
+        self.journal = journal  # Optional SessionJournal for crash recovery
+        self.puzzle_table = puzzle_table  # Optional PuzzleTable for anagram mode
+        self.hint_engine = hint_engine  # Optional HintEngine for character hints
+        self.username = None
         self.game_state = None
+        self._journaled_at = 0  # time.time() of the last journal entry
     
-    def start_game(self, game_mode='quiz'):
+    def start_game(self, game_mode='quiz', username=None):
         """Start a new game in the specified mode"""
-        print(f"[Service] Starting game in {game_mode} mode") 
+        log.info("Starting game in %s mode", game_mode)
         
-        words = self.repository.get_words_by_difficulty(
-            count_by_difficulty={'kolay': 3, 'orta': 4, 'zor': 3}, 
-            WordClass=Word 
-        )
+        count_by_difficulty = {'kolay': 3, 'orta': 4, 'zor': 3}
+        if game_mode == 'anagram' and self.puzzle_table and self.puzzle_table.is_available():
+            # Only uniquely solvable words, with their precomputed scramble
+            words = self.puzzle_table.draw(count_by_difficulty, WordClass=Word)
+        else:
+            words = self.repository.get_words_by_difficulty(
+                count_by_difficulty=count_by_difficulty, 
+                WordClass=Word 
+            )
         
         # Create new game state with the specified mode
         self.game_state = GameState(words, game_mode=game_mode)
@@ -188,10 +223,51 @@ class GameService:
         # Initialize game
         self.game_state.start_time = time.time()
         self.game_state.is_running = True
+        self.username = username
+        self._record_session()
         
-        print(f"[Service] Game state created: Mode={self.game_state.game_mode}, Word count={len(self.game_state.flat_words)}") # Debug
+        log.debug("Game state created: mode=%s, words=%d", self.game_state.game_mode, len(self.game_state.flat_words))
         return self.game_state
     
+    def resume_game(self):
+        """Resume a game interrupted by a crash, returns the game state or None"""
+        if not self.journal:
+            return None
+            
+        snapshot = self.journal.load()
+        if not snapshot:
+            return None
+            
+        try:
+            state = GameState.from_snapshot(snapshot)
+        except (KeyError, TypeError, ValueError) as e:
+            log.warning("Session journal is unusable, discarding: %s", e)
+            self.journal.clear()
+            return None
+            
+        if state.remaining_time <= 0 or not state.current_word:
+            self.journal.clear()
+            return None
+            
+        self.game_state = state
+        self.username = snapshot.get('username')
+        self._record_session()  # Compact the replayed journal into a fresh snapshot
+        log.info("Resumed game: mode=%s, word=%d/%d", state.game_mode, state.current_word_index + 1, len(state.flat_words))
+        return state
+    
+    def end_game(self):
+        """Stop the current game and discard its session journal"""
+        if self.game_state:
+            self.game_state.is_running = False
+        if self.journal:
+            self.journal.clear()
+    
+    def _record_session(self):
+        """Write the current game state to the session journal"""
+        if self.journal and self.game_state and self.game_state.is_running:
+            self.journal.record(self.game_state.to_snapshot(self.username))
+            self._journaled_at = time.time()
+    
     def update_time(self):
         """Update the remaining time"""
         if not self.game_state or not self.game_state.is_running:
@@ -203,6 +279,8 @@ class GameService:
         # Check if time is up
         if self.game_state.remaining_time <= 0:
             self.game_state.is_running = False    
+        elif time.time() - self._journaled_at >= JOURNAL_TIME_EVERY:
+            self._record_session()  # A crash while thinking must not give the time back
         return self.game_state.remaining_time
     
     def make_guess(self, guess):
@@ -210,11 +288,12 @@ class GameService:
         if not self.game_state or not self.game_state.is_running:
             return False
             
-        if self.game_state.check_guess(guess):
+        correct = self.game_state.check_guess(guess)
+        if correct:
             # Add score
             self.game_state.score += self.game_state.current_word_score
-            return True
-        return False
+        self._record_session()
+        return correct
     
     def use_character_hint(self):
         """Use a character hint"""
@@ -225,14 +304,18 @@ class GameService:
             return None
             
         self.game_state.hint_count -= 1
-        return self.game_state.reveal_character()
+        char = self.game_state.reveal_character(self.hint_engine)
+        self._record_session()
+        return char
     
     def use_detail_hint(self):
         """Use a detailed hint"""
         if not self.game_state or not self.game_state.is_running:
             return None
             
-        return self.game_state.use_detail_hint()
+        details = self.game_state.use_detail_hint()
+        self._record_session()
+        return details
     
     def next_word(self):
         """Move to the next word"""
@@ -243,9 +326,10 @@ class GameService:
         
         # Check if game is finished
         if self.game_state.current_word_index >= len(self.game_state.flat_words):
-            self.game_state.is_running = False
+            self.end_game()
             return False
             
+        self._record_session()
         return True
     
     def get_final_score_message(self):
@@ -255,34 +339,17 @@ class GameService:
             
         score = self.game_state.score
         # Use translated base message
-        message = self._get_text('final_score_base').format(score=score)
+        message = get_text('final_score_base', score=score)
         
         # Use translated praise levels
         if score >= 800:
-            return message + "\n\n" + self._get_text('score_praise_5')
+            return message + "\n\n" + get_text('score_praise_5')
         elif score >= 600:
-            return message + "\n\n" + self._get_text('score_praise_4')
+            return message + "\n\n" + get_text('score_praise_4')
         elif score >= 400:
-            return message + "\n\n" + self._get_text('score_praise_3')
+            return message + "\n\n" + get_text('score_praise_3')
         else:
-            return message + "\n\n" + self._get_text('score_praise_2')
-    
-    # Helper method to get text (added for GameService scope)
-    def _get_text(self, key):
-        # Assuming settings are accessible or passed differently if needed
-        # For simplicity, let's assume direct access (might need refactoring)
-        # A better approach would be to pass settings or use a dedicated localization manager
-        try:
-            # Access settings through game_state or another mechanism if available
-            # This part is tricky as GameService doesn't store settings directly.
-            # Let's assume a placeholder implementation for now.
-            # TODO: Properly implement settings access for GameService translations
-            placeholder_settings = {'language': 'tr', 'translations': { 'tr': {'final_score_base': 'OYUN SONU - TOPLAM PUAN: {score}', 'score_praise_5': '★★★★★ MÜKEMMEL! Harika bir skor!', 'score_praise_4': '★★★★☆ ÇOK İYİ! Biraz daha çalışmalısın.', 'score_praise_3': '★★★☆☆ İYİ! Orta seviye skor.', 'score_praise_2': '★★☆☆☆ DAHA İYİSİNİ YAPABİLİRSİN!'}}} # Example
-            lang = placeholder_settings.get('language', 'tr')
-            translations = placeholder_settings.get('translations', {})
-            return translations.get(lang, {}).get(key, key).format(score=self.game_state.score if '{score}' in translations.get(lang, {}).get(key, key) else None)
-        except:
-             return key # Fallback
+            return message + "\n\n" + get_text('score_praise_2')
 
 #==============================================================================
 # UI Components (Moved from presentation/ui)
@@ -298,7 +365,7 @@ class SettingsDialog:
         
         # Create dialog window
         self.dialog = tk.Toplevel(parent)
-        self.dialog.title(self._get_text('settings'))
+        self.dialog.title(get_text('settings'))
         self.dialog.geometry("400x350") # Increased height slightly for confirmation
         self.dialog.resizable(False, False)
         self.dialog.transient(parent)
@@ -314,14 +381,10 @@ class SettingsDialog:
         
         self._create_widgets()
     
-    def _get_text(self, key):
-        """Get translated text based on current language setting"""
-        lang = self.settings.get('language', 'tr')
-        translations = self.settings.get('translations', {})
-        return translations.get(lang, {}).get(key, key)
-    
     def _create_widgets(self):
         """Create dialog widgets"""
+        from tkinter import ttk  # Deferred until the dialog is first opened
+
         main_frame = ttk.Frame(self.dialog, padding="10 10 10 0")
         main_frame.pack(fill=tk.BOTH, expand=True)
 
@@ -329,7 +392,7 @@ class SettingsDialog:
         content_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
         # Language selection
-        ttk.Label(content_frame, text=self._get_text('language')).grid(row=0, column=0, sticky=tk.W, pady=(0, 5))
+        ttk.Label(content_frame, text=get_text('language')).grid(row=0, column=0, sticky=tk.W, pady=(0, 5))
         
         self.language_var = tk.StringVar(value=self.settings.get('language', 'tr'))
         language_frame = ttk.Frame(content_frame)
@@ -337,20 +400,20 @@ class SettingsDialog:
         
         ttk.Radiobutton(
             language_frame, 
-            text=self._get_text('turkish'), 
+            text=get_text('turkish'), 
             value='tr',
             variable=self.language_var
         ).pack(side=tk.LEFT, padx=(0, 10))
         
         ttk.Radiobutton(
             language_frame, 
-            text=self._get_text('english'), 
+            text=get_text('english'), 
             value='en',
             variable=self.language_var
         ).pack(side=tk.LEFT)
         
         # Theme selection
-        ttk.Label(content_frame, text=self._get_text('theme')).grid(row=1, column=0, sticky=tk.W, pady=5)
+        ttk.Label(content_frame, text=get_text('theme')).grid(row=1, column=0, sticky=tk.W, pady=5)
         
         self.theme_var = tk.StringVar(value=self.settings.get('theme', 'blue'))
         theme_frame = ttk.Frame(content_frame)
@@ -366,13 +429,13 @@ class SettingsDialog:
         for i, (text_key, value) in enumerate(themes):
             ttk.Radiobutton(
                 theme_frame, 
-                text=self._get_text(text_key), 
+                text=get_text(text_key), 
                 value=value,
                 variable=self.theme_var
             ).grid(row=i//2, column=i%2, sticky=tk.W, padx=(0, 10), pady=(0, 5))
         
         # Preview frame
-        preview_frame = ttk.LabelFrame(content_frame, text=self._get_text('theme') + " " + self._get_text('preview'))
+        preview_frame = ttk.LabelFrame(content_frame, text=get_text('theme') + " " + get_text('preview'))
         preview_frame.grid(row=2, column=0, columnspan=2, sticky=tk.EW, pady=10, ipady=5)
         
         self.preview_canvas = tk.Canvas(preview_frame, width=350, height=60) # Reduced height
@@ -392,7 +455,7 @@ class SettingsDialog:
         # Add a note about settings being applied immediately
         note_label = ttk.Label(
             action_frame,
-            text=self._get_text('settings_apply_note'),
+            text=get_text('settings_apply_note'),
             font=('Arial', 8, 'italic'),
             foreground='#555555'
         )
@@ -404,14 +467,14 @@ class SettingsDialog:
         
         ttk.Button(
             button_frame, 
-            text=self._get_text('cancel'),
+            text=get_text('cancel'),
             command=self.dialog.destroy
         ).pack(side=tk.RIGHT, padx=(5, 0))
         
         # Use the styled button for the save button
         save_button = ttk.Button(
             button_frame, 
-            text=self._get_text('save'),
+            text=get_text('save'),
             command=self._save_settings,
             style='Accent.TButton'
         )
@@ -459,7 +522,7 @@ class SettingsDialog:
         # Draw text
         self.preview_canvas.create_text(
             canvas_width / 2, 15, 
-            text=self._get_text('app_title'),
+            text=get_text('app_title'),
             fill=colors.get('button_text', 'white'),
             font=('Arial', 8)
         )
@@ -473,7 +536,7 @@ class SettingsDialog:
         
         self.preview_canvas.create_text(
             canvas_width / 2, 45, 
-            text=self._get_text('guess_button'),
+            text=get_text('guess_button'),
             fill=colors.get('button_text', 'white'),
             font=('Arial', 8)
         )
@@ -487,9 +550,9 @@ class SettingsDialog:
         # Save settings to file (using the function from config.py)
         if save_settings(new_settings):
             # Show brief confirmation message
-            self.confirmation_label.config(text=self._get_text('settings_saved_success'), foreground='green')
+            self.confirmation_label.config(text=get_text('settings_saved_success'), foreground='green')
         else:
-             self.confirmation_label.config(text=self._get_text('settings_saved_error'), foreground='red')
+             self.confirmation_label.config(text=get_text('settings_saved_error'), foreground='red')
 
         self.confirmation_label.pack(side=tk.BOTTOM, fill=tk.X, pady=(0,5)) # Show confirmation
         self.dialog.update_idletasks()
@@ -509,7 +572,7 @@ class SettingsDialog:
 
 class UsernameDialog(tk.Toplevel):
     """Custom dialog for username input."""
-    def __init__(self, parent, title, prompt, settings):
+    def __init__(self, parent, title, prompt, settings, on_shown=None):
         super().__init__(parent)
         self.transient(parent)
         self.grab_set()
@@ -529,13 +592,10 @@ class UsernameDialog(tk.Toplevel):
         
         self.username_entry.focus_set()
         self.protocol("WM_DELETE_WINDOW", self._on_cancel) # Handle window close button
+        if on_shown:
+            self.after_idle(on_shown, self)
         self.wait_window(self) # Wait for dialog to close
 
-    def _get_text(self, key, fallback=None):
-        lang = self.settings.get('language', 'tr')
-        translations = self.settings.get('translations', {})
-        return translations.get(lang, {}).get(key, fallback if fallback else key)
-
     def _create_widgets(self):
         theme = self.settings.get('theme', 'blue')
         colors = self.settings.get('theme_colors', {}).get(theme, {})
@@ -559,7 +619,7 @@ class UsernameDialog(tk.Toplevel):
         button_frame.pack()
 
         self.ok_button = tk.Button(
-            button_frame, text=self._get_text('ok_button', "Tamam"), 
+            button_frame, text=get_text('ok_button', "Tamam"), 
             command=self._on_ok, width=10, font=("Arial", 20, "bold"),
             bg=primary_color, fg=button_text_color, 
             activebackground=accent_color, activeforeground=button_text_color
@@ -567,7 +627,7 @@ class UsernameDialog(tk.Toplevel):
         self.ok_button.pack(side=tk.LEFT, padx=10)
 
         self.cancel_button = tk.Button(
-            button_frame, text=self._get_text('cancel_button', "İptal"), 
+            button_frame, text=get_text('cancel_button', "İptal"), 
             command=self._on_cancel, width=10, font=("Arial", 20, "bold"),
             bg=primary_color, fg=button_text_color, 
             activebackground=accent_color, activeforeground=button_text_color
@@ -587,8 +647,9 @@ class UsernameDialog(tk.Toplevel):
     def _on_ok(self, event=None):
         self.result = self.username_entry.get().strip()
         if not self.result: # Basic validation: if empty, treat as cancel or show error
-            messagebox.showwarning(self._get_text('username_error_title', "Geçersiz Giriş"), 
-                                   self._get_text('username_empty_error', "Kullanıcı adı boş olamaz!"), parent=self)
+            from tkinter import messagebox
+            messagebox.showwarning(get_text('username_error_title', "Geçersiz Giriş"), 
+                                   get_text('username_empty_error', "Kullanıcı adı boş olamaz!"), parent=self)
             self.username_entry.focus_set()
             return
         self.destroy()
@@ -605,36 +666,93 @@ class UsernameDialog(tk.Toplevel):
 class KelimeOyunuView:
     """Main game view"""
     
-    def __init__(self, root, game_service, settings):
+    def __init__(self, root, game_service, settings, leaderboard=None, score_history=None, username_index=None,
+                 settings_service=None, image_cache=None, audio_engine=None):
         self.root = root
         self.game_service = game_service
         self.settings = settings
+        self.settings_service = settings_service
+        set_language(settings.get('language'))
+        # Services left out are built by the first build steps, once the username prompt is shown
+        self.leaderboard = leaderboard
+        self.score_history = score_history
+        self.username_index = username_index
+        self.renamed_users = {} # {old: kept} usernames merged at startup
         self.timer_id = None
         self.current_game_mode = 'quiz' 
         self.logo_image = None 
-        self.letter_labels = [] 
+        self.word_board = None 
+        self.leaderboard_browser = None
+        self.theme_engine = ThemeEngine(settings.get('theme_colors', {}))
+        self.image_cache = image_cache
+        self.audio_engine = audio_engine
+        self.render = RenderScheduler(root) # Game area updates are applied in one pass per frame
+        self.render.add_region('info', self._render_info)
+        self.render.add_region('word', self._render_word)
+        self.render.add_region('controls', self._render_controls)
+        self._input_locked = False # Between a correct guess and the next word, and after the game
+        self._detail_text = None   # Detail hint shown under the description
+        self.latency = None # Input-to-feedback timings, Ctrl+Shift+D shows them
+        self.latency_overlay = None
+        self.closed = False # Set when the player leaves at the username prompt
+        self._pending_build = deque()
+        self._build_job = None
+        
+        # Resume an interrupted game straight away, skipping the username prompt
+        resumed_state = self.game_service.resume_game()
+        if resumed_state and self.game_service.username:
+            self.current_username = self.game_service.username
+            self._setup_ui()
+            startup.first_frame(self.root, close=self.root.destroy)
+            self._resume_game(resumed_state)
+            return
         
+        # Window and prompt first, the rest of the UI is built while the player types
+        self._setup_window()
+        self._pending_build = self._build_steps()
+
         # Get username using custom dialog
         username_dialog = UsernameDialog(self.root, 
-                                       self._get_text('username_prompt_title', "Kullanıcı Adı"),
-                                       self._get_text('username_prompt_message', "Lütfen kullanıcı adınızı girin:"),
-                                       self.settings)
+                                       get_text('username_prompt_title', "Kullanıcı Adı"),
+                                       get_text('username_prompt_message', "Lütfen kullanıcı adınızı girin:"),
+                                       self.settings,
+                                       on_shown=self._on_prompt_shown)
         self.current_username = username_dialog.result # Result is set when dialog closes
 
         if self.current_username is None: # If dialog was cancelled or closed
-            print("[View] Username dialog cancelled or closed. Exiting application.")
-            self.root.destroy() # Close the main application window
+            log.info("Username dialog cancelled or closed. Exiting application.")
+            self._close()
             return # Stop further initialization
         elif not self.current_username.strip(): # Should be caught by dialog validation, but as a fallback
-            print("[View] No username entered. Exiting application.")
-            self.root.destroy()
+            log.info("No username entered. Exiting application.")
+            self._close()
             return
-            
-        self._setup_ui()
+        
+        self._finish_build()
+        # "ömer" plays on as the "Ömer" already on the leaderboard
+        self.current_username = self.username_index.resolve(self.current_username)
+
+    def _on_prompt_shown(self, dialog):
+        startup.first_frame(self.root, close=dialog._on_cancel)
+        self._build_job = self.root.after(1, self._build_next)
+
+    def _close(self):
+        """Close the main application window before the game started"""
+        if self._build_job:
+            self.root.after_cancel(self._build_job)
+            self._build_job = None
+        self.closed = True
+        self.root.destroy()
     
     def _setup_ui(self):
         """Set up the main UI components"""
-        self.root.title(self._get_text('app_title'))
+        self._setup_window()
+        self._pending_build = self._build_steps()
+        self._finish_build()
+
+    def _setup_window(self):
+        """The first frame: themed window with the header, everything below it is built afterwards"""
+        self.root.title(get_text('app_title'))
         self.root.geometry("1536x864") # Increased size by 20%
         self.root.resizable(False, False) 
         
@@ -648,7 +766,10 @@ class KelimeOyunuView:
         y = (screen_height // 2) - (height // 2)
         self.root.geometry(f'{width}x{height}+{x}+{y}') # Set position
         
-        self._apply_theme()
+        self.theme_engine.register(self.root, 'root')
+        self.root.bind_all('<Control-D>', lambda event: self.latency_overlay and self.latency_overlay.toggle()) # Ctrl+Shift+D
+        self.root.bind_all('<Control-E>', lambda event: self.latency and self.latency.export_csv()) # Ctrl+Shift+E
+        self._apply_theme() # Widgets registered from here on are styled as they are created
         
         self.baslik_font = font.Font(family="Arial", size=32, weight="bold")
         self.normal_font = font.Font(family="Arial", size=24, weight="normal")
@@ -656,85 +777,156 @@ class KelimeOyunuView:
         
         # Main frame
         self.main_frame = tk.Frame(self.root, padx=20, pady=20)
+        self.theme_engine.register(self.main_frame, 'background')
         self.main_frame.pack(fill=tk.BOTH, expand=True)
         
         # Header
         self._create_header()
-        
+        startup.mark('window')
+
+    def _build_steps(self):
+        """The rest of the UI in small steps, so it can be built between the events of the username prompt"""
+        return deque([
+            self._load_usernames,
+            self._create_stores,
+            self._create_audio,
+            self._create_game_area,
+            lambda: self._create_info_frame(self.game_area_frame),
+            lambda: self._create_description_frame(self.game_area_frame),
+            lambda: self._create_word_frame(self.game_area_frame),
+            lambda: self._create_joker_frame(self.game_area_frame),
+            lambda: self._create_guess_frame(self.game_area_frame),
+            self._create_result_label,
+            self._create_start_area,
+            self._create_leaderboard_area,
+        ])
+
+    def _build_next(self):
+        """Run one build step and queue the next one behind pending events"""
+        self._build_job = None
+        if self._pending_build:
+            self._pending_build.popleft()()
+        if self._pending_build:
+            # A timer, not after_idle: update_idletasks() would run every queued idle step at once
+            self._build_job = self.root.after(1, self._build_next)
+        else:
+            startup.mark('game_area')
+
+    def _finish_build(self):
+        """Run whatever build steps are left"""
+        if self._build_job:
+            self.root.after_cancel(self._build_job)
+            self._build_job = None
+        if self._pending_build:
+            while self._pending_build:
+                self._pending_build.popleft()()
+            startup.mark('game_area')
+
+    def _load_usernames(self):
+        if self.username_index is None:
+            from usernames import UsernameIndex
+            self.username_index = UsernameIndex()
+            # Fold "Ömer"/"ömer" style duplicates into one player before the stores load
+            if self.username_index.has_duplicates():
+                self.renamed_users = self.username_index.merge_duplicates()
+        startup.mark('usernames')
+
+    def _create_stores(self):
+        if self.score_history is None:
+            from history import ScoreHistory
+            self.score_history = ScoreHistory()
+            self.score_history.rename_users(self.renamed_users)
+        if self.leaderboard is None:
+            from leaderboard import LeaderboardStore, LeaderboardModel
+            self.leaderboard = LeaderboardModel(LeaderboardStore())
+        startup.mark('stores')
+
+    def _create_audio(self):
+        if self.audio_engine is None:
+            from audio import AudioEngine, apply_music_settings
+            self.audio_engine = AudioEngine().start() # Decodes the sound effects once, off the UI thread
+            apply_music_settings(self.audio_engine, self.settings.get('music', {}))
+        from latency import LatencyTracker, LatencyOverlay
+        self.latency = LatencyTracker()
+        self.audio_engine.add_effect_listener(self.latency.on_sound_started)
+        self.latency_overlay = LatencyOverlay(self.root, self.latency, self.render)
+        self.image_cache.prerender_async() # Later launches load the resized images straight from the cache
+        startup.mark('services')
+
+    def _create_game_area(self):
         # --- Game Area (Initially Hidden/Disabled) ---
         self.game_area_frame = tk.Frame(self.main_frame)
+        self.theme_engine.register(self.game_area_frame, 'background')
         # Pack it later when game starts
-        
-        # Info frame
-        self._create_info_frame(self.game_area_frame)
-        
-        # Description frame
-        self._create_description_frame(self.game_area_frame)
-        
-        # Word display
-        self._create_word_frame(self.game_area_frame)
-        
-        # Joker frame
-        self._create_joker_frame(self.game_area_frame)
-        
-        # Guess frame
-        self._create_guess_frame(self.game_area_frame)
-        
+
+    def _create_result_label(self):
         # Result message
         self.sonuc_label = tk.Label(
             self.game_area_frame, 
             text="", 
             font=self.baslik_font
         )
+        self.theme_engine.register(self.sonuc_label, 'result')
         self.sonuc_label.pack(pady=20)
-        
+
+    def _create_start_area(self):
         # --- Start Area ---
         self.start_area_frame = tk.Frame(self.main_frame)
+        self.theme_engine.register(self.start_area_frame, 'background')
         self.start_area_frame.pack(pady=20, anchor=tk.CENTER)
 
         self.start_buttons_frame = tk.Frame(self.start_area_frame)
+        self.theme_engine.register(self.start_buttons_frame, 'background')
         self.start_buttons_frame.pack(pady=10)
 
         self.start_quiz_btn = tk.Button(
             self.start_buttons_frame, 
-            text=self._get_text('start_button_quiz', "Start Quiz Game"),
+            text=get_text('start_button_quiz', "Start Quiz Game"),
             font=self.baslik_font,
             command=lambda: self._start_game('quiz'), 
             padx=20, 
             pady=10
         )
+        self.theme_engine.register(self.start_quiz_btn, 'start_button')
         self.start_quiz_btn.pack(side=tk.LEFT, padx=10)
         
         self.start_anagram_btn = tk.Button(
             self.start_buttons_frame, 
-            text=self._get_text('start_button_anagram', "Start Anagram Game"),
+            text=get_text('start_button_anagram', "Start Anagram Game"),
             font=self.baslik_font,
             command=lambda: self._start_game('anagram'), 
             padx=20, 
             pady=10
         )
+        self.theme_engine.register(self.start_anagram_btn, 'start_button')
         self.start_anagram_btn.pack(side=tk.LEFT, padx=10)
 
+    def _create_leaderboard_area(self):
         # --- Leaderboard Display Area ---
         self.leaderboard_display_frame = tk.Frame(self.start_area_frame, bd=1, relief=tk.SUNKEN)
+        self.theme_engine.register(self.leaderboard_display_frame, 'background')
         self.leaderboard_display_frame.pack(pady=10, fill=tk.BOTH, padx=20, expand=True)
 
         # Left Column (Quiz Scores)
         self.left_leaderboard_frame = tk.Frame(self.leaderboard_display_frame)
+        self.theme_engine.register(self.left_leaderboard_frame, 'background')
         self.left_leaderboard_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0,5))
         self.leaderboard_quiz_text_widget = tk.Text(
             self.left_leaderboard_frame, height=10, width=25, wrap=tk.WORD, 
             font=self.normal_font, relief=tk.FLAT, borderwidth=0
         )
+        self.theme_engine.register(self.leaderboard_quiz_text_widget, 'leaderboard_text')
         self.leaderboard_quiz_text_widget.pack(pady=5, padx=5, fill=tk.BOTH, expand=True)
 
         # Right Column (Anagram Scores)
         self.right_leaderboard_frame = tk.Frame(self.leaderboard_display_frame)
+        self.theme_engine.register(self.right_leaderboard_frame, 'background')
         self.right_leaderboard_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=(5,0))
         self.leaderboard_anagram_text_widget = tk.Text(
             self.right_leaderboard_frame, height=10, width=25, wrap=tk.WORD, 
             font=self.normal_font, relief=tk.FLAT, borderwidth=0
         )
+        self.theme_engine.register(self.leaderboard_anagram_text_widget, 'leaderboard_text')
         self.leaderboard_anagram_text_widget.pack(pady=5, padx=5, fill=tk.BOTH, expand=True)
         
         # Configure tags for styling leaderboard text (applied to both Text widgets)
@@ -749,46 +941,63 @@ class KelimeOyunuView:
             txt_widget.tag_configure("no_score_message", lmargin1=10, lmargin2=10, font=tag_font_italic, spacing1=2, spacing3=2, justify=tk.CENTER)
             txt_widget.config(state=tk.DISABLED)
         
+        self.leaderboard_text_widgets = {
+            'quiz': (self.leaderboard_quiz_text_widget, 'leaderboard_quiz_title'),
+            'anagram': (self.leaderboard_anagram_text_widget, 'leaderboard_anagram_title')
+        }
         self._update_leaderboard_display()
-        self._update_colors()
+        self.leaderboard.subscribe(self._on_leaderboard_changed) # Redrawn only when a top 10 changes
+        self.leaderboard.import_async(self.root) # Scores saved by another instance, read off the UI thread
+
+        # Every player, searchable, in a separate window
+        self.leaderboard_btn = tk.Button(
+            self.start_area_frame,
+            text=get_text('leaderboard_button', "Skor Tablosu"),
+            font=self.normal_font,
+            command=self._open_leaderboard_browser,
+            padx=20
+        )
+        self.theme_engine.register(self.leaderboard_btn, 'joker_button')
+        self.leaderboard_btn.pack(pady=(0, 10))
+        if self.settings_service:
+            self.settings_service.subscribe(self._on_settings_changed) # Theme/language apply in place
     
     def _create_header(self):
         """Create header frame with title"""
         self.baslik_frame = tk.Frame(self.main_frame, padx=10, pady=10)
-        # Background color will be set in _update_colors
+        self.theme_engine.register(self.baslik_frame, 'header')
         self.baslik_frame.pack(fill=tk.X, pady=(0, 20))
 
         # Intermediate frame to hold logo and title for centering
         content_header_frame = tk.Frame(self.baslik_frame)
-        # content_header_frame's background will also be set in _update_colors to match baslik_frame
+        self.theme_engine.register(content_header_frame, 'header')
         content_header_frame.pack(anchor=tk.CENTER, pady=(10, 0)) # Center this frame and add top padding
         
         # --- Logo --- 
+        from assets import ImageCache, UI_IMAGES
+        if self.image_cache is None:
+            self.image_cache = ImageCache()
         try:
-            logo_path = os.path.join("media", "logo.png")
+            logo_path, _ = UI_IMAGES['logo'] # 200x200, rendered once into the image cache
             if os.path.exists(logo_path):
-                img = Image.open(logo_path)
-                desired_width = 200  # Increased from 150
-                desired_height = 200 # Increased from 150
-                img_resized = img.resize((desired_width, desired_height), Image.Resampling.LANCZOS)
-                self.logo_image = ImageTk.PhotoImage(img_resized)
+                self.logo_image = self.image_cache.ui_photo('logo')
                 
-                # Store logo_label as an instance variable if accessed elsewhere (e.g. _update_colors)
                 self.logo_label_widget = tk.Label(content_header_frame, image=self.logo_image)
+                self.theme_engine.register(self.logo_label_widget, 'header')
                 self.logo_label_widget.pack(side=tk.LEFT, padx=(0, 10)) # Pack logo to the left within content_header_frame
             else:
-                print(f"[View Error] Logo file not found at: {logo_path}")
+                log.error("Logo file not found at: %s", logo_path)
                 self.logo_image = None
                 self.logo_label_widget = None # Ensure it's None if no logo
         except Exception as e:
-            print(f"[View Error] Failed to load logo: {e}")
+            log.error("Failed to load logo: %s", e)
             self.logo_image = None
             self.logo_label_widget = None # Ensure it's None on error
         # --- End Logo ---
         
         # self.baslik_label = tk.Label(
         #     content_header_frame, # Add to the content_header_frame
-        #     text=self._get_text('app_title'), 
+        #     text=get_text('app_title'), 
         #     font=self.baslik_font
         # )
         # self.baslik_label.pack(side=tk.LEFT, padx=(10, 0)) # Pack title to the left of logo within content_header_frame
@@ -796,67 +1005,77 @@ class KelimeOyunuView:
     def _create_info_frame(self, parent):
         """Create info frame with game statistics in the specified parent"""
         self.bilgi_frame = tk.Frame(parent, borderwidth=0, relief='flat', highlightthickness=0)
+        self.theme_engine.register(self.bilgi_frame, 'background')
         self.bilgi_frame.pack(fill=tk.X, pady=(0, 10))
 
         # Frame for left-aligned items
         self.left_info_frame = tk.Frame(self.bilgi_frame, borderwidth=0, relief='flat', highlightthickness=0)
+        self.theme_engine.register(self.left_info_frame, 'background')
         self.left_info_frame.pack(side=tk.LEFT)
 
         # Frame for right-aligned items
         self.right_info_frame = tk.Frame(self.bilgi_frame, borderwidth=0, relief='flat', highlightthickness=0)
+        self.theme_engine.register(self.right_info_frame, 'background')
         self.right_info_frame.pack(side=tk.RIGHT)
         
         self.kelime_index_label = tk.Label(
             self.left_info_frame, # Add to left_info_frame
-            text=f"{self._get_text('word_label')}: 0/10", 
+            text=f"{get_text('word_label')}: 0/10", 
             font=self.normal_font,
             borderwidth=0, relief='flat', highlightthickness=0
         )
+        self.theme_engine.register(self.kelime_index_label, 'label')
         self.kelime_index_label.pack(side=tk.LEFT, padx=5)
         
         self.uzunluk_label = tk.Label(
             self.left_info_frame, # Add to left_info_frame
-            text=f"{self._get_text('word_length')}: 0", 
+            text=f"{get_text('word_length')}: 0", 
             font=self.normal_font,
             borderwidth=0, relief='flat', highlightthickness=0
         )
+        self.theme_engine.register(self.uzunluk_label, 'label')
         self.uzunluk_label.pack(side=tk.LEFT, padx=5)
 
         # Note: Puan is packed before Sure to appear as Score | Time (if both on right)
         self.puan_label = tk.Label(
             self.right_info_frame, # Add to right_info_frame
-            text=f"{self._get_text('score')}: 0", 
+            text=f"{get_text('score')}: 0", 
             font=self.normal_font,
             borderwidth=0, relief='flat', highlightthickness=0
         )
+        self.theme_engine.register(self.puan_label, 'label')
         self.puan_label.pack(side=tk.RIGHT, padx=5) # Pack to the right within right_info_frame
         
         self.sure_label = tk.Label(
             self.right_info_frame, # Add to right_info_frame
-            text=f"{self._get_text('remaining_time')}: 200s", 
+            text=f"{get_text('remaining_time')}: 200s", 
             font=self.normal_font,
             borderwidth=0, relief='flat', highlightthickness=0
         )
+        self.theme_engine.register(self.sure_label, 'label')
         self.sure_label.pack(side=tk.RIGHT, padx=5) # Pack to the right within right_info_frame (will be to the left of puan_label)
             
     def _create_description_frame(self, parent):
         """Create description frame in the specified parent"""
         self.aciklama_frame = tk.Frame(parent)
+        self.theme_engine.register(self.aciklama_frame, 'background')
         self.aciklama_frame.pack(fill=tk.X, pady=10)
         
         self.aciklama_label = tk.Label(
             self.aciklama_frame, 
-            text=f"{self._get_text('description')}: ", 
+            text=f"{get_text('description')}: ", 
             font=self.normal_font, 
             wraplength=750, 
             justify=tk.LEFT,
             borderwidth=0, relief='flat', highlightthickness=0
         )
+        self.theme_engine.register(self.aciklama_label, 'label')
         self.aciklama_label.pack(fill=tk.X, anchor=tk.W, pady=5)
     
     def _create_word_frame(self, parent):
         """Create word display frame in the specified parent"""
         self.word_display_frame = tk.Frame(parent) 
+        self.theme_engine.register(self.word_display_frame, 'background')
         self.word_display_frame.pack(fill=tk.X, pady=10)
         
         # Label to indicate what the boxes are for (e.g., "Word:", "Unscramble:")
@@ -866,61 +1085,74 @@ class KelimeOyunuView:
             font=self.normal_font,
             borderwidth=0, relief='flat', highlightthickness=0
         )
+        self.theme_engine.register(self.word_display_label, 'label')
         self.word_display_label.pack(side=tk.LEFT, padx=(0, 10))
         
         # Frame to hold the individual letter boxes
         self.letter_boxes_frame = tk.Frame(self.word_display_frame)
+        self.theme_engine.register(self.letter_boxes_frame, 'background')
         self.letter_boxes_frame.pack(expand=True)
+        if self.settings.get('word_board') == 'canvas':
+            self.word_board = CanvasWordBoard(self.letter_boxes_frame, self.kelime_font) # One canvas, animated
+        else:
+            self.word_board = LetterBoxRow(self.letter_boxes_frame, self.kelime_font) # Boxes are reused between words
     
     def _create_joker_frame(self, parent):
         """Create joker buttons frame in the specified parent"""
         self.joker_frame = tk.Frame(parent)
+        self.theme_engine.register(self.joker_frame, 'background')
         self.joker_frame.pack(fill=tk.X, pady=10)
         
         self.joker1_btn = tk.Button(
             self.joker_frame, 
-            text=f"{self._get_text('hint_button')} (3/3)", 
+            text=f"{get_text('hint_button')} (3/3)", 
             font=self.normal_font,
             command=self._use_char_hint, 
             padx=10,
             pady=5
         )
+        self.theme_engine.register(self.joker1_btn, 'joker_button')
         self.joker1_btn.pack(side=tk.LEFT, padx=5)
         
         self.joker2_btn = tk.Button(
             self.joker_frame, 
-            text=f"{self._get_text('detail_button')} (1/1)", 
+            text=f"{get_text('detail_button')} (1/1)", 
             font=self.normal_font,
             command=self._use_detail_hint, 
             padx=10,
             pady=5
         )
+        self.theme_engine.register(self.joker2_btn, 'joker_button')
         self.joker2_btn.pack(side=tk.LEFT, padx=5)
     
     def _create_guess_frame(self, parent):
         """Create guess input frame in the specified parent"""
         self.tahmin_frame = tk.Frame(parent) # This frame will now stack vertically
+        self.theme_engine.register(self.tahmin_frame, 'background')
         self.tahmin_frame.pack(fill=tk.X, pady=10)
 
         # --- Finish Button ---
         self.bitir_btn = tk.Button(
             self.tahmin_frame,
-            text=self._get_text('finish_game_button', "Oyunu Bitir"),
+            text=get_text('finish_game_button', "Oyunu Bitir"),
             font=self.normal_font,
             command=self._finish_game_manually
         )
+        self.theme_engine.register(self.bitir_btn, 'danger_button')
         self.bitir_btn.pack(pady=(0, 10)) # Pack at the top of tahmin_frame, with some space below
 
         # --- Frame for actual guess input (label, entry, button) ---
         self.actual_guess_input_frame = tk.Frame(self.tahmin_frame)
+        self.theme_engine.register(self.actual_guess_input_frame, 'background')
         self.actual_guess_input_frame.pack(fill=tk.X)
         
         self.tahmin_label = tk.Label(
             self.actual_guess_input_frame, 
-            text=f"{self._get_text('guess_label')}:", 
+            text=f"{get_text('guess_label')}:", 
             font=self.normal_font,
             borderwidth=0, relief='flat', highlightthickness=0
         )
+        self.theme_engine.register(self.tahmin_label, 'label')
         self.tahmin_label.pack(side=tk.LEFT, padx=5)
         
         self.tahmin_entry = tk.Entry(
@@ -928,184 +1160,135 @@ class KelimeOyunuView:
             font=self.normal_font,
             borderwidth=0, relief='flat', highlightthickness=0
         )
+        self.theme_engine.register(self.tahmin_entry, 'entry')
         self.tahmin_entry.pack(side=tk.LEFT, padx=5, fill=tk.X, expand=True)
         self.tahmin_entry.bind("<Return>", self._make_guess)
         
         self.tahmin_btn = tk.Button(
             self.actual_guess_input_frame, 
-            text=self._get_text('guess_button'), 
+            text=get_text('guess_button'), 
             font=self.normal_font,
             command=self._make_guess,
             borderwidth=0, relief='flat', highlightthickness=0
         )
+        self.theme_engine.register(self.tahmin_btn, 'guess_button')
         self.tahmin_btn.pack(side=tk.LEFT, padx=5)
     
-    def _get_text(self, key, fallback=None):
-        """Get translated text based on current language setting"""
-        lang = self.settings.get('language', 'tr')
-        translations = self.settings.get('translations', {})
-        # Use fallback if key is not found in the specific language or default
-        result = translations.get(lang, {}).get(key, fallback if fallback else key)
-        # print(f"[GetText] Key: {key}, Lang: {lang}, Result: {result}") # Temporary debug
-        return result
-    
     def _apply_theme(self):
-        """Apply theme to root window"""
-        # print("[View] Applying theme...") # Debug
-        theme = self.settings.get('theme', 'blue')
-        # print(f"[View]   - Theme from settings: {theme}") # Debug
-        colors = self.settings.get('theme_colors', {}).get(theme, {})
-        
-        bg_color = colors.get('background', '#f0f0f0')
-        # print(f"[View]   - Applying background: {bg_color}") # Debug
-        self.root.configure(bg=bg_color)
-    
-    def _update_colors(self):
-        """Update colors of all widgets based on current theme"""
-        # print("[View] Updating widget colors...") # Debug
-        theme = self.settings.get('theme', 'blue')
-        # print(f"[View]   - Theme for colors: {theme}") # Debug
-        colors = self.settings.get('theme_colors', {}).get(theme, {})
-        # print(f"[View]   - Colors loaded: {colors}") # Debug
-        
-        bg_color = colors.get('background', '#f0f0f0')
-        primary_color = colors.get('primary', '#4a7abc')
-        accent_color = colors.get('accent', '#FF5722')
-        secondary_color = colors.get('secondary', '#2196F3')
-        text_color = colors.get('text', '#333333')
-        button_text_color = colors.get('button_text', 'white')
-        secondary_bg_color = colors.get('secondary_background', bg_color)
-        secondary_text_color = colors.get('secondary_text', text_color)
-        
-        # Update frame backgrounds
-        leaderboard_title_label = None # This label was removed, Text widget used directly
-        frames_to_color = [
-            self.main_frame, self.start_area_frame, self.start_buttons_frame,
-            self.game_area_frame, self.bilgi_frame, self.aciklama_frame,
-            self.word_display_frame, self.letter_boxes_frame,
-            self.joker_frame, self.tahmin_frame,
-            getattr(self, 'actual_guess_input_frame', None), # Added for the new inner guess frame
-            getattr(self, 'rules_frame', None),
-            getattr(self, 'logo_frame', None),
-            getattr(self, 'header_leaderboard_frame', None),
-            getattr(self, 'leaderboard_display_frame', None),
-            getattr(self, 'left_leaderboard_frame', None),
-            getattr(self, 'right_leaderboard_frame', None)
-        ]
-        for widget in frames_to_color:
-            if widget:
-                widget.configure(bg=bg_color)
-
-        if hasattr(self, 'leaderboard_quiz_text_widget'):
-            self.leaderboard_quiz_text_widget.configure(bg=secondary_bg_color, fg=text_color, relief=tk.FLAT, borderwidth=0)
-            self.leaderboard_quiz_text_widget.tag_configure("bold_title", foreground=primary_color)
-            self.leaderboard_quiz_text_widget.tag_configure("score_entry", foreground=text_color)
-            self.leaderboard_quiz_text_widget.tag_configure("no_score_message", foreground=secondary_text_color)
-
-        if hasattr(self, 'leaderboard_anagram_text_widget'):
-            self.leaderboard_anagram_text_widget.configure(bg=secondary_bg_color, fg=text_color, relief=tk.FLAT, borderwidth=0)
-            self.leaderboard_anagram_text_widget.tag_configure("bold_title", foreground=primary_color)
-            self.leaderboard_anagram_text_widget.tag_configure("score_entry", foreground=text_color)
-            self.leaderboard_anagram_text_widget.tag_configure("no_score_message", foreground=secondary_text_color)
-
-        # ... (rest of _update_colors for buttons, labels etc.)
-        self.baslik_frame.configure(bg=primary_color)
-        if self.baslik_frame.winfo_children(): 
-            content_header_frame = self.baslik_frame.winfo_children()[0]
-            content_header_frame.configure(bg=primary_color)
-        if hasattr(self, 'logo_label_widget') and self.logo_label_widget:
-            self.logo_label_widget.configure(bg=primary_color)
-
-        for label in [self.kelime_index_label, self.sure_label, self.puan_label, self.uzunluk_label]:
-            label.configure(bg=bg_color, fg=text_color, borderwidth=0, relief='flat', highlightthickness=0)
-        self.aciklama_label.configure(bg=bg_color, fg=text_color)
-        self.word_display_label.configure(bg=bg_color, fg=text_color) 
-        for label in self.letter_labels:
-            if label: 
-                label.configure(bg=bg_color, fg=text_color)
-
-        self.joker1_btn.configure(bg=secondary_color, fg=button_text_color, activebackground=accent_color, activeforeground=button_text_color)
-        self.joker2_btn.configure(bg=secondary_color, fg=button_text_color, activebackground=accent_color, activeforeground=button_text_color)
-
-        self.tahmin_label.configure(bg=bg_color, fg=text_color)
-        self.tahmin_entry.configure(fg=text_color) 
-        self.tahmin_btn.configure(bg=accent_color, fg=button_text_color, activebackground=secondary_color, activeforeground=button_text_color)
-
-        self.sonuc_label.configure(bg=bg_color)
-
-        self.start_quiz_btn.configure(bg=primary_color, fg=button_text_color, activebackground=accent_color, activeforeground=button_text_color)
-        self.start_anagram_btn.configure(bg=primary_color, fg=button_text_color, activebackground=accent_color, activeforeground=button_text_color)
-        # Restart button styling removed
-
-        if hasattr(self, 'bitir_btn'):
-            light_red_bg = colors.get('danger_button_bg', '#FFA07A') # LightSalmon
-            light_red_active_bg = colors.get('danger_button_active_bg', '#FA8072') # Salmon
-            self.bitir_btn.configure(bg=light_red_bg, fg=button_text_color, 
-                                     activebackground=light_red_active_bg, 
-                                     activeforeground=button_text_color)
+        """Restyle every registered widget for the current theme in one pass"""
+        self.theme_engine.apply(self.settings.get('theme', 'blue'))
+        palette = self.theme_engine.palette()
+        if self.word_board:
+            self.word_board.set_colors(palette['background'], palette['text'])
+        if self.leaderboard_browser and self.leaderboard_browser.exists():
+            self.leaderboard_browser.apply_theme()
+
+    def _open_leaderboard_browser(self):
+        """Open the full leaderboard, or bring it to the front if it is already open"""
+        if self.leaderboard_browser and self.leaderboard_browser.exists():
+            self.leaderboard_browser.lift()
+            return
+        from leaderboard_browser import LeaderboardBrowser
+        self.leaderboard_browser = LeaderboardBrowser(self.root, self.leaderboard, self.theme_engine,
+                                                      username=self.current_username, mode=self.current_game_mode)
 
-    def _update_leaderboard_display(self):
-        widgets_and_titles_modes = [
-            (self.leaderboard_quiz_text_widget, self._get_text('leaderboard_quiz_title'), 'quiz'),
-            (self.leaderboard_anagram_text_widget, self._get_text('leaderboard_anagram_title'), 'anagram')
-        ]
-        scores_data = load_highscores(HIGHSCORE_FILE)
-
-        for txt_widget, title, mode_key in widgets_and_titles_modes:
-            txt_widget.config(state=tk.NORMAL)
-            txt_widget.delete('1.0', tk.END)
-            txt_widget.insert(tk.END, title + "\n", "bold_title")
-
-            mode_scores = []
-            if scores_data:
-                for username, user_game_scores in scores_data.items():
-                    if mode_key in user_game_scores:
-                        mode_scores.append((user_game_scores[mode_key], username))
-            
-            mode_scores.sort(key=lambda x: (-x[0], x[1])) # Sort by score desc, then username asc
+    def _on_settings_changed(self, settings, changed):
+        """Settings service callback: restyle or relabel the existing widgets"""
+        self.settings = settings
+        if 'theme_colors' in changed:
+            self.theme_engine.set_theme_colors(settings.get('theme_colors', {}))
+        if changed & {'theme', 'theme_colors'}:
+            self._apply_theme()
+        if 'language' in changed:
+            set_language(settings.get('language'))
+            self._refresh_texts()
+        if 'music' in changed:
+            from audio import apply_music_settings
+            apply_music_settings(self.audio_engine, settings.get('music', {}))
+
+    def _refresh_texts(self):
+        """Re-apply every translated text after a language change"""
+        self.root.title(get_text('app_title'))
+        self.start_quiz_btn.config(text=get_text('start_button_quiz', "Start Quiz Game"))
+        self.start_anagram_btn.config(text=get_text('start_button_anagram', "Start Anagram Game"))
+        self.bitir_btn.config(text=get_text('finish_game_button', "Oyunu Bitir"))
+        self.leaderboard_btn.config(text=get_text('leaderboard_button', "Skor Tablosu"))
+        if self.leaderboard_browser and self.leaderboard_browser.exists():
+            self.leaderboard_browser.refresh_texts()
+        self.render.action('language')
+        self.render.invalidate('info', 'word', 'controls')
+        self._update_leaderboard_display()
 
-            if mode_scores:
-                for i, (score, username) in enumerate(mode_scores[:10]): # Display top 10 for each mode
-                    txt_widget.insert(tk.END, f"{i+1}. {username}: {score}\n", "score_entry")
-            else:
-                if not scores_data: # Overall no scores yet
-                     txt_widget.insert(tk.END, self._get_text('no_highscores_message', "Henüz skor yok.") + "\n", "no_score_message")
-                else: # Scores exist, but not for this specific mode
-                    txt_widget.insert(tk.END, self._get_text('no_scores_for_mode_message', "Bu mod için skor yok.") + "\n", "no_score_message")
-            txt_widget.config(state=tk.DISABLED)
+    def _update_leaderboard_display(self):
+        """Shows the top 10 of each game mode on the start screen"""
+        for mode_key in self.leaderboard_text_widgets:
+            self._render_leaderboard(mode_key, self.leaderboard.top(mode_key, 10))
+
+    def _on_leaderboard_changed(self, mode_key, top_entries):
+        """Leaderboard model callback, only called when a visible top 10 changed"""
+        if mode_key in self.leaderboard_text_widgets:
+            self._render_leaderboard(mode_key, top_entries)
+
+    def _render_leaderboard(self, mode_key, mode_scores):
+        """Renders one mode's top entries (sorted by score desc, then username asc)"""
+        txt_widget, title_key = self.leaderboard_text_widgets[mode_key]
+        txt_widget.config(state=tk.NORMAL)
+        txt_widget.delete('1.0', tk.END)
+        txt_widget.insert(tk.END, get_text(title_key) + "\n", "bold_title")
+
+        if mode_scores:
+            for i, (score, username) in enumerate(mode_scores):
+                txt_widget.insert(tk.END, f"{i+1}. {username}: {score}\n", "score_entry")
+        else:
+            if not self.leaderboard.has_scores(): # Overall no scores yet
+                 txt_widget.insert(tk.END, get_text('no_highscores_message', "Henüz skor yok.") + "\n", "no_score_message")
+            else: # Scores exist, but not for this specific mode
+                txt_widget.insert(tk.END, get_text('no_scores_for_mode_message', "Bu mod için skor yok.") + "\n", "no_score_message")
+        txt_widget.config(state=tk.DISABLED)
 
     def _start_game(self, mode): # Accept mode parameter
         """Start a new game in the specified mode"""
         self.current_game_mode = mode
-        print(f"[View] Starting game in mode: {self.current_game_mode}") # Debug
+        log.debug("View starting game in mode: %s", self.current_game_mode)
         
         # Hide start area, show game area
         self.start_area_frame.pack_forget()
         self.game_area_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10) # Add padding
         
         # Initialize game service for the chosen mode
-        self.game_service.start_game(game_mode=self.current_game_mode)
+        self.game_service.start_game(game_mode=self.current_game_mode, username=self.current_username)
+        
+        self._enter_game_area()
+
+    def _resume_game(self, state):
+        """Show the game area for a game restored from the session journal"""
+        self.current_game_mode = state.game_mode
+        log.debug("View resuming game in mode: %s", self.current_game_mode)
         
+        self.start_area_frame.pack_forget()
+        self.game_area_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        self._enter_game_area()
+
+    def _enter_game_area(self):
+        """Refresh the game area and start the timer for the current game state"""
+        self.render.action('start_game')
         # Clear result message
-        self.sonuc_label.config(text="")
+        self._show_result("")
+        self._input_locked = False
+        self._detail_text = None
         
         # Update UI with initial game state for the selected mode
         self._update_ui()
         
         # Start timer
         self._update_timer()
-        
-        # Enable input
-        self.tahmin_entry.config(state=tk.NORMAL)
-        self.tahmin_btn.config(state=tk.NORMAL)
-        
-        # Enable/Disable Jokers based on mode
-        joker_state = tk.NORMAL if self.current_game_mode == 'quiz' else tk.DISABLED
-        self.joker1_btn.config(state=joker_state)
-        self.joker2_btn.config(state=joker_state)
-        
-        # Set focus on entry
-        self.tahmin_entry.focus_set()
+
+    def _show_result(self, text, fg=None):
+        """Result message under the guess field"""
+        if fg:
+            self.render.set(self.sonuc_label, text=text, fg=fg)
+        else:
+            self.render.set(self.sonuc_label, text=text)
 
     def _update_timer(self):
         """Update timer display"""
@@ -1113,19 +1296,20 @@ class KelimeOyunuView:
         if self.timer_id:
             self.root.after_cancel(self.timer_id)
             self.timer_id = None
+        self.render.action('timer')
         
         # Update time in game service only if game is running
         if self.game_service.game_state and self.game_service.game_state.is_running:
             remaining = self.game_service.update_time()
             
             # Update display
-            self.sure_label.config(text=f"{self._get_text('remaining_time')}: {remaining}s")
+            self.render.set(self.sure_label, text=f"{get_text('remaining_time')}: {remaining}s")
             
             # Check if time ran out
             if remaining <= 0: # If time is up based on the value returned by update_time()
                 # game_service.update_time() already sets game_state.is_running to False if time is up.
                 # _game_over will also ensure/confirm game_state.is_running is False.
-                self._game_over(self._get_text('time_up'))
+                self._game_over(get_text('time_up'))
                 return # Stop timer updates
             
             # Schedule next update only if still running
@@ -1138,214 +1322,199 @@ class KelimeOyunuView:
                  self.timer_id = None
             # Optionally update time label to 0 if game ended due to completion
             if self.game_service.game_state and not self.game_service.game_state.is_running:
-                 self.sure_label.config(text=f"{self._get_text('remaining_time')}: 0s")
+                 self.render.set(self.sure_label, text=f"{get_text('remaining_time')}: 0s")
     
     def _update_ui(self):
-        """Update UI with current game state"""
-        state = self.game_service.game_state
-        
-        if not state:
-            print("[View] Update UI called but no valid game state.")
-            # Reset to default state? Or handle appropriately
-            return
+        """Redraw the game area for the current game state in the next render pass"""
+        self.render.invalidate('info', 'word', 'controls')
+        self.render.after_pass(self._reset_guess_entry)
+
+    def _mark_repaint(self, trace):
+        """Mark the trace's 'repaint' stage once Tk has drawn the updates requested so far"""
+        # Redraws are idle handlers queued by the render pass, an idle handler queued after them runs once they are done
+        self.render.after_pass(lambda: self.root.after_idle(self.latency.mark, trace, 'repaint'))
 
-        # Update info labels first, as they depend on state
-        self._update_info_labels()
+    def _reset_guess_entry(self):
+        # Runs after the render pass, so the Entry is already enabled when it is cleared
+        self.tahmin_entry.delete(0, tk.END)
+        self.tahmin_entry.focus_set() # Keep focus on entry
 
-        if not state.current_word:
-             print("[View] Update UI called but no current word (likely game end).") 
-             # Maybe clear word boxes? Or handle game over state display
-             for widget in self.letter_boxes_frame.winfo_children():
-                 widget.destroy()
-             self.letter_labels.clear()
-             return
+    def _word_mode_text(self, state):
+        """The label in front of the letter boxes, including the word's points in quiz mode"""
+        if state and state.current_word:
+            if state.game_mode == 'quiz':
+                return f"{get_text('word_label')}: ({state.current_word_score} Puan)"
+            if state.game_mode == 'anagram':
+                return f"{get_text('unscramble_label', 'Unscramble')}:"
+        return f"{get_text('word_label')}:"
+
+    def _render_info(self):
+        """Render region: word index, length, time and score"""
+        state = self.game_service.game_state
+        if state and state.is_running:
+            total_words = len(state.flat_words) if state.flat_words else 0
+            index_text = f"{get_text('word_label')}: {state.current_word_index + 1}/{total_words}"
+            remaining = state.remaining_time
+            score = state.score
+            length = state.current_word.length if state.current_word else 0
+        else:
+            # Reset labels when no game is active
+            total_words_default = 10 # Or get from config?
+            index_text = f"{get_text('word_label')}: 0/{total_words_default}"
+            remaining = state.time_limit if state else 200 # Use actual limit if available
+            score = 0
+            length = 0
+        self.render.set(self.kelime_index_label, text=index_text)
+        self.render.set(self.sure_label, text=f"{get_text('remaining_time')}: {remaining}s")
+        self.render.set(self.puan_label, text=f"{get_text('score')}: {score}")
+        length_text = get_text('word_length_value', length=length)
+        self.render.set(self.uzunluk_label, text=f"{get_text('word_length')}: {length_text}")
+
+    def _render_word(self):
+        """Render region: description, word label and letter boxes"""
+        state = self.game_service.game_state
+        self.render.set(self.word_display_label, text=self._word_mode_text(state))
+        if not state or not state.current_word or not state.is_running:
+            self.render.set(self.aciklama_label, text=f"{get_text('description')}: ")
+            self.word_board.clear()
+            return
         
-        print(f"[View] Updating UI for mode: {state.game_mode}, Word: {state.current_word.word}") # Debug
+        log.debug("Rendering word for mode: %s, word: %s", state.game_mode, state.current_word.word)
         
         # Update description (only shown in quiz mode)
         if state.game_mode == 'quiz':
-            self.aciklama_label.config(text=f"{self._get_text('description')}: {state.current_word.description}") # Score removed from here
-            self.aciklama_label.pack(anchor=tk.W, fill=tk.X, pady=(0, 5)) # Ensure it's visible and fills
-        else:
+            description = f"{get_text('description')}: {state.current_word.description}"
+            if self._detail_text:
+                description += f"\n{get_text('detail_prefix')} {self._detail_text}"
+            self.render.set(self.aciklama_label, text=description)
+            if not self.aciklama_label.winfo_manager():
+                self.aciklama_label.pack(anchor=tk.W, fill=tk.X, pady=(0, 5)) # Ensure it's visible and fills
+        elif self.aciklama_label.winfo_manager():
             self.aciklama_label.pack_forget() # Hide description in anagram mode
-            
-        # Update word display label based on mode, including score for quiz mode
-        if state.game_mode == 'quiz':
-            word_mode_text = f"{self._get_text('word_label')}: ({state.current_word_score} Puan)"
-        elif state.game_mode == 'anagram':
-            word_mode_text = f"{self._get_text('unscramble_label', 'Unscramble')}:"
-        else: # Fallback, should not happen with current modes
-            word_mode_text = f"{self._get_text('word_label')}:"
-        self.word_display_label.config(text=word_mode_text)
         
         # --- Update Letter Boxes ---
-        # Clear previous letter boxes
-        for widget in self.letter_boxes_frame.winfo_children():
-            widget.destroy()
-        self.letter_labels.clear()
-
-        # Create new letter boxes
         displayed_word_text = state.get_displayed_word() # e.g., "_ _ K _ _" or "K E L I M E"
-        # Determine background color from theme
-        theme = self.settings.get('theme', 'blue')
-        colors = self.settings.get('theme_colors', {}).get(theme, {})
-        bg_color = colors.get('background', '#f0f0f0')
-        text_color = colors.get('text', '#333333')
-
-        for char in displayed_word_text:
-            if char == ' ': # Add space between boxes for visual separation
-                # Use a Label for spacing to inherit background color
-                spacer = tk.Label(self.letter_boxes_frame, text=" ", width=1, bg=bg_color)
-                spacer.pack(side=tk.LEFT)
-                self.letter_labels.append(None) # Placeholder for spacer
-            else:
-                box = tk.Label(
-                    self.letter_boxes_frame, 
-                    text=char, 
-                    font=self.kelime_font, 
-                    relief=tk.SOLID, 
-                    borderwidth=1, 
-                    width=2, 
-                    anchor=tk.CENTER,
-                    bg=bg_color, # Set background color
-                    fg=text_color  # Set text color
-                )
-                box.pack(side=tk.LEFT)
-                self.letter_labels.append(box)
-        # --- End Letter Boxes ---
-
-        # Update joker buttons state and text
-        if state.game_mode == 'quiz':
-            self.joker1_btn.config(
-                text=f"{self._get_text('hint_button')} ({state.hint_count}/3)",
-                state=tk.NORMAL if state.hint_count > 0 else tk.DISABLED
-            )
-            self.joker2_btn.config(
-                text=f"{self._get_text('detail_button')} ({state.detail_hint_count}/1)",
-                state=tk.NORMAL if state.detail_hint_count > 0 else tk.DISABLED
-            )
-            self.joker_frame.pack(fill=tk.X, pady=10) # Show joker frame
-        else: # Anagram mode - hide jokers
-            self.joker_frame.pack_forget()
-
-        # Ensure guess input is enabled if game is running
-        if state.is_running: # 'state' is guaranteed to be non-None here
-            self.tahmin_entry.config(state=tk.NORMAL)
-            self.tahmin_btn.config(state=tk.NORMAL)
-            self.bitir_btn.config(state=tk.NORMAL)
-        else: # game over or other states handle disabling appropriately
-            self.tahmin_entry.config(state=tk.DISABLED)
-            self.tahmin_btn.config(state=tk.DISABLED)
-            self.bitir_btn.config(state=tk.DISABLED)
-
-        # Clear input
-        self.tahmin_entry.delete(0, tk.END)
-        self.tahmin_entry.focus_set() # Keep focus on entry
+        palette = self.theme_engine.palette()
+        self.word_board.show(displayed_word_text, palette['background'], palette['text']) # Only changed cells are reconfigured
+
+    def _render_controls(self):
+        """Render region: guess field, buttons and jokers"""
+        state = self.game_service.game_state
+        running = bool(state and state.is_running)
+        accepting = running and not self._input_locked # Locked between a correct guess and the next word
+        input_state = tk.NORMAL if accepting else tk.DISABLED
+        self.render.set(self.tahmin_label, text=f"{get_text('guess_label')}:")
+        self.render.set(self.tahmin_btn, text=get_text('guess_button'), state=input_state)
+        self.render.set(self.tahmin_entry, state=input_state)
+        self.render.set(self.bitir_btn, state=tk.NORMAL if running else tk.DISABLED)
+
+        hint_count = state.hint_count if state else 3
+        detail_hint_count = state.detail_hint_count if state else 1
+        jokers_usable = accepting and state.game_mode == 'quiz'
+        self.render.set(self.joker1_btn, text=f"{get_text('hint_button')} ({hint_count}/3)",
+                        state=tk.NORMAL if jokers_usable and hint_count > 0 else tk.DISABLED)
+        self.render.set(self.joker2_btn, text=f"{get_text('detail_button')} ({detail_hint_count}/1)",
+                        state=tk.NORMAL if jokers_usable and detail_hint_count > 0 else tk.DISABLED)
+        if state and state.game_mode == 'anagram': # Anagram mode - hide jokers
+            if self.joker_frame.winfo_manager():
+                self.joker_frame.pack_forget()
+        elif not self.joker_frame.winfo_manager():
+            self.joker_frame.pack(fill=tk.X, pady=10, before=self.tahmin_frame) # Show joker frame
 
     def _make_guess(self, event=None):
         """Process user's guess"""
         if not self.game_service.game_state or not self.game_service.game_state.is_running:
              return # Don't process guess if game not running
+        if self._input_locked:
+            return # Waiting for the next word
              
         guess = self.tahmin_entry.get().strip().lower()
         if not guess:
             return
+        self.render.action('guess')
+        trace = self.latency.begin('guess')
         
         # Check guess
-        if self.game_service.make_guess(guess):
+        correct = self.game_service.make_guess(guess)
+        self.latency.mark(trace, 'score')
+        self.latency.expect_sound(trace, "dogru.mp3" if correct else "yanlis.mp3")
+        self._mark_repaint(trace)
+        if correct:
             # Correct guess
             self._play_sound("dogru.mp3") # Play correct sound
-            state = self.game_service.game_state
-            self.sonuc_label.config(
-                text=self._get_text('correct_guess'), # Display simple "Correct!" message
-                fg="#2E7D32" # Darker Green
-            )
-            
-            # Update score display immediately
-            self.puan_label.config(text=f"{self._get_text('score')}: {state.score}")
+            self._show_result(get_text('correct_guess'), "#2E7D32") # Darker Green
+            self.tahmin_entry.delete(0, tk.END)
             
-            # Disable input during transition
-            self.tahmin_entry.config(state=tk.DISABLED)
-            self.tahmin_btn.config(state=tk.DISABLED)
-            if state.game_mode == 'quiz': # Keep jokers disabled
-                 self.joker1_btn.config(state=tk.DISABLED)
-                 self.joker2_btn.config(state=tk.DISABLED)
+            # Disable input and jokers during transition, score updates in the same pass
+            self._input_locked = True
+            self.render.invalidate('info', 'controls')
             
             # Schedule next word
             self.root.after(1500, self._next_word) # Slightly shorter delay
         else:
             # Wrong guess
             self._play_sound("yanlis.mp3") # Play wrong sound
-            self.sonuc_label.config(
-                text=self._get_text('wrong_guess'),
-                fg="#C62828" # Darker Red
-            )
+            self._show_result(get_text('wrong_guess'), "#C62828") # Darker Red
             self.tahmin_entry.delete(0, tk.END)
-            # Add a visual cue for wrong guess (e.g., shake effect - harder in Tkinter)
-            # Simple clear and focus
+            self.word_board.shake() # Visual cue for the wrong guess (canvas board only)
             self.tahmin_entry.focus_set()
     
     def _use_char_hint(self):
         """Use character hint (only for quiz mode)"""
         if self.current_game_mode != 'quiz': return
         if not self.game_service.game_state or not self.game_service.game_state.is_running: return
+        self.render.action('hint')
+        trace = self.latency.begin('hint')
         
         char = self.game_service.use_character_hint()
+        self.latency.mark(trace, 'score')
+        self._mark_repaint(trace)
         
         if char:
-            # Simply update the UI which will regenerate the boxes with the revealed letter
-            self._update_ui() 
-            # Score is updated internally, but reflect hint count change immediately
-            state = self.game_service.game_state
-            self.joker1_btn.config(
-                text=f"{self._get_text('hint_button')} ({state.hint_count}/3)",
-                state=tk.NORMAL if state.hint_count > 0 else tk.DISABLED
-            )
+            # The revealed letter, the lower word score and the hint count are redrawn in one pass
+            self.render.invalidate('word', 'controls')
     
     def _use_detail_hint(self):
         """Use detailed hint (only for quiz mode)"""
         if self.current_game_mode != 'quiz': return
         if not self.game_service.game_state or not self.game_service.game_state.is_running: return
+        self.render.action('detail_hint')
+        trace = self.latency.begin('detail_hint')
 
         details = self.game_service.use_detail_hint()
+        self.latency.mark(trace, 'score')
+        self._mark_repaint(trace)
         
         if details:
-            # Update UI first to get the base description text
-            self._update_ui() 
-            
-            state = self.game_service.game_state
-            self.joker2_btn.config(
-                text=f"{self._get_text('detail_button')} ({state.detail_hint_count}/1)",
-                state=tk.DISABLED # Hint is used
-            )
-            # Append detail to the description
-            current_desc = f"{self._get_text('description')}: {state.current_word.description}"
-            # Use translated prefix for detail hint
-            detail_prefix = self._get_text('detail_prefix')
-            self.aciklama_label.config(text=f"{current_desc}\n{detail_prefix} {details}")
+            # Appended to the description until the next word
+            self._detail_text = details
+            self.render.invalidate('word', 'controls')
     
     def _next_word(self):
         """Move to the next word"""
         if not self.game_service.game_state: return # Safety check
+        self.render.action('next_word')
+        trace = self.latency.begin('next_word')
         
         has_next = self.game_service.next_word()
+        self.latency.mark(trace, 'state')
         
         if has_next:
-            self.sonuc_label.config(text="") # Clear previous result
-            self.tahmin_entry.config(state=tk.NORMAL) # Re-enable input
-            self.tahmin_btn.config(state=tk.NORMAL)
+            self._mark_repaint(trace)
+            self._show_result("") # Clear previous result
+            self._input_locked = False # Re-enable input
+            self._detail_text = None
             
             # Update UI for the new word state (handles joker re-enable)
             self._update_ui()
-            
-            self.tahmin_entry.focus_set()
         else:
             # No more words or game finished
-            self._game_over(self._get_text('all_words_completed'))
+            self._game_over(get_text('all_words_completed'))
     
     def _game_over(self, message):
         """Handle game over"""
-        print("[View] Game Over.") 
+        log.info("Game over.")
+        self.render.action('game_over')
         
         if self.timer_id:
             self.root.after_cancel(self.timer_id)
@@ -1353,184 +1522,71 @@ class KelimeOyunuView:
             
         final_score = 0
         if self.game_service.game_state:
-            self.game_service.game_state.is_running = False
+            self.game_service.end_game()
             final_score = self.game_service.game_state.score
 
         if self.current_username:
-            save_highscore(HIGHSCORE_FILE, self.current_username, final_score, self.current_game_mode)
-            self._update_leaderboard_display() # Refresh leaderboard after saving score
-
-        self.tahmin_entry.config(state=tk.DISABLED)
-        self.tahmin_btn.config(state=tk.DISABLED)
-        self.joker1_btn.config(state=tk.DISABLED)
-        self.joker2_btn.config(state=tk.DISABLED)
+            save_highscore(HIGHSCORE_FILE, self.current_username, final_score, self.current_game_mode) # Leaderboard updates itself
 
-        self.sonuc_label.config(text=message, fg="#1565C0") 
+        self._input_locked = True
+        self.render.invalidate('controls') # Disables input and jokers
+        self._show_result(message, "#1565C0")
         
         final_score_message = self.game_service.get_final_score_message()
+        if self.current_username:
+            percent = self.score_history.percentile(self.current_game_mode, final_score)
+            final_score_message += "\n\n" + get_text('percentile_message', percent=percent)
         self._play_sound("son.mp3") 
-        messagebox.showinfo(self._get_text('game_over'), final_score_message)
+        self.render.flush() # Show the final state before the modal box blocks
+        log.debug("Widget updates per action: %s", self.render.stats())
+        from tkinter import messagebox
+        messagebox.showinfo(get_text('game_over'), final_score_message)
         
-        self._update_header_leaderboard() # Update header leaderboard (e.g. to show new score or clear for next game)
         self.root.after(100, self._return_to_start_screen)
 
-    def _update_info_labels(self):
-        """Update info labels with current text and values"""
-        # Update button texts that might change language FIRST
-        self.tahmin_label.config(text=f"{self._get_text('guess_label')}:")
-        self.tahmin_btn.config(text=self._get_text('guess_button'))
-        # Ensure game_state exists before trying to access hint_count or detail_hint_count
-        hint_count = self.game_service.game_state.hint_count if self.game_service.game_state else 3
-        detail_hint_count = self.game_service.game_state.detail_hint_count if self.game_service.game_state else 1
-        self.joker1_btn.config(text=f"{self._get_text('hint_button')} ({hint_count}/3)")
-        self.joker2_btn.config(text=f"{self._get_text('detail_button')} ({detail_hint_count}/1)")
-
-        # Update labels in the info frame
-        if self.game_service.game_state and self.game_service.game_state.is_running:
-            state = self.game_service.game_state
-            total_words = len(state.flat_words) if state.flat_words else 0
-            self.kelime_index_label.config(text=f"{self._get_text('word_label')}: {state.current_word_index + 1}/{total_words}")
-            self.sure_label.config(text=f"{self._get_text('remaining_time')}: {state.remaining_time}s")
-            self.puan_label.config(text=f"{self._get_text('score')}: {state.score}")
-            
-            if state.current_word:
-                # Use formatted string for word length
-                length_text = self._get_text('word_length_value').format(length=state.current_word.length)
-                self.uzunluk_label.config(text=f"{self._get_text('word_length')}: {length_text}")
-                # Show description only in quiz mode (handled in _update_ui)
-                # desc_text = f"{self._get_text('description')}: {state.current_word.description}" if state.game_mode == 'quiz' else f"{self._get_text('description')}: -"
-                # self.aciklama_label.config(text=desc_text)
-                
-                # Update word display label based on mode, including score for quiz mode
-                if state.game_mode == 'quiz':
-                    word_mode_text = f"{self._get_text('word_label')}: ({state.current_word_score} Puan)"
-                elif state.game_mode == 'anagram':
-                    word_mode_text = f"{self._get_text('unscramble_label', 'Unscramble')}:"
-                else: # Fallback, should not happen with current modes
-                    word_mode_text = f"{self._get_text('word_label')}:"
-                self.word_display_label.config(text=word_mode_text)
-            else: # If no current word (e.g., end of game before UI update)
-                length_text = self._get_text('word_length_value').format(length=0)
-                self.uzunluk_label.config(text=f"{self._get_text('word_length')}: {length_text}")
-                self.aciklama_label.config(text=f"{self._get_text('description')}: ")
-                self.word_display_label.config(text=f"{self._get_text('word_label')}:")
-        else:
-            # Reset labels when no game is active
-            total_words_default = 10 # Or get from config?
-            self.kelime_index_label.config(text=f"{self._get_text('word_label')}: 0/{total_words_default}")
-            self.sure_label.config(text=f"{self._get_text('remaining_time')}: {self.game_service.game_state.time_limit if self.game_service.game_state else 200}s") # Use actual limit if available
-            self.puan_label.config(text=f"{self._get_text('score')}: 0")
-            length_text = self._get_text('word_length_value').format(length=0)
-            self.uzunluk_label.config(text=f"{self._get_text('word_length')}: {length_text}")
-            self.aciklama_label.config(text=f"{self._get_text('description')}: ")
-            self.word_display_label.config(text=f"{self._get_text('word_label')}:")
-
     def _play_sound(self, sound_file_name):
-        """Plays a sound file from the media directory."""
-        try:
-            sound_path = os.path.join("media", sound_file_name)
-            abs_path = os.path.abspath(sound_path)
-            # print(f"[Sound Debug] Attempting to play: {abs_path}") # Debug absolute path
-            exists = os.path.exists(abs_path)
-            # print(f"[Sound Debug] File exists: {exists}") # Debug existence check
-            if exists:
-                # print("[Sound Debug] Calling playsound with block=False...") # Debug
-                # Use block=False for responsiveness
-                playsound(abs_path, block=False) 
-                # print("[Sound Debug] playsound call finished.") # Debug
-            else:
-                print(f"[Sound Error] File not found: {sound_path}")
-        except Exception as e:
-            # Catch potential playsound errors (device issues, format issues)
-            # Including the codec error fix attempt
-            print(f"[Sound Error] Could not play sound '{sound_file_name}': {e}")
-            # If specific utf-8 error, suggest fix or alternative
-            if "codec can't decode byte" in str(e):
-                print(self._get_text('sound_fix_hint')) 
+        """Queues a sound effect from the media directory on the audio engine."""
+        self.audio_engine.play(sound_file_name)
 
     def _return_to_start_screen(self):
         """Hides game area and shows start area, resetting necessary UI components."""
+        self.render.action('start_screen')
         self.game_area_frame.pack_forget()
         self.start_area_frame.pack(pady=20, anchor=tk.CENTER)
-        if hasattr(self, 'sonuc_label'): # Clear game result message
-            self.sonuc_label.config(text="")
-        
-        # Reset word display area
-        if hasattr(self, 'letter_boxes_frame'):
-            for widget in self.letter_boxes_frame.winfo_children():
-                widget.destroy()
-            self.letter_labels.clear()
+        self._show_result("") # Clear game result message
+        self._detail_text = None
         
-        # Reset description label to default (or hide if not applicable to start screen)
-        if hasattr(self, 'aciklama_label'):
-            self.aciklama_label.config(text=f"{self._get_text('description')}: ")
-        
-        # Reset word display label
-        if hasattr(self, 'word_display_label'):
-            self.word_display_label.config(text=f"{self._get_text('word_label')}:")
+        # Reset word display area, description and word label
+        self.render.invalidate('word')
 
         # Ensure guess entry is clear if it wasn't already
-        if hasattr(self, 'tahmin_entry'):
-            self.tahmin_entry.delete(0, tk.END)
-        
-        # Update header leaderboard to reflect no active game mode
-        self._update_header_leaderboard()
+        self.render.after_pass(lambda: self.tahmin_entry.delete(0, tk.END))
 
     def _finish_game_manually(self):
         """Ends the game prematurely by user action after confirmation."""
         if self.game_service.game_state and self.game_service.game_state.is_running:
+            from tkinter import messagebox
             if messagebox.askyesno(
-                self._get_text('finish_game_confirm_title', "Oyunu Bitir?"),
-                self._get_text('finish_game_confirm_message', "Oyunu bitirmek istediğinize emin misiniz? Mevcut puanınız kaydedilecek.")
+                get_text('finish_game_confirm_title', "Oyunu Bitir?"),
+                get_text('finish_game_confirm_message', "Oyunu bitirmek istediğinize emin misiniz? Mevcut puanınız kaydedilecek.")
             ):
-                print("[View] Game ended manually by user.")
+                log.info("Game ended manually by user.")
+                self.render.action('finish_game')
                 if self.timer_id:
                     self.root.after_cancel(self.timer_id)
                     self.timer_id = None
 
                 if self.game_service.game_state: # Ensure game_state still exists
-                    self.game_service.game_state.is_running = False
+                    self.game_service.end_game()
                     final_score = self.game_service.game_state.score
 
                     if self.current_username:
-                        save_highscore(HIGHSCORE_FILE, self.current_username, final_score, self.current_game_mode)
-                        self._update_leaderboard_display()
-                        # Header leaderboard will be updated by _return_to_start_screen
+                        save_highscore(HIGHSCORE_FILE, self.current_username, final_score, self.current_game_mode) # Leaderboard updates itself
                 
                 # Show a brief message on the game screen before transitioning
-                self.sonuc_label.config(text=self._get_text('game_ended_by_user_short', "Oyun sonlandırıldı."), fg="#1565C0")
-                self.root.update_idletasks() # Ensure message is shown
+                self._show_result(get_text('game_ended_by_user_short', "Oyun sonlandırıldı."), "#1565C0")
+                self.render.invalidate('controls')
+                self.render.flush() # Ensure message is shown
                 self.root.after(1500, self._return_to_start_screen) # Delay then go to start screen
             # else: User chose not to finish
         # else: Game not running, or no game state - do nothing or provide feedback if button was somehow active
-
-    def _update_header_leaderboard(self):
-        """Updates the leaderboard display in the header for the current game mode."""
-        widgets_and_titles_modes = [
-            (self.leaderboard_quiz_text_widget, self._get_text('leaderboard_quiz_title'), 'quiz'),
-            (self.leaderboard_anagram_text_widget, self._get_text('leaderboard_anagram_title'), 'anagram')
-        ]
-        scores_data = load_highscores(HIGHSCORE_FILE)
-
-        for txt_widget, title, mode_key in widgets_and_titles_modes:
-            txt_widget.config(state=tk.NORMAL)
-            txt_widget.delete('1.0', tk.END)
-            txt_widget.insert(tk.END, title + "\n", "bold_title")
-
-            mode_scores = []
-            if scores_data:
-                for username, user_game_scores in scores_data.items():
-                    if mode_key in user_game_scores:
-                        mode_scores.append((user_game_scores[mode_key], username))
-            
-            mode_scores.sort(key=lambda x: (-x[0], x[1])) # Sort by score desc, then username asc
-
-            if mode_scores:
-                for i, (score, username) in enumerate(mode_scores[:10]): # Display top 10 for each mode
-                    txt_widget.insert(tk.END, f"{i+1}. {username}: {score}\n", "score_entry")
-            else:
-                if not scores_data: # Overall no scores yet
-                     txt_widget.insert(tk.END, self._get_text('no_highscores_message', "Henüz skor yok.") + "\n", "no_score_message")
-                else: # Scores exist, but not for this specific mode
-                    txt_widget.insert(tk.END, self._get_text('no_scores_for_mode_message', "Bu mod için skor yok.") + "\n", "no_score_message")
-            txt_widget.config(state=tk.DISABLED) 
\ No newline at end of file
@@ -0,0 +1,274 @@
+import os
+import json
+import threading
+from contextlib import contextmanager
+
+if os.name == 'nt':
+    import msvcrt
+else:
+    import fcntl
+
+from applog import get_logger
+
+HIGHSCORE_FILE = "highscores.json"
+COMPACT_LOG_BYTES = 8 * 1024  # Log size at which the log is folded into the snapshot
+MERGE_RETRIES = 3  # Attempts to merge with a snapshot rewritten by a writer that does not lock
+
+# Score writes are O(1) appends to "<file>.log"; the JSON snapshot itself is
+# only rewritten by compact_highscores, in the background, via temp file + rename.
+# Several game instances may share the files, so every write happens under an
+# exclusive lock on "<file>.lock" (in-process threads also share a mutex).
+_locks = {}
+_locks_guard = threading.Lock()
+_listeners = []
+_writes = threading.local()  # Stamps around the append whose listeners are being called
+log = get_logger(__name__)
+
+
+def get_log_path(filepath):
+    """Get the path of the append-only log that belongs to a snapshot file"""
+    return filepath + ".log"
+
+
+def get_write_stamps(filepath):
+    """
+    (stamp before, stamp after) of the append whose listeners are running, or None
+
+    Only meaningful inside a highscore listener: a store whose recorded stamp
+    is the "before" one knows the files hold nothing it has not seen.
+    """
+    stamps = getattr(_writes, 'stamps', None)
+    if stamps and stamps[0] == os.path.abspath(filepath):
+        return stamps[1:]
+    return None
+
+
+def add_highscore_listener(callback):
+    """
+    Register callback(filepath, username, game_mode, score, source), called after each recorded score
+
+    `source` is 'game' for the result of a game played here and 'sync' for a
+    best score merged in from another kiosk.
+    """
+    _listeners.append(callback)
+
+
+def remove_highscore_listener(callback):
+    """Unregister a callback added with add_highscore_listener"""
+    if callback in _listeners:
+        _listeners.remove(callback)
+
+
+def get_highscores_stamp(filepath=HIGHSCORE_FILE):
+    """Cheap fingerprint of the stored scores (snapshot and log mtime/size), used to detect outside changes"""
+    stamp = []
+    for path in (filepath, get_log_path(filepath)):
+        try:
+            st = os.stat(path)
+            stamp.append(f"{st.st_mtime_ns}:{st.st_size}")
+        except FileNotFoundError:
+            stamp.append("-")
+    return "|".join(stamp)
+
+
+def get_lock_path(filepath):
+    """Get the path of the lock file shared by every writer of a snapshot file"""
+    return filepath + ".lock"
+
+
+def _get_lock(filepath):
+    with _locks_guard:
+        return _locks.setdefault(os.path.abspath(filepath), threading.Lock())
+
+
+@contextmanager
+def _locked(filepath):
+    """Hold the in-process mutex and the cross-process file lock of a highscore file"""
+    with _get_lock(filepath):
+        fd = os.open(get_lock_path(filepath), os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if os.name == 'nt':
+                while True:
+                    try:
+                        msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                        break
+                    except OSError:
+                        continue  # LK_LOCK gives up after ~10 seconds, keep waiting
+            else:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if os.name == 'nt':
+                    os.lseek(fd, 0, os.SEEK_SET)
+                    msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+                else:
+                    fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(fd)
+
+
+def _merge_score(scores, username, game_mode, score):
+    """Keep the best score per user and mode, returns True if it changed"""
+    user_scores = scores.setdefault(username, {})
+    if score > user_scores.get(game_mode, -1):  # -1 ensures any score is higher if mode not played
+        user_scores[game_mode] = score
+        return True
+    return False
+
+
+def _read_snapshot(filepath):
+    try:
+        with open(filepath, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}  # Return empty dict if file not found or corrupt
+
+
+def _apply_log(scores, log_path):
+    """Apply the log entries on top of the snapshot, returns the number of bytes read"""
+    try:
+        with open(log_path, 'rb') as f:
+            data = f.read()
+    except FileNotFoundError:
+        return 0
+    for line in data.splitlines():
+        try:
+            entry = json.loads(line.decode('utf-8'))
+            _merge_score(scores, entry['u'], entry['m'], entry['s'])
+        except (ValueError, KeyError, TypeError):
+            continue  # Torn line from a crash mid-write
+    return len(data)
+
+
+def load_highscores(filepath=HIGHSCORE_FILE):
+    """Load high scores from the JSON snapshot plus the log tail."""
+    # The log is read before the snapshot: a compaction running in between
+    # then only makes the snapshot a superset of the log, nothing is missed.
+    log_scores = {}
+    _apply_log(log_scores, get_log_path(filepath))
+    scores = _read_snapshot(filepath)
+    for username, user_scores in log_scores.items():
+        for game_mode, score in user_scores.items():
+            _merge_score(scores, username, game_mode, score)
+    return scores
+
+
+def save_highscore(filepath, username, score, game_mode, source='game'):
+    """Record a score for a user and game mode; only the best one per mode is kept."""
+    if not username or not username.strip(): # Don't save if username is empty or just whitespace
+        log.warning("Username is empty, score not saved.")
+        return
+
+    if save_highscores(filepath, [(username, game_mode, score)], source=source):
+        log.info("Score recorded", extra={'fields': {'user': username, 'mode': game_mode, 'score': score}})
+
+
+def save_highscores(filepath, entries, source='sync'):
+    """Record many (username, game_mode, score) entries with a single append, returns True on success"""
+    lines = [json.dumps({'u': username, 'm': game_mode, 's': score}, ensure_ascii=False, separators=(',', ':'))
+             for username, game_mode, score in entries]
+    if not lines:
+        return True
+    try:
+        with _locked(filepath):
+            stamp_before = get_highscores_stamp(filepath)
+            with open(get_log_path(filepath), 'a', encoding='utf-8') as f:
+                f.write("\n".join(lines) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+                needs_compaction = f.tell() >= COMPACT_LOG_BYTES
+            stamp_after = get_highscores_stamp(filepath)
+    except Exception as e:
+        log.error("Error saving high score: %s", e)
+        return False
+
+    _writes.stamps = (os.path.abspath(filepath), stamp_before, stamp_after)
+    try:
+        for username, game_mode, score in entries:
+            for callback in list(_listeners):
+                try:
+                    callback(filepath, username, game_mode, score, source)
+                except Exception as e:
+                    log.exception("Listener error: %s", e)
+    finally:
+        _writes.stamps = None
+
+    if needs_compaction:
+        threading.Thread(target=compact_highscores, args=(filepath,),
+                         name="highscore-compaction", daemon=True).start()
+    return True
+
+
+def compact_highscores(filepath=HIGHSCORE_FILE):
+    """Fold the log into the snapshot (temp file + atomic rename) and drop the folded entries"""
+    log_path = get_log_path(filepath)
+    with _locked(filepath):
+        scores = _read_snapshot(filepath)
+        folded_bytes = _apply_log(scores, log_path)
+        if not folded_bytes:
+            return
+        try:
+            for _ in range(MERGE_RETRIES):
+                stamp = _file_stamp(filepath)
+                tmp_path = filepath + ".tmp"
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(scores, f, ensure_ascii=False, indent=4)
+                    f.flush()
+                    os.fsync(f.fileno())
+                if _file_stamp(filepath) == stamp:
+                    break
+                # The snapshot was rewritten behind our back (e.g. by an older
+                # version that does not take the lock): merge it in and retry.
+                for username, user_scores in _read_snapshot(filepath).items():
+                    for game_mode, score in user_scores.items():
+                        _merge_score(scores, username, game_mode, score)
+            os.replace(tmp_path, filepath)
+
+            # A crash before this point only means the log is applied twice,
+            # which is harmless because merging keeps the maximum.
+            with open(log_path, 'rb') as f:
+                f.seek(folded_bytes)
+                tail = f.read()
+            tmp_log_path = log_path + ".tmp"
+            with open(tmp_log_path, 'wb') as f:
+                f.write(tail)
+            os.replace(tmp_log_path, log_path)
+            log.info("Compacted %d bytes of log into %s", folded_bytes, filepath)
+        except Exception as e:
+            log.error("Error compacting high scores: %s", e)
+
+
+def rewrite_highscores(filepath, transform):
+    """
+    Replace every stored score with transform(scores), e.g. for a bulk migration
+
+    The log is folded in first and emptied afterwards, all under the lock, so
+    no concurrent save is lost. Listeners are not notified; the stores pick
+    the change up from the new stamp. Returns True on success.
+    """
+    log_path = get_log_path(filepath)
+    try:
+        with _locked(filepath):
+            scores = _read_snapshot(filepath)
+            _apply_log(scores, log_path)
+            scores = transform(scores)
+            tmp_path = filepath + ".tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(scores, f, ensure_ascii=False, indent=4)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, filepath)
+            open(log_path, 'w').close()
+        return True
+    except Exception as e:
+        log.error("Error rewriting high scores: %s", e)
+        return False
+
+
+def _file_stamp(path):
+    try:
+        st = os.stat(path)
+        return st.st_mtime_ns, st.st_size
+    except FileNotFoundError:
+        return None
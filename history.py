@@ -0,0 +1,191 @@
+import os
+import math
+import json
+import time
+import random
+import sqlite3
+import threading
+
+from highscores import HIGHSCORE_FILE, load_highscores, add_highscore_listener, remove_highscore_listener
+from leaderboard import LEADERBOARD_DB_FILE
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS history (
+    username TEXT NOT NULL,
+    mode     TEXT NOT NULL,
+    ts       INTEGER NOT NULL,
+    score    INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_history_user_mode_ts ON history (username, mode, ts);
+CREATE TABLE IF NOT EXISTS sketches (
+    mode TEXT PRIMARY KEY,
+    data TEXT NOT NULL
+);
+"""
+
+
+class KLLSketch:
+    """
+    KLL streaming quantile sketch
+
+    Keeps a bounded number of samples in a stack of compactors; when a level
+    is full it is sorted and every other item is promoted to the next level
+    with twice the weight. Updates are amortized O(1), memory is O(k log n)
+    and two sketches merge into one with the same guarantees.
+    """
+
+    def __init__(self, k=200, c=2 / 3):
+        self.k = k
+        self.c = c
+        self.compactors = [[]]
+        self.n = 0
+        self._size = 0
+        self._max_size = self._capacity(0)
+
+    def _capacity(self, height):
+        depth = len(self.compactors) - height - 1
+        return int(math.ceil(self.c ** depth * self.k)) + 1
+
+    def update(self, value):
+        """Add one observation"""
+        self.compactors[0].append(value)
+        self.n += 1
+        self._size += 1
+        if self._size >= self._max_size:
+            self._compress()
+
+    def _compress(self):
+        for height in range(len(self.compactors)):
+            if len(self.compactors[height]) >= self._capacity(height):
+                if height + 1 >= len(self.compactors):
+                    self.compactors.append([])
+                level = sorted(self.compactors[height])
+                self.compactors[height + 1].extend(level[random.randint(0, 1)::2])
+                self.compactors[height] = []
+                self._size = sum(len(level) for level in self.compactors)
+                if self._size < self._max_size:
+                    break
+        self._max_size = sum(self._capacity(h) for h in range(len(self.compactors)))
+
+    def merge(self, other):
+        """Merge another sketch into this one"""
+        while len(self.compactors) < len(other.compactors):
+            self.compactors.append([])
+        for height, level in enumerate(other.compactors):
+            self.compactors[height].extend(level)
+        self.n += other.n
+        self._size = sum(len(level) for level in self.compactors)
+        self._max_size = sum(self._capacity(h) for h in range(len(self.compactors)))
+        if self._size >= self._max_size:
+            self._compress()
+
+    def rank(self, value):
+        """Estimated number of observations strictly below `value`"""
+        return sum((1 << height) * sum(1 for item in level if item < value)
+                   for height, level in enumerate(self.compactors))
+
+    def fraction_below(self, value):
+        """Estimated fraction of observations strictly below `value`"""
+        if not self.n:
+            return 0.0
+        total_weight = sum((1 << height) * len(level) for height, level in enumerate(self.compactors))
+        return self.rank(value) / total_weight if total_weight else 0.0
+
+    def to_dict(self):
+        return {'k': self.k, 'c': self.c, 'n': self.n, 'compactors': self.compactors}
+
+    @classmethod
+    def from_dict(cls, data):
+        sketch = cls(k=data['k'], c=data['c'])
+        sketch.compactors = [list(level) for level in data['compactors']] or [[]]
+        sketch.n = data['n']
+        sketch._size = sum(len(level) for level in sketch.compactors)
+        sketch._max_size = sum(sketch._capacity(h) for h in range(len(sketch.compactors)))
+        return sketch
+
+
+class ScoreHistory:
+    """
+    Every game result per user and mode, plus a percentile sketch per mode
+
+    Results are kept as (username, mode, timestamp, score) rows indexed by
+    user and mode. Percentile ranks come from a KLL sketch per mode that is
+    updated with each game, so a rank never has to scan the history.
+    """
+
+    def __init__(self, db_path=LEADERBOARD_DB_FILE, highscore_file=HIGHSCORE_FILE):
+        self.db_path = db_path
+        self.highscore_file = highscore_file
+        self._lock = threading.Lock()
+        self._sketches = {}
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.executescript(SCHEMA)
+        add_highscore_listener(self._on_highscore_saved)
+
+    def _sketch(self, mode):
+        """Return the sketch of a mode, loading or seeding it on first use"""
+        sketch = self._sketches.get(mode)
+        if sketch is None:
+            sketch = self._sketches[mode] = self._load_sketch(mode)
+        return sketch
+
+    def _load_sketch(self, mode):
+        """Read the stored sketch of a mode"""
+        row = self.conn.execute("SELECT data FROM sketches WHERE mode = ?", (mode,)).fetchone()
+        if row:
+            return KLLSketch.from_dict(json.loads(row[0]))
+        # No games recorded yet: start from the best scores we already know
+        sketch = KLLSketch()
+        for user_scores in load_highscores(self.highscore_file).values():
+            if mode in user_scores:
+                sketch.update(user_scores[mode])
+        return sketch
+
+    def _on_highscore_saved(self, filepath, username, game_mode, score, source='game'):
+        # Scores merged from other kiosks are best scores, not new games
+        if source == 'game' and os.path.abspath(filepath) == os.path.abspath(self.highscore_file):
+            self.record(username, game_mode, score)
+
+    def record(self, username, mode, score, timestamp=None):
+        """Store one game result and add it to the mode's sketch"""
+        with self._lock, self.conn:
+            # Other game instances write the same row: take the write lock before
+            # reading it, so their games are kept rather than overwritten
+            self.conn.execute("BEGIN IMMEDIATE")
+            sketch = self._sketches[mode] = self._load_sketch(mode)
+            sketch.update(score)
+            self.conn.execute(
+                "INSERT INTO history (username, mode, ts, score) VALUES (?, ?, ?, ?)",
+                (username, mode, int(timestamp if timestamp is not None else time.time()), score)
+            )
+            self.conn.execute(
+                "INSERT OR REPLACE INTO sketches (mode, data) VALUES (?, ?)",
+                (mode, json.dumps(sketch.to_dict(), separators=(',', ':')))
+            )
+
+    def history(self, username, mode, limit=None):
+        """Return a user's results in a mode as (timestamp, score), oldest first"""
+        query = "SELECT ts, score FROM history WHERE username = ? AND mode = ? ORDER BY ts"
+        params = (username, mode)
+        if limit is not None:
+            query = ("SELECT ts, score FROM (SELECT ts, score FROM history WHERE username = ? AND mode = ? "
+                     "ORDER BY ts DESC LIMIT ?) ORDER BY ts")
+            params = (username, mode, limit)
+        return self.conn.execute(query, params).fetchall()
+
+    def percentile(self, mode, score):
+        """Percentage (0-100) of recorded games in a mode that scored below `score`"""
+        with self._lock:
+            return int(round(100 * self._sketch(mode).fraction_below(score)))
+
+    def rename_users(self, renamed):
+        """Move the games of merged usernames ({old: new}) to the kept spelling"""
+        if not renamed:
+            return
+        with self._lock, self.conn:
+            self.conn.executemany("UPDATE history SET username = ? WHERE username = ?",
+                                  [(new, old) for old, new in renamed.items()])
+
+    def close(self):
+        remove_highscore_listener(self._on_highscore_saved)
+        self.conn.close()
@@ -0,0 +1,216 @@
+"""
+Input-to-feedback latency
+-------------------------
+Each player action (a guess, a joker click, a word transition) opens a
+trace when its handler starts. The stages of the feedback are then marked
+on it as they happen, in milliseconds since the handler started:
+
+  guess        score, sound, repaint
+  hint         score, repaint
+  detail_hint  score, repaint
+  next_word    state, repaint
+
+'sound' is marked by the audio thread when the effect starts playing, and
+'repaint' once Tk has redrawn the widgets updated for the action. The last
+SAMPLES traces of every action are kept for the developer overlay
+(Ctrl+Shift+D in the game window) and can be exported as CSV
+(Ctrl+Shift+E), one row per trace, into ~/.kelime_oyunu/latency/.
+"""
+import os
+import csv
+import math
+import time
+import threading
+import tkinter as tk
+from collections import deque
+
+from config import get_app_dir
+from applog import get_logger
+
+log = get_logger(__name__)
+
+SAMPLES = 500        # Traces kept per action
+TRACE_TIMEOUT = 5.0  # Seconds after which a trace missing a stage is kept as it is
+
+ACTION_STAGES = {
+    'guess': ('score', 'sound', 'repaint'),
+    'hint': ('score', 'repaint'),
+    'detail_hint': ('score', 'repaint'),
+    'next_word': ('state', 'repaint'),
+}
+
+
+class Trace:
+    """Stage timings of one action"""
+
+    __slots__ = ('action', 'started_at', 'start', 'expected', 'stages', 'sound')
+
+    def __init__(self, action, expected):
+        self.action = action
+        self.started_at = time.time()
+        self.start = time.perf_counter()
+        self.expected = set(expected)
+        self.stages = {}  # stage -> ms since start
+        self.sound = None  # Effect file whose start is the 'sound' stage
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values), max(1, math.ceil(fraction * len(sorted_values)))) - 1
+    return sorted_values[index]
+
+
+class LatencyTracker:
+    """Collects action traces; safe to mark from the audio thread"""
+
+    def __init__(self, samples=SAMPLES):
+        self._lock = threading.Lock()
+        self._open = []  # Traces still waiting for a stage
+        self._done = {}  # action -> deque of finished traces
+        self.samples = samples
+
+    def begin(self, action):
+        """Start a trace for `action`, at the start of its handler"""
+        expected = [stage for stage in ACTION_STAGES.get(action, ('repaint',)) if stage != 'sound']
+        trace = Trace(action, expected)
+        with self._lock:
+            self._expire(trace.start)
+            self._open.append(trace)
+        return trace
+
+    def expect_sound(self, trace, file_name):
+        """The trace waits for the effect `file_name` to start (call before playing it)"""
+        with self._lock:
+            trace.sound = file_name
+            trace.expected.add('sound')
+
+    def mark(self, trace, stage):
+        """Record that `stage` of `trace` happened now (first mark of a stage wins)"""
+        if trace is None:
+            return
+        elapsed = (time.perf_counter() - trace.start) * 1000
+        with self._lock:
+            if stage in trace.stages:
+                return
+            trace.stages[stage] = elapsed
+            if trace.expected.issubset(trace.stages) and trace in self._open:
+                self._open.remove(trace)
+                self._finish(trace)
+
+    def on_sound_started(self, file_name, seconds=None):
+        """AudioEngine effect listener: marks 'sound' on the oldest trace waiting for this effect"""
+        with self._lock:
+            trace = next((t for t in self._open if t.sound == file_name and 'sound' not in t.stages), None)
+        self.mark(trace, 'sound')
+
+    def _expire(self, now):
+        for trace in [t for t in self._open if now - t.start > TRACE_TIMEOUT]:
+            self._open.remove(trace)
+            self._finish(trace)
+
+    def _finish(self, trace):
+        done = self._done.get(trace.action)
+        if done is None:
+            done = self._done[trace.action] = deque(maxlen=self.samples)
+        done.append(trace)
+        log.debug("%s latency: %s", trace.action,
+                  ", ".join(f"{stage} {ms:.1f} ms" for stage, ms in sorted(trace.stages.items(), key=lambda s: s[1])))
+
+    def traces(self):
+        with self._lock:
+            return {action: list(done) for action, done in self._done.items()}
+
+    def summary(self):
+        """{action: {stage: (count, p50, p90, p99, max)}} over the kept traces"""
+        result = {}
+        for action, traces in self.traces().items():
+            stages = {}
+            for stage in ACTION_STAGES.get(action, ('repaint',)):
+                values = sorted(t.stages[stage] for t in traces if stage in t.stages)
+                if values:
+                    stages[stage] = (len(values), percentile(values, 0.5), percentile(values, 0.9),
+                                     percentile(values, 0.99), values[-1])
+            result[action] = stages
+        return result
+
+    def export_csv(self, path=None):
+        """Write every kept trace as a CSV row, returns the path"""
+        if path is None:
+            directory = get_app_dir() / "latency"
+            os.makedirs(str(directory), exist_ok=True)
+            path = directory / time.strftime("latency-%Y%m%d-%H%M%S.csv")
+        stages = []
+        for action_stages in ACTION_STAGES.values():
+            stages.extend(stage for stage in action_stages if stage not in stages)
+        with open(str(path), 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(['action', 'started_at'] + [f"{stage}_ms" for stage in stages])
+            for action, traces in self.traces().items():
+                for trace in traces:
+                    writer.writerow([action, time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(trace.started_at))]
+                                    + [f"{trace.stages[stage]:.2f}" if stage in trace.stages else ""
+                                       for stage in stages])
+        log.info("Latency traces exported to %s", path)
+        return path
+
+
+class LatencyOverlay:
+    """Developer overlay in the corner of the window with per-action latency percentiles"""
+
+    REFRESH_MS = 1000
+
+    def __init__(self, root, tracker, render=None):
+        self.root = root
+        self.tracker = tracker
+        self.render = render  # RenderScheduler, for the widget updates per action
+        self.label = None
+        self._job = None
+
+    @property
+    def visible(self):
+        return self.label is not None
+
+    def toggle(self):
+        if self.visible:
+            self.hide()
+        else:
+            self.show()
+
+    def show(self):
+        if self.label is None:
+            self.label = tk.Label(self.root, font=("Courier", 11), justify=tk.LEFT, anchor=tk.NW,
+                                  bg="#000000", fg="#00FF00", padx=8, pady=6)
+            self.label.place(relx=1.0, x=-10, y=10, anchor=tk.NE)
+        if self._job is None:
+            self._refresh()
+
+    def hide(self):
+        if self._job:
+            self.root.after_cancel(self._job)
+            self._job = None
+        if self.label is not None:
+            self.label.destroy()
+            self.label = None
+
+    def _refresh(self):
+        self._job = None
+        if self.label is None:
+            return
+        self.label.configure(text=self.format())
+        self.label.lift()
+        self._job = self.root.after(self.REFRESH_MS, self._refresh)
+
+    def format(self):
+        lines = ["latency ms       n    p50    p90    p99    max"]
+        for action, stages in sorted(self.tracker.summary().items()):
+            lines.append(action)
+            for stage, (count, p50, p90, p99, worst) in stages.items():
+                lines.append(f"  {stage:<12}{count:>5}{p50:>7.1f}{p90:>7.1f}{p99:>7.1f}{worst:>7.1f}")
+        if self.render is not None:
+            lines.append("widget options per pass (sent/requested)")
+            for action, stats in sorted(self.render.stats().items()):
+                lines.append(f"  {action:<18}{stats['options']:>6.1f} /{stats['requested']:>6.1f}")
+        lines.append("Ctrl+Shift+E: export CSV")
+        return "\n".join(lines)
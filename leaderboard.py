@@ -0,0 +1,374 @@
+import os
+import bisect
+import sqlite3
+import threading
+
+from highscores import (HIGHSCORE_FILE, load_highscores, get_highscores_stamp, get_write_stamps,
+                        add_highscore_listener, remove_highscore_listener)
+from usernames import turkish_lower
+from applog import get_logger
+
+log = get_logger(__name__)
+
+LEADERBOARD_DB_FILE = "leaderboard.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scores (
+    username TEXT NOT NULL,
+    mode     TEXT NOT NULL,
+    score    INTEGER NOT NULL,
+    PRIMARY KEY (username, mode)
+);
+CREATE INDEX IF NOT EXISTS idx_scores_mode_rank ON scores (mode, score DESC, username);
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+class LeaderboardStore:
+    """
+    SQLite-backed leaderboard, indexed on (mode, score DESC, username)
+
+    highscores.json stays the record of truth; this store mirrors it through
+    a highscore listener so leaderboard queries never load or sort the whole
+    file. The files' stamp is recorded after each of our own writes; when it
+    does not match on the next launch (first run, another instance or a bulk
+    rewrite changed them), import_async() re-imports them on a background
+    thread.
+    """
+
+    def __init__(self, db_path=LEADERBOARD_DB_FILE, highscore_file=HIGHSCORE_FILE):
+        self.db_path = db_path
+        self.highscore_file = highscore_file
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.executescript(SCHEMA)
+        add_highscore_listener(self._on_highscore_saved)
+
+    def _get_meta(self, key, conn=None):
+        row = (conn or self.conn).execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key, value, conn=None):
+        (conn or self.conn).execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    def is_stale(self):
+        """Return True if the JSON files changed since the store last saw them"""
+        return get_highscores_stamp(self.highscore_file) != self._get_meta('source_stamp')
+
+    def import_async(self):
+        """Re-import highscores.json (and its log) on a background thread, returns the thread"""
+        thread = threading.Thread(target=self._migrate_from_json, name="leaderboard-import", daemon=True)
+        thread.start()
+        return thread
+
+    def _migrate_from_json(self):
+        """Import highscores.json (and its log) if it changed since the last import"""
+        # A connection of its own: the UI thread keeps querying self.conn meanwhile
+        conn = sqlite3.connect(self.db_path)
+        try:
+            while True:
+                stamp = get_highscores_stamp(self.highscore_file)
+                if stamp == self._get_meta('source_stamp', conn):
+                    return
+                scores = load_highscores(self.highscore_file)
+                rows = [(username, mode, score)
+                        for username, user_scores in scores.items()
+                        for mode, score in user_scores.items()]
+                with self._lock, conn:
+                    if get_highscores_stamp(self.highscore_file) != stamp:
+                        continue  # A score was saved while loading, load again
+                    # highscores.json is the source of truth: rows merged or renamed there must go
+                    conn.execute("DELETE FROM scores")
+                    self._upsert_many(rows, conn)
+                    self._set_meta('source_stamp', stamp, conn)
+                log.info("Imported %d scores from %s", len(rows), self.highscore_file)
+                return
+        except (OSError, sqlite3.Error) as e:
+            log.error("Error importing %s: %s", self.highscore_file, e)
+        finally:
+            conn.close()
+
+    def _upsert_many(self, rows, conn=None):
+        (conn or self.conn).executemany(
+            "INSERT INTO scores (username, mode, score) VALUES (?, ?, ?) "
+            "ON CONFLICT (username, mode) DO UPDATE SET score = excluded.score "
+            "WHERE excluded.score > scores.score",
+            rows
+        )
+
+    def _on_highscore_saved(self, filepath, username, game_mode, score, source='game'):
+        if os.path.abspath(filepath) == os.path.abspath(self.highscore_file):
+            self.submit(username, game_mode, score)
+
+    def submit(self, username, mode, score):
+        """Store a score, keeping only the best one per user and mode"""
+        with self._lock, self.conn:
+            self._upsert_many([(username, mode, score)])
+            # Our own append moves the stamp along; anything else in between
+            # (another instance, a compaction) leaves it for the next import
+            stamps = get_write_stamps(self.highscore_file)
+            if stamps and self._get_meta('source_stamp') in stamps:
+                self._set_meta('source_stamp', stamps[1])
+
+    def has_scores(self):
+        """Return True if any score has been recorded, in any mode"""
+        return self.conn.execute("SELECT 1 FROM scores LIMIT 1").fetchone() is not None
+
+    def top(self, mode, n=10):
+        """Return the best n entries of a mode as (score, username), best first"""
+        return self.conn.execute(
+            "SELECT score, username FROM scores WHERE mode = ? "
+            "ORDER BY score DESC, username ASC LIMIT ?",
+            (mode, n)
+        ).fetchall()
+
+    def entries(self, mode):
+        """Return every entry of a mode as (score, username), best first"""
+        return self.conn.execute(
+            "SELECT score, username FROM scores WHERE mode = ? "
+            "ORDER BY score DESC, username ASC",
+            (mode,)
+        ).fetchall()
+
+    def get_score(self, username, mode):
+        row = self.conn.execute(
+            "SELECT score FROM scores WHERE username = ? AND mode = ?", (username, mode)
+        ).fetchone()
+        return row[0] if row else None
+
+    def rank_of(self, username, mode):
+        """Return the 1-based rank of a user in a mode, or None if they have no score"""
+        score = self.get_score(username, mode)
+        if score is None:
+            return None
+        # SQLite has no counted B-trees, so this counts the covering index
+        # entries ranked above the user without touching the table itself.
+        (above,) = self.conn.execute(
+            "SELECT COUNT(*) FROM scores WHERE mode = ? "
+            "AND (score > ? OR (score = ? AND username < ?))",
+            (mode, score, score, username)
+        ).fetchone()
+        return above + 1
+
+    def around(self, username, mode, radius=2):
+        """Return up to `radius` entries above and below a user as (rank, score, username)"""
+        rank = self.rank_of(username, mode)
+        if rank is None:
+            return []
+        score = self.get_score(username, mode)
+        above = self.conn.execute(
+            "SELECT score, username FROM scores WHERE mode = ? "
+            "AND (score > ? OR (score = ? AND username < ?)) "
+            "ORDER BY score ASC, username DESC LIMIT ?",
+            (mode, score, score, username, radius)
+        ).fetchall()
+        below = self.conn.execute(
+            "SELECT score, username FROM scores WHERE mode = ? "
+            "AND (score < ? OR (score = ? AND username > ?)) "
+            "ORDER BY score DESC, username ASC LIMIT ?",
+            (mode, score, score, username, radius)
+        ).fetchall()
+        entries = [(rank - i - 1, s, u) for i, (s, u) in enumerate(above)][::-1]
+        entries.append((rank, score, username))
+        entries.extend((rank + i + 1, s, u) for i, (s, u) in enumerate(below))
+        return entries
+
+    def close(self):
+        remove_highscore_listener(self._on_highscore_saved)
+        self.conn.close()
+
+
+class ModeLeaderboard:
+    """Sorted in-memory leaderboard of one game mode"""
+
+    def __init__(self, mode, entries=()):
+        self.mode = mode
+        self._scores = {username: score for score, username in entries}
+        # Keys sort best first: score descending, then username ascending
+        self._keys = sorted((-score, username) for username, score in self._scores.items())
+        self._names = None  # (folded username, username) sorted, built by the first search
+        self.version = 0  # Bumped on every change, so views can tell when their ranks went stale
+
+    def __len__(self):
+        return len(self._keys)
+
+    def submit(self, username, score):
+        """Apply a score, returns the old and new rank (0-based) or None if nothing changed"""
+        old_score = self._scores.get(username)
+        if old_score is not None and score <= old_score:
+            return None
+        old_rank = None
+        if old_score is not None:
+            old_rank = bisect.bisect_left(self._keys, (-old_score, username))
+            del self._keys[old_rank]
+        key = (-score, username)
+        new_rank = bisect.bisect_left(self._keys, key)
+        self._keys.insert(new_rank, key)
+        self._scores[username] = score
+        self.version += 1
+        if old_score is None and self._names is not None:
+            bisect.insort(self._names, (turkish_lower(username), username))
+        return old_rank, new_rank
+
+    def top(self, n=10):
+        """Return the best n entries as (score, username)"""
+        return [(-neg_score, username) for neg_score, username in self._keys[:n]]
+
+    def get_score(self, username):
+        return self._scores.get(username)
+
+    def rank_of(self, username):
+        """Return the 1-based rank of a user, or None if they have no score"""
+        score = self._scores.get(username)
+        if score is None:
+            return None
+        return bisect.bisect_left(self._keys, (-score, username)) + 1
+
+    def page(self, start, count):
+        """Return `count` entries from the 1-based rank `start` as (rank, score, username)"""
+        first = max(start, 1) - 1
+        return [(first + i + 1, -neg_score, username)
+                for i, (neg_score, username) in enumerate(self._keys[first:first + count])]
+
+    def build_name_index(self):
+        """Sort the usernames for prefix search; done by the first search if not called before"""
+        if self._names is None:
+            self._names = sorted((turkish_lower(username), username) for username in self._scores)
+
+    def search(self, prefix):
+        """Return the usernames starting with `prefix` (case-insensitive), best first"""
+        self.build_name_index()
+        folded = turkish_lower(prefix)
+        # Every folded name with the prefix sorts between the prefix and the prefix followed by the last code point
+        lo = bisect.bisect_left(self._names, (folded,))
+        hi = bisect.bisect_left(self._names, (folded + '\U0010ffff',), lo)
+        if hi - lo == len(self._keys):
+            return [username for _, username in self._keys]
+        if (hi - lo) * 8 < len(self._keys):
+            return sorted((username for _, username in self._names[lo:hi]),
+                          key=lambda username: (-self._scores[username], username))
+        # A short prefix matches a large part of the board: one pass in rank order is cheaper
+        matches = {username for _, username in self._names[lo:hi]}
+        return [username for _, username in self._keys if username in matches]
+
+
+class LeaderboardModel:
+    """
+    In-process leaderboard shared by every leaderboard widget
+
+    Each mode is loaded once (from the SQLite store, or from highscores.json
+    when no store is given) and then kept up to date incrementally from the
+    highscore listener. Subscribers are only called when the visible top of
+    a mode actually changes; watchers (full views) on every change.
+    """
+
+    def __init__(self, store=None, highscore_file=HIGHSCORE_FILE, visible=10):
+        self.store = store
+        self.highscore_file = store.highscore_file if store is not None else highscore_file
+        self.visible = visible
+        self._modes = {}
+        self._subscribers = []
+        self._watchers = []
+        self._json_scores = None
+        if store is not None:
+            self._has_scores = store.has_scores()
+        else:
+            self._json_scores = load_highscores(highscore_file)
+            self._has_scores = bool(self._json_scores)
+        add_highscore_listener(self._on_highscore_saved)
+
+    def mode(self, mode):
+        """Return the ModeLeaderboard of a game mode, loading it on first use"""
+        board = self._modes.get(mode)
+        if board is None:
+            if self.store is not None:
+                entries = self.store.entries(mode)
+            else:
+                entries = [(user_scores[mode], username)
+                           for username, user_scores in self._json_scores.items()
+                           if mode in user_scores]
+            board = self._modes[mode] = ModeLeaderboard(mode, entries)
+        return board
+
+    def has_scores(self):
+        """Return True if any score has been recorded, in any mode"""
+        return self._has_scores
+
+    def import_async(self, root, interval_ms=100):
+        """Bring the store up to date with highscores.json off the UI thread, then reload the loaded modes"""
+        if self.store is None or not self.store.is_stale():
+            return
+        thread = self.store.import_async()
+
+        def check():
+            if thread.is_alive():
+                root.after(interval_ms, check)
+            else:
+                self.reload()
+        root.after(interval_ms, check)
+
+    def reload(self):
+        """Drop the loaded modes and notify subscribers with the reloaded tops"""
+        modes = list(self._modes)
+        self._modes = {}
+        if self.store is not None:
+            self._has_scores = self.store.has_scores()
+        else:
+            self._json_scores = load_highscores(self.highscore_file)
+            self._has_scores = bool(self._json_scores)
+        for mode in modes:
+            self._notify(mode)
+            for callback in list(self._watchers):
+                callback(mode)
+
+    def top(self, mode, n=None):
+        return self.mode(mode).top(n or self.visible)
+
+    def subscribe(self, callback):
+        """Register callback(mode, top_entries), called when the visible top of a mode changes"""
+        self._subscribers.append(callback)
+
+    def unsubscribe(self, callback):
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+
+    def watch(self, callback):
+        """Register callback(mode), called whenever any score of a mode changes"""
+        self._watchers.append(callback)
+
+    def unwatch(self, callback):
+        if callback in self._watchers:
+            self._watchers.remove(callback)
+
+    def submit(self, username, mode, score):
+        """Apply a score and notify subscribers if the visible top changed"""
+        first_score = not self._has_scores
+        self._has_scores = True
+        change = self.mode(mode).submit(username, score)
+        if first_score:
+            # Every loaded mode switches from "no scores yet" to "no scores for this mode"
+            for other_mode in list(self._modes):
+                if other_mode != mode:
+                    self._notify(other_mode)
+        if change is None:
+            return
+        for callback in list(self._watchers):
+            callback(mode)
+        old_rank, new_rank = change
+        if new_rank < self.visible or (old_rank is not None and old_rank < self.visible):
+            self._notify(mode)
+
+    def _notify(self, mode):
+        top = self.top(mode)
+        for callback in list(self._subscribers):
+            callback(mode, top)
+
+    def _on_highscore_saved(self, filepath, username, game_mode, score, source='game'):
+        if os.path.abspath(filepath) == os.path.abspath(self.highscore_file):
+            self.submit(username, game_mode, score)
+
+    def close(self):
+        remove_highscore_listener(self._on_highscore_saved)
@@ -0,0 +1,282 @@
+"""
+Full leaderboard browser
+------------------------
+A window listing every player of a game mode. The list is virtual: the
+canvas holds one pooled row of items per visible line, and scrolling only
+re-labels those rows with the entries now in view, so the cost of a frame
+does not depend on the number of players.
+
+Typing in the search field narrows the list to the usernames starting with
+the typed text (through the leaderboard's name index), the page buttons and
+PageUp/PageDown move a screen at a time, and "my rank" scrolls to the
+current player.
+"""
+import tkinter as tk
+from tkinter import font
+
+from localization import get_text
+from applog import get_logger
+
+log = get_logger(__name__)
+
+MODES = (('quiz', 'quiz_mode_label'), ('anagram', 'anagram_mode_label'))
+
+
+class LeaderboardBrowser:
+    """Searchable, virtualized view of a LeaderboardModel"""
+
+    ROWS = 15
+    SEARCH_DELAY_MS = 150
+
+    def __init__(self, parent, leaderboard, theme_engine, username=None, mode='quiz'):
+        self.leaderboard = leaderboard
+        self.theme_engine = theme_engine
+        self.username = username
+        self.mode = tk.StringVar(value=mode)
+        self.first = 0          # Index of the top visible row in the current list
+        self.results = None     # Usernames matching the search, best first; None for the whole board
+        self._results_version = None  # (board, version) the results were ranked against
+        self._refresh_job = None
+        self._search_job = None
+        self._search_text = ""
+        self._drawn = [None] * self.ROWS  # Last (rank, score, username, highlighted) per row
+
+        self.window = tk.Toplevel(parent)
+        self.window.transient(parent)
+        self.window.resizable(False, False)
+        theme_engine.register(self.window, 'root')
+        self.row_font = font.Font(family="Arial", size=16)
+        self.row_height = self.row_font.metrics('linespace') + 8
+        self._create_widgets()
+        self._refresh_texts()
+
+        self.leaderboard.watch(self._on_leaderboard_changed)
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
+        self.window.after_idle(self._board().build_name_index) # Ready before the first keystroke
+        self.redraw()
+        self.search_entry.focus_set()
+
+    def _create_widgets(self):
+        top_frame = tk.Frame(self.window, padx=10, pady=10)
+        self.theme_engine.register(top_frame, 'background')
+        top_frame.pack(fill=tk.X)
+
+        self.mode_buttons = []
+        for mode, _ in MODES:
+            button = tk.Radiobutton(top_frame, variable=self.mode, value=mode, font=self.row_font,
+                                    command=self._on_mode_changed)
+            self.theme_engine.register(button, 'label')
+            button.pack(side=tk.LEFT, padx=(0, 10))
+            self.mode_buttons.append(button)
+
+        self.search_entry = tk.Entry(top_frame, font=self.row_font, width=18)
+        self.theme_engine.register(self.search_entry, 'entry')
+        self.search_entry.pack(side=tk.RIGHT)
+        self.search_entry.bind("<KeyRelease>", self._on_search_typed)
+        self.search_label = tk.Label(top_frame, font=self.row_font)
+        self.theme_engine.register(self.search_label, 'label')
+        self.search_label.pack(side=tk.RIGHT, padx=5)
+
+        list_frame = tk.Frame(self.window, padx=10)
+        self.theme_engine.register(list_frame, 'background')
+        list_frame.pack(fill=tk.BOTH)
+        self.width = 560
+        self.canvas = tk.Canvas(list_frame, width=self.width, height=self.ROWS * self.row_height,
+                                highlightthickness=0, borderwidth=0)
+        self.canvas.pack(side=tk.LEFT)
+        self.scrollbar = tk.Scrollbar(list_frame, orient=tk.VERTICAL, command=self._on_scrollbar)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.rows = []
+        for row in range(self.ROWS):
+            y = row * self.row_height
+            self.rows.append((
+                self.canvas.create_rectangle(0, y, self.width, y + self.row_height, width=0, state=tk.HIDDEN),
+                self.canvas.create_text(80, y + self.row_height / 2, anchor=tk.E, font=self.row_font),
+                self.canvas.create_text(100, y + self.row_height / 2, anchor=tk.W, font=self.row_font),
+                self.canvas.create_text(self.width - 10, y + self.row_height / 2, anchor=tk.E, font=self.row_font),
+            ))
+        self.empty_text = self.canvas.create_text(self.width / 2, self.row_height, font=self.row_font, state=tk.HIDDEN)
+        # Toplevel bindings apply to every widget of the window
+        self.window.bind("<MouseWheel>", lambda event: self.scroll(-3 if event.delta > 0 else 3))
+        self.window.bind("<Button-4>", lambda event: self.scroll(-3))
+        self.window.bind("<Button-5>", lambda event: self.scroll(3))
+        self.window.bind("<Prior>", lambda event: self.scroll(-1, 'pages'))
+        self.window.bind("<Next>", lambda event: self.scroll(1, 'pages'))
+
+        bottom_frame = tk.Frame(self.window, padx=10, pady=10)
+        self.theme_engine.register(bottom_frame, 'background')
+        bottom_frame.pack(fill=tk.X)
+        self.previous_btn = tk.Button(bottom_frame, font=self.row_font, command=lambda: self.scroll(-1, 'pages'))
+        self.theme_engine.register(self.previous_btn, 'joker_button')
+        self.previous_btn.pack(side=tk.LEFT)
+        self.page_label = tk.Label(bottom_frame, font=self.row_font)
+        self.theme_engine.register(self.page_label, 'label')
+        self.page_label.pack(side=tk.LEFT, padx=10)
+        self.next_btn = tk.Button(bottom_frame, font=self.row_font, command=lambda: self.scroll(1, 'pages'))
+        self.theme_engine.register(self.next_btn, 'joker_button')
+        self.next_btn.pack(side=tk.LEFT)
+        self.my_rank_btn = tk.Button(bottom_frame, font=self.row_font, command=self.jump_to_my_rank)
+        self.theme_engine.register(self.my_rank_btn, 'start_button')
+        self.my_rank_btn.pack(side=tk.RIGHT)
+
+    def _refresh_texts(self):
+        self.window.title(get_text('leaderboard_title'))
+        for button, (_, label_key) in zip(self.mode_buttons, MODES):
+            button.config(text=get_text(label_key))
+        self.search_label.config(text=get_text('leaderboard_search'))
+        self.previous_btn.config(text=get_text('leaderboard_previous_page'))
+        self.next_btn.config(text=get_text('leaderboard_next_page'))
+        self.my_rank_btn.config(text=get_text('leaderboard_my_rank'))
+        self._update_status()
+
+    # --- Virtual list ------------------------------------------------------
+
+    def _board(self):
+        return self.leaderboard.mode(self.mode.get())
+
+    def total(self):
+        return len(self._board()) if self.results is None else len(self.results)
+
+    def _visible_entries(self):
+        """(rank, score, username) of the rows in view"""
+        board = self._board()
+        if self.results is None:
+            return board.page(self.first + 1, self.ROWS)
+        if self._results_version != (board, board.version):
+            # Scores changed below the visible top too: re-rank (and pick up new matching players)
+            self._search(self._search_text)
+            self.first = max(0, min(self.first, len(self.results) - self.ROWS))
+        return [(board.rank_of(username), board.get_score(username), username)
+                for username in self.results[self.first:self.first + self.ROWS]]
+
+    def redraw(self, force=False):
+        """Re-label the pooled rows with the entries now in view; only rows that changed are touched"""
+        if force:
+            self._drawn = [None] * self.ROWS
+        palette = self.theme_engine.palette()
+        self.canvas.configure(bg=palette['secondary_background'])
+        canvas = self.canvas
+        entries = self._visible_entries()
+        for row, items in enumerate(self.rows):
+            rect, rank_item, name_item, score_item = items
+            entry = entries[row] if row < len(entries) else None
+            drawn = entry and entry + (entry[2] == self.username,)
+            if drawn == self._drawn[row]:
+                continue
+            self._drawn[row] = drawn
+            if entry is None:
+                for item in items:
+                    canvas.itemconfigure(item, state=tk.HIDDEN)
+                continue
+            rank, score, username, highlighted = drawn
+            color = palette['button_text'] if highlighted else palette['text']
+            canvas.itemconfigure(rect, state=tk.NORMAL if highlighted else tk.HIDDEN, fill=palette['accent'])
+            canvas.itemconfigure(rank_item, state=tk.NORMAL, text=f"{rank}.", fill=color)
+            canvas.itemconfigure(name_item, state=tk.NORMAL, text=username, fill=color)
+            canvas.itemconfigure(score_item, state=tk.NORMAL, text=str(score), fill=color)
+        if entries:
+            canvas.itemconfigure(self.empty_text, state=tk.HIDDEN)
+        else:
+            message = get_text('leaderboard_no_results') if self.results is not None else get_text('no_scores_for_mode_message')
+            canvas.itemconfigure(self.empty_text, state=tk.NORMAL, text=message, fill=palette['secondary_text'])
+        self._update_status()
+
+    def _update_status(self):
+        total = self.total()
+        pages = max(1, -(-total // self.ROWS))
+        page = min(pages, -(-(self.first + self.ROWS) // self.ROWS))  # Page of the last visible row
+        self.page_label.config(text=get_text('leaderboard_page', page=page, pages=pages, count=total))
+        if total:
+            self.scrollbar.set(self.first / total, min(1.0, (self.first + self.ROWS) / total))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def scroll_to(self, first):
+        first = max(0, min(first, self.total() - self.ROWS))
+        if first != self.first:
+            self.first = first
+            self.redraw()
+
+    def scroll(self, amount, what='units'):
+        self.scroll_to(self.first + amount * (self.ROWS if what == 'pages' else 1))
+
+    def _on_scrollbar(self, command, *args):
+        if command == 'moveto':
+            self.scroll_to(round(float(args[0]) * self.total()))
+        elif command == 'scroll':
+            self.scroll(int(args[0]), 'pages' if args[1] == 'pages' else 'units')
+
+    def jump_to_my_rank(self):
+        """Clear the search and center the current player's row"""
+        rank = self._board().rank_of(self.username) if self.username else None
+        if rank is None:
+            self.page_label.config(text=get_text('leaderboard_not_ranked'))
+            return
+        if self.results is not None:
+            self.search_entry.delete(0, tk.END)
+            self._search("")
+        self.first = max(0, min(rank - 1 - self.ROWS // 2, self.total() - self.ROWS))
+        self.redraw()
+
+    # --- Search and updates ------------------------------------------------
+
+    def _search(self, text):
+        self._search_text = text
+        board = self._board()
+        self.results = board.search(text) if text else None
+        self._results_version = (board, board.version)
+
+    def _on_search_typed(self, event=None):
+        if self._search_job:
+            self.window.after_cancel(self._search_job)
+        self._search_job = self.window.after(self.SEARCH_DELAY_MS, self._run_search)
+
+    def _run_search(self):
+        self._search_job = None
+        text = self.search_entry.get().strip()
+        if text == self._search_text and self.results is not None:
+            return
+        self._search(text)
+        self.first = 0
+        self.redraw()
+
+    def _on_mode_changed(self):
+        self._search(self._search_text)
+        self.first = 0
+        self.redraw()
+        self.window.after_idle(self._board().build_name_index)
+
+    def _on_leaderboard_changed(self, mode):
+        # Any change can move rows, the page count or "my rank": redraw once per burst (e.g. a sync merge)
+        if mode == self.mode.get() and self._refresh_job is None:
+            self._refresh_job = self.window.after_idle(self._refresh)
+
+    def _refresh(self):
+        self._refresh_job = None
+        self.first = max(0, min(self.first, self.total() - self.ROWS))  # Clamp to the new length
+        self.redraw()
+
+    def apply_theme(self):
+        """Recolor the rows after a theme switch (the widgets follow the theme engine)"""
+        self.redraw(force=True)
+
+    def refresh_texts(self):
+        self._refresh_texts()
+        self.redraw(force=True)
+
+    def exists(self):
+        try:
+            return bool(self.window.winfo_exists())
+        except tk.TclError:
+            return False
+
+    def lift(self):
+        self.window.lift()
+        self.window.focus_set()
+
+    def close(self):
+        self.leaderboard.unwatch(self._on_leaderboard_changed)
+        for job in (self._search_job, self._refresh_job):
+            if job:
+                self.window.after_cancel(job)
+        self.window.destroy()
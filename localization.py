@@ -0,0 +1,122 @@
+"""
+Localization
+------------
+Texts live in locales/<language>.json, one flat object per language. A
+catalog is read the first time its language is used and every text is
+compiled once into its literal parts and fields, so a lookup is a dict
+access and formatting never re-parses the template. Adding a language is
+adding a file; nothing is loaded for it until it is selected.
+
+    from localization import get_text
+    get_text('final_score_base', score=750)
+"""
+import os
+import sys
+import json
+import threading
+from string import Formatter
+
+from applog import get_logger
+
+log = get_logger(__name__)
+
+DEFAULT_LANGUAGE = 'tr'
+# Next to this module, or inside the PyInstaller bundle
+LOCALES_DIR = os.path.join(getattr(sys, '_MEIPASS', os.path.dirname(os.path.abspath(__file__))), "locales")
+
+_catalogs = {}
+_catalogs_lock = threading.Lock()
+_language = DEFAULT_LANGUAGE
+
+
+class Template:
+    """A translated text, pre-parsed into (literal, field, format_spec, conversion) parts"""
+
+    __slots__ = ('text', 'parts')
+
+    def __init__(self, text):
+        self.text = text
+        parts = tuple(Formatter().parse(text))
+        # Plain texts (most of them) are returned as they are
+        self.parts = parts if any(field is not None for _, field, _, _ in parts) else None
+
+    def format(self, params):
+        if self.parts is None:
+            return self.text
+        pieces = []
+        for literal, field, format_spec, conversion in self.parts:
+            pieces.append(literal)
+            if field is None:
+                continue
+            if field not in params:
+                pieces.append("{" + field + "}")  # Leave unknown fields visible instead of failing
+                continue
+            value = params[field]
+            if conversion == 'r':
+                value = repr(value)
+            elif conversion == 'a':
+                value = ascii(value)
+            elif conversion == 's':
+                value = str(value)
+            pieces.append(format(value, format_spec or ''))
+        return ''.join(pieces)
+
+
+def get_catalog_path(language):
+    return os.path.join(LOCALES_DIR, f"{language}.json")
+
+
+def available_languages():
+    """Languages that have a catalog file"""
+    try:
+        return sorted(name[:-len(".json")] for name in os.listdir(LOCALES_DIR) if name.endswith(".json"))
+    except FileNotFoundError:
+        return []
+
+
+def load_catalog(language):
+    """Return the compiled catalog {key: Template} of a language, reading it on first use"""
+    catalog = _catalogs.get(language)
+    if catalog is not None:
+        return catalog
+    with _catalogs_lock:
+        if language in _catalogs:
+            return _catalogs[language]
+        try:
+            with open(get_catalog_path(language), 'r', encoding='utf-8') as f:
+                texts = json.load(f)
+            catalog = {key: Template(text) for key, text in texts.items()}
+        except (OSError, ValueError, AttributeError) as e:
+            log.error("Could not load catalog '%s': %s", language, e)
+            catalog = {}
+        _catalogs[language] = catalog
+        return catalog
+
+
+def set_language(language):
+    """Select the language used by get_text"""
+    global _language
+    _language = language or DEFAULT_LANGUAGE
+
+
+def get_language():
+    return _language
+
+
+def get_text(key, fallback=None, language=None, **params):
+    """
+    Translated text for `key`, formatted with `params`
+
+    Looks in the selected language, then uses `fallback`, then the default
+    language, and finally returns the key itself.
+    """
+    language = language or _language
+    template = load_catalog(language).get(key)
+    if template is None:
+        if fallback:
+            return Template(fallback).format(params)
+        if language != DEFAULT_LANGUAGE:
+            template = load_catalog(DEFAULT_LANGUAGE).get(key)
+        if template is None:
+            return key
+    return template.format(params)
@@ -1,26 +1,56 @@
+import startup # First, so the startup trace starts counting before the other imports
 import tkinter as tk
 # Updated imports for the new flat structure hello world exampleeee
-from config import load_settings
+from config import get_settings_service
 from repository import WordRepository
 from game import GameService, KelimeOyunuView, Word # Import Word here for repository
+from session import SessionJournal
+from puzzles import PuzzleTable
+from word_index import HintEngine
+from applog import setup_logging, install_crash_handler, dump_log
 
 def main():
+    startup.mark('imports')
 
-    settings = load_settings()
+    setup_logging()
+    settings_service = get_settings_service()
+    settings = settings_service.get()
     
 
     root = tk.Tk()
+    install_crash_handler(root) # Unhandled errors write the in-memory log to ~/.kelime_oyunu/logs
+    root.bind_all('<Control-L>', lambda event: dump_log()) # Ctrl+Shift+L
+    startup.mark('tk_root')
 
     repository = WordRepository(server='localhost', database='kelimeOyunu') 
-    game_service = GameService(repository)
+    hint_engine = HintEngine()
+    hint_engine.load_async(repository, WordClass=Word)
+    game_service = GameService(repository, journal=SessionJournal(), puzzle_table=PuzzleTable(),
+                               hint_engine=hint_engine)
     
 
     
 
-    app = KelimeOyunuView(root, game_service, settings)
+    # The stores and the audio engine are built by the view while the username prompt is up
+    app = KelimeOyunuView(root, game_service, settings, settings_service=settings_service)
+    if app.closed: # Left at the username prompt
+        if app.audio_engine:
+            app.audio_engine.close()
+        return
+    settings_service.watch(root) # Edits to settings.json apply without a restart
+    from columnar import SnapshotExporter
+    snapshot_exporter = SnapshotExporter() # Keeps leaderboard_snapshots/ fresh for display screens
+    
+    sync_settings = settings.get('sync', {})
+    if sync_settings.get('directory') or sync_settings.get('peers') or sync_settings.get('port'):
+        from sync import SyncEngine, start_periodic_sync # Sockets and threads only on synced kiosks
+        sync_engine = SyncEngine(username_index=app.username_index)
+        sync_engine.rename_users(app.renamed_users)
+        start_periodic_sync(root, sync_engine, sync_settings)
     
 
     root.mainloop()
+    app.audio_engine.close()
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -5,7 +5,7 @@ a = Analysis(
     ['main.py'],
     pathex=[],
     binaries=[],
-    datas=[('media', 'media')],
+    datas=[('media', 'media'), ('locales', 'locales')],
     hiddenimports=[],
     hookspath=[],
     hooksconfig={},
@@ -0,0 +1,220 @@
+"""
+Offline anagram puzzle precomputation
+-------------------------------------
+Builds the anagram puzzle table used by GameService.start_game('anagram').
+
+Run this file to rebuild the table from the word database:
+
+    python puzzles.py [output_file]
+
+Only words whose letters form exactly one word of the corpus are kept, so
+every anagram puzzle has a single correct answer. Each kept word gets a
+precomputed scramble together with a difficulty score for that scramble.
+"""
+import os
+import sys
+import json
+import random
+
+from usernames import turkish_lower
+from applog import get_logger
+
+log = get_logger(__name__)
+
+PUZZLE_TABLE_FILE = "anagram_puzzles.json"
+PUZZLE_TABLE_VERSION = 1
+
+CANDIDATE_SHUFFLES = 8  # Scrambles tried per word, the hardest one is kept
+CHUNK_SIZE = 2000       # Words per task sent to the process pool
+
+
+def normalize_word(word):
+    """Normalize a word for letter comparisons"""
+    return turkish_lower(word.strip())
+
+
+def letter_signature(word):
+    """Return the sorted letters of a word; anagrams share the same signature"""
+    return ''.join(sorted(normalize_word(word)))
+
+
+def score_scramble(word, scramble):
+    """
+    Score how hard a scramble is to solve, from 0.0 (trivial) to 1.0 (hard)
+
+    Longer words, letters moved away from their position and broken
+    letter pairs of the original word all make a scramble harder.
+    """
+    n = len(word)
+    if n < 2:
+        return 0.0
+    displaced = sum(1 for a, b in zip(word, scramble) if a != b) / n
+    bigrams = {word[i:i + 2] for i in range(n - 1)}
+    kept_bigrams = sum(1 for i in range(n - 1) if scramble[i:i + 2] in bigrams) / (n - 1)
+    length_factor = min(1.0, n / 10)
+    return round(0.4 * length_factor + 0.4 * displaced + 0.2 * (1 - kept_bigrams), 3)
+
+
+def best_scramble(word, tries=CANDIDATE_SHUFFLES):
+    """Return (scramble, difficulty) for the hardest of a few random shuffles, or None"""
+    rng = random.Random(word)  # Deterministic per word so rebuilds are reproducible
+    letters = list(word)
+    best = None
+    for _ in range(tries):
+        rng.shuffle(letters)
+        scramble = ''.join(letters)
+        if scramble == word:
+            continue
+        difficulty = score_scramble(word, scramble)
+        if best is None or difficulty > best[1]:
+            best = (scramble, difficulty)
+    return best
+
+
+def _signature_chunk(words):
+    """Pool task: compute (signature, normalized word) pairs"""
+    return [(letter_signature(w), normalize_word(w)) for w in words]
+
+
+def _scramble_chunk(words):
+    """Pool task: compute the best scramble of each word"""
+    return [(w, best_scramble(w)) for w in words]
+
+
+def _chunks(items, size=CHUNK_SIZE):
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+def build_puzzle_table(words_by_difficulty, processes=None):
+    """
+    Build the anagram puzzle table from the whole corpus
+
+    Args:
+        words_by_difficulty: Dictionary with difficulty levels as keys and Word lists as values
+        processes: Number of worker processes (defaults to the CPU count)
+
+    Returns:
+        Dictionary ready to be written with save_puzzle_table
+    """
+    entries = []
+    for difficulty, word_list in words_by_difficulty.items():
+        for w in word_list:
+            if w.word and ' ' not in w.word.strip():  # Same rule as GameState._flatten_words
+                entries.append((difficulty, w))
+
+    from multiprocessing import Pool, cpu_count  # Offline tooling only, the game just reads the table
+
+    all_words = [w.word for _, w in entries]
+    with Pool(processes or cpu_count()) as pool:
+        # Pass 1: group the whole corpus by letter signature
+        groups = {}
+        for chunk in pool.imap_unordered(_signature_chunk, _chunks(all_words)):
+            for signature, word in chunk:
+                groups.setdefault(signature, set()).add(word)
+
+        unique_words = sorted({normalize_word(w) for w in all_words
+                               if len(groups[letter_signature(w)]) == 1})
+
+        # Pass 2: pick and score a scramble for every uniquely solvable word
+        scrambles = {}
+        for chunk in pool.imap_unordered(_scramble_chunk, _chunks(unique_words)):
+            scrambles.update(chunk)
+
+    puzzles = {}
+    for difficulty, w in entries:
+        result = scrambles.get(normalize_word(w.word))
+        if not result:
+            continue  # Ambiguous anagram, or no scramble differs from the word (e.g. "aaa")
+        scramble, score = result
+        puzzles.setdefault(difficulty, []).append({
+            'word': w.word,
+            'description': w.description,
+            'details': w.details,
+            'scramble': scramble,
+            'difficulty': score
+        })
+
+    for puzzle_list in puzzles.values():
+        puzzle_list.sort(key=lambda p: p['difficulty'])
+
+    return {
+        'version': PUZZLE_TABLE_VERSION,
+        'word_count': len(entries),
+        'ambiguous_signatures': sum(1 for g in groups.values() if len(g) > 1),
+        'puzzles': puzzles
+    }
+
+
+def save_puzzle_table(table, filepath=PUZZLE_TABLE_FILE):
+    """Write the puzzle table atomically"""
+    tmp_path = filepath + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(table, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(tmp_path, filepath)
+
+
+class PuzzleTable:
+    """Precomputed anagram puzzles, loaded lazily on the first draw"""
+
+    def __init__(self, filepath=PUZZLE_TABLE_FILE):
+        self.filepath = filepath
+        self._puzzles = None
+
+    def _load(self):
+        if self._puzzles is None:
+            try:
+                with open(self.filepath, 'r', encoding='utf-8') as f:
+                    table = json.load(f)
+                if table.get('version') != PUZZLE_TABLE_VERSION:
+                    raise ValueError(f"unsupported version {table.get('version')}")
+                self._puzzles = table.get('puzzles', {})
+            except FileNotFoundError:
+                self._puzzles = {}
+            except (ValueError, OSError) as e:
+                log.error("Error loading puzzle table: %s", e)
+                self._puzzles = {}
+        return self._puzzles
+
+    def is_available(self):
+        """Return True if the table holds any puzzle"""
+        return any(self._load().values())
+
+    def draw(self, count_by_difficulty, WordClass):
+        """
+        Draw random puzzles by difficulty level
+
+        Args:
+            count_by_difficulty: Dictionary with difficulty levels as keys and counts as values
+            WordClass: The Word class reference (from game.py)
+
+        Returns:
+            Dictionary of word lists by difficulty, with the precomputed scramble set
+        """
+        puzzles = self._load()
+        result = {}
+        for difficulty, count in count_by_difficulty.items():
+            pool = puzzles.get(difficulty, [])
+            chosen = random.sample(pool, min(count, len(pool)))
+            result[difficulty] = [WordClass(p['word'], p['description'], p['details'], scramble=p['scramble'])
+                                  for p in chosen]
+        return result
+
+
+def main():
+    from repository import WordRepository
+    from game import Word
+
+    output_file = sys.argv[1] if len(sys.argv) > 1 else PUZZLE_TABLE_FILE
+    repository = WordRepository(server='localhost', database='kelimeOyunu')
+    words = repository.get_all_words(WordClass=Word)
+    table = build_puzzle_table(words)
+    save_puzzle_table(table, output_file)
+    total = sum(len(p) for p in table['puzzles'].values())
+    print(f"[Puzzles] {total} unique puzzles out of {table['word_count']} words written to {output_file}")
+
+
+if __name__ == "__main__":
+    from multiprocessing import freeze_support
+    freeze_support()
+    main()
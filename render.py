@@ -0,0 +1,118 @@
+"""
+Render scheduler
+----------------
+Game events only record what has to be redrawn: they mark regions of the
+screen dirty or request widget options. Everything requested before Tk
+goes idle is applied in one after_idle pass, where the dirty regions are
+rendered once and only the options that differ from what the widget
+already shows are sent to Tk.
+
+Each pass is attributed to the user action(s) that caused it, and the
+scheduler counts per action how many widget options were requested and how
+many actually reached Tk.
+"""
+import tkinter as tk
+from collections import Counter
+
+from applog import get_logger
+
+log = get_logger(__name__)
+
+
+class RenderScheduler:
+    """Coalesces widget updates into one idle pass per frame"""
+
+    def __init__(self, root):
+        self.root = root
+        self._regions = {}     # name -> render callback
+        self._dirty = set()
+        self._pending = {}     # widget -> {option: value} requested in this frame
+        self._applied = {}     # widget -> {option: value} last sent to Tk
+        self._after_pass = []
+        self._actions = []     # Actions that requested something in this frame
+        self._job = None
+        self._requested = 0
+        self.counters = {}     # action -> Counter(passes, requested, options, widgets)
+
+    def add_region(self, name, render):
+        """Register `render()`, called in the pass after `name` was invalidated"""
+        self._regions[name] = render
+
+    def action(self, name):
+        """Attribute the updates requested from now on to the user action `name`"""
+        if name not in self._actions:
+            self._actions.append(name)
+
+    def invalidate(self, *regions):
+        self._dirty.update(regions)
+        self._schedule()
+
+    def set(self, widget, **options):
+        """Request widget options; repeated requests in one frame collapse into the last value"""
+        self._pending.setdefault(widget, {}).update(options)
+        self._requested += len(options)
+        self._schedule()
+
+    def after_pass(self, callback):
+        """Run `callback()` once the pending updates have been applied (e.g. focus, clearing an Entry)"""
+        self._after_pass.append(callback)
+        self._schedule()
+
+    def forget(self, widget):
+        """Drop the cached options of a widget that is about to be destroyed or reconfigured elsewhere"""
+        self._pending.pop(widget, None)
+        self._applied.pop(widget, None)
+
+    def _schedule(self):
+        if self._job is None:
+            self._job = self.root.after_idle(self.flush)
+
+    def flush(self):
+        """Apply everything pending now (normally called from the idle pass)"""
+        if self._job is not None:
+            self.root.after_cancel(self._job)
+            self._job = None
+        while self._dirty:
+            dirty, self._dirty = self._dirty, set()
+            for name in [name for name in self._regions if name in dirty]:  # Registration order
+                self._regions[name]()
+        options_sent = 0
+        widgets_touched = 0
+        pending, self._pending = self._pending, {}
+        for widget, options in pending.items():
+            applied = self._applied.setdefault(widget, {})
+            changes = {key: value for key, value in options.items() if applied.get(key) != value}
+            if not changes:
+                continue
+            try:
+                widget.configure(**changes)
+            except tk.TclError:
+                self._applied.pop(widget, None)  # Destroyed meanwhile
+                continue
+            applied.update(changes)
+            options_sent += len(changes)
+            widgets_touched += 1
+        callbacks, self._after_pass = self._after_pass, []
+        for callback in callbacks:
+            callback()
+        self._count(options_sent, widgets_touched)
+
+    def _count(self, options_sent, widgets_touched):
+        action = "+".join(self._actions) or "other"
+        counter = self.counters.setdefault(action, Counter())
+        counter['passes'] += 1
+        counter['requested'] += self._requested
+        counter['options'] += options_sent
+        counter['widgets'] += widgets_touched
+        log.debug("Render pass for %s: %d of %d requested options sent to %d widgets",
+                  action, options_sent, self._requested, widgets_touched)
+        self._actions = []
+        self._requested = 0
+
+    def stats(self):
+        """Average widget updates per pass for each action: {action: {passes, requested, options, widgets}}"""
+        return {action: {'passes': c['passes'],
+                         'requested': c['requested'] / c['passes'],
+                         'options': c['options'] / c['passes'],
+                         'widgets': c['widgets'] / c['passes']}
+                for action, c in self.counters.items()}
@@ -1,4 +1,6 @@
-import pyodbc
+from applog import get_logger
+
+log = get_logger(__name__)
 
 
 class WordRepository:
@@ -8,6 +10,10 @@ class WordRepository:
         self.server = server
         self.database = database
         self.connection_string = f'DRIVER={{SQL Server}};SERVER={server};DATABASE={database};Trusted_Connection=yes;'
+
+    def _connect(self):
+        import pyodbc  # Loads the ODBC driver manager, so only when a query runs
+        return pyodbc.connect(self.connection_string)
     
 
     def get_words_by_difficulty(self, count_by_difficulty, WordClass):
@@ -24,7 +30,7 @@ class WordRepository:
         result = {}
         
         try:
-            conn = pyodbc.connect(self.connection_string)
+            conn = self._connect()
             cursor = conn.cursor()
             
             for difficulty, count in count_by_difficulty.items():
@@ -39,7 +45,33 @@ class WordRepository:
             conn.close()
             
         except Exception as e:
-            print(f"Database connection error: {e}")
+            log.error("Database connection error: %s", e)
+            raise
+            
+        return result
+
+    def get_all_words(self, WordClass):
+        """
+        Get the whole word corpus, used by offline tooling
+        
+        Args:
+            WordClass: The Word class reference (from game.py)
+        
+        Returns:
+            Dictionary of word lists by difficulty
+        """
+        result = {}
+        
+        try:
+            conn = self._connect()
+            cursor = conn.cursor()
+            cursor.execute("SELECT kelime, aciklama, detayli, zorluk FROM kelimeler")
+            for word, description, details, difficulty in cursor.fetchall():
+                result.setdefault(difficulty, []).append(WordClass(word, description, details))
+            conn.close()
+            
+        except Exception as e:
+            log.error("Database connection error: %s", e)
             raise
             
-        return result 
\ No newline at end of file
+        return result
@@ -0,0 +1,125 @@
+import os
+import json
+
+from config import get_app_dir
+from applog import get_logger
+
+log = get_logger(__name__)
+
+SESSION_FILE_NAME = "session.journal"
+
+# Fields of GameState that change while a game is being played.
+# The word list itself only changes when a new game starts, so it is
+# written once in the full snapshot and never repeated in the deltas.
+MUTABLE_FIELDS = (
+    'current_word_index', 'score', 'hint_count', 'detail_hint_count',
+    'current_word_score', 'revealed_indices', 'shuffled_letters', 'elapsed'
+)
+
+
+def get_session_file_path():
+    """Get the path to the session journal"""
+    return get_app_dir() / SESSION_FILE_NAME
+
+
+class SessionJournal:
+    """
+    Append-only journal of the running game, used to resume after a crash.
+
+    The first line of the journal is a full snapshot of the game state.
+    Every following line only holds the fields that changed since the
+    previous entry, so a guess or hint costs one short appended line.
+    After `compact_every` deltas the journal is rewritten as a single
+    snapshot (temp file + atomic rename) to keep replay time bounded.
+    """
+
+    def __init__(self, path=None, compact_every=50):
+        self.path = str(path) if path else str(get_session_file_path())
+        self.compact_every = compact_every
+        self._file = None
+        self._last_fields = None
+        self._entries_since_compact = 0
+
+    def record(self, snapshot):
+        """Append the given state snapshot to the journal as a delta (or a full snapshot)"""
+        fields = {key: snapshot[key] for key in MUTABLE_FIELDS}
+
+        try:
+            if self._last_fields is None:
+                self._write_snapshot(snapshot)
+            else:
+                delta = {key: value for key, value in fields.items()
+                         if self._last_fields.get(key) != value}
+                if not delta:
+                    return
+                self._append(delta)
+                self._entries_since_compact += 1
+                if self._entries_since_compact >= self.compact_every:
+                    self._full_snapshot.update(fields)
+                    self._write_snapshot(self._full_snapshot)
+                    return
+                self._full_snapshot.update(delta)
+            self._last_fields = fields
+        except OSError as e:
+            log.error("Error writing session journal: %s", e)
+
+    def load(self):
+        """Replay the journal and return the latest snapshot, or None if there is none"""
+        snapshot = None
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        break  # Torn last line from a crash mid-write
+                    if snapshot is None:
+                        if 'words' not in entry:
+                            return None  # Journal does not start with a snapshot
+                        snapshot = entry
+                    else:
+                        snapshot.update(entry)
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            log.error("Error reading session journal: %s", e)
+            return None
+        return snapshot
+
+    def clear(self):
+        """Remove the journal once the game has ended normally"""
+        self._close()
+        self._last_fields = None
+        self._entries_since_compact = 0
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            log.error("Error removing session journal: %s", e)
+
+    def _write_snapshot(self, snapshot):
+        """Rewrite the journal as a single full snapshot"""
+        self._close()
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(snapshot, ensure_ascii=False, separators=(',', ':')) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+        self._full_snapshot = dict(snapshot)
+        self._last_fields = {key: snapshot[key] for key in MUTABLE_FIELDS}
+        self._entries_since_compact = 0
+
+    def _append(self, entry):
+        """Append one entry and force it to disk"""
+        if self._file is None:
+            self._file = open(self.path, 'a', encoding='utf-8')
+        self._file.write(json.dumps(entry, ensure_ascii=False, separators=(',', ':')) + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def _close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -0,0 +1,59 @@
+"""
+Startup trace
+-------------
+Marks the time of each startup phase, counted from the moment main.py
+starts, up to the first frame: the username prompt on top of the window
+(or the game screen when a session is resumed). The phases are logged once
+the first frame has been drawn.
+
+With KELIME_STARTUP_PROFILE=<file> set, the marks are also written to that
+file as JSON and the app closes right after its first frame; this is what
+benchmarks/bench_startup.py runs.
+"""
+import os
+import json
+import time
+
+from applog import get_logger
+
+log = get_logger(__name__)
+
+PROFILE_ENV = 'KELIME_STARTUP_PROFILE'
+
+_start = time.perf_counter()
+_marks = []  # (phase, ms since start)
+
+
+def mark(phase):
+    """Record that `phase` has finished"""
+    _marks.append((phase, (time.perf_counter() - _start) * 1000))
+
+
+def marks():
+    return list(_marks)
+
+
+def first_frame(root, close=None):
+    """
+    Mark the first frame once Tk has drawn it
+
+    Args:
+        root: The Tk root
+        close: Called to quit after the first frame when profiling
+    """
+    def on_idle():
+        root.update_idletasks()  # Draw whatever is still pending
+        mark('first_frame')
+        previous = 0.0
+        phases = []
+        for phase, at in _marks:
+            phases.append(f"{phase} {at - previous:.1f}")
+            previous = at
+        log.info("First frame after %.1f ms (%s)", previous, ", ".join(phases))
+        path = os.environ.get(PROFILE_ENV)
+        if path:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(dict(_marks), f)
+            if close:
+                close()
+    root.after_idle(on_idle)
@@ -0,0 +1,373 @@
+"""
+Leaderboard sync between kiosks
+-------------------------------
+Per-user, per-mode best scores form a max-register CRDT: merging keeps the
+larger score, so deltas can be applied in any order, any number of times.
+
+Every local change gets a sequence number. Peers only exchange the entries
+changed after the last sequence number they saw from each other, either as
+delta files in a shared directory or over a small TCP socket.
+
+Once a kiosk has written more than COMPACT_FILES delta files, it replaces
+them with its current state (one entry per user and mode), so the shared
+directory grows with the number of players, not with the number of games.
+"""
+import os
+import json
+import time
+import uuid
+import queue
+import socket
+import sqlite3
+import threading
+import socketserver
+
+from highscores import HIGHSCORE_FILE, load_highscores, save_highscores, add_highscore_listener, remove_highscore_listener
+from leaderboard import LEADERBOARD_DB_FILE
+from applog import get_logger
+
+log = get_logger(__name__)
+
+DEFAULT_SYNC_PORT = 50777
+BATCH_SIZE = 5000  # Entries per delta file / socket response
+MAX_REQUEST_BYTES = 4096  # Longest request line a sync server reads
+COMPACT_FILES = 64  # Own delta files in the shared directory before they are compacted
+DIRECTORY_MTIME_GRANULARITY = 2.0  # Seconds
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS crdt_scores (
+    username TEXT NOT NULL,
+    mode     TEXT NOT NULL,
+    score    INTEGER NOT NULL,
+    seq      INTEGER NOT NULL,
+    PRIMARY KEY (username, mode)
+);
+CREATE INDEX IF NOT EXISTS idx_crdt_scores_seq ON crdt_scores (seq);
+CREATE TABLE IF NOT EXISTS sync_peers (
+    peer_id  TEXT PRIMARY KEY,
+    last_seq INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS sync_meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+class SyncEngine:
+    """Keeps the local max-register state and exchanges deltas with other kiosks"""
+
+    def __init__(self, db_path=LEADERBOARD_DB_FILE, highscore_file=HIGHSCORE_FILE, username_index=None):
+        self.db_path = db_path
+        self.highscore_file = highscore_file
+        self.username_index = username_index  # Folds the spellings peers use into the local one
+        self._lock = threading.RLock()
+        self._incoming = queue.Queue()  # (peer_id, peer_seq, entries) waiting for the UI thread
+        self._server = None
+        self._listed_stamp = None  # mtime of the shared directory when its deltas were last read
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.executescript(SCHEMA)
+
+        self.node_id = self._get_meta('node_id')
+        if not self.node_id:
+            self.node_id = uuid.uuid4().hex
+            with self.conn:
+                self._set_meta('node_id', self.node_id)
+                self._bootstrap()
+        add_highscore_listener(self._on_highscore_saved)
+
+    # --- Local state -------------------------------------------------------
+
+    def _get_meta(self, key):
+        row = self.conn.execute("SELECT value FROM sync_meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key, value):
+        self.conn.execute("INSERT OR REPLACE INTO sync_meta (key, value) VALUES (?, ?)", (key, str(value)))
+
+    def _bootstrap(self):
+        """Seed the sync state from the existing highscores the first time"""
+        rows = []
+        for username, user_scores in load_highscores(self.highscore_file).items():
+            for mode, score in user_scores.items():
+                rows.append((username, mode, score, len(rows) + 1))
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO crdt_scores (username, mode, score, seq) VALUES (?, ?, ?, ?)", rows)
+        self._set_meta('seq', len(rows))
+
+    def current_seq(self):
+        return int(self._get_meta('seq') or 0)
+
+    def _apply(self, entries):
+        """Max-merge entries into the local state, returns the entries that raised a score"""
+        raised = []
+        with self._lock, self.conn:
+            seq = self.current_seq()
+            for username, mode, score in entries:
+                row = self.conn.execute(
+                    "SELECT score FROM crdt_scores WHERE username = ? AND mode = ?", (username, mode)
+                ).fetchone()
+                if row is not None and score <= row[0]:
+                    continue
+                seq += 1
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO crdt_scores (username, mode, score, seq) VALUES (?, ?, ?, ?)",
+                    (username, mode, score, seq)
+                )
+                raised.append((username, mode, score))
+            self._set_meta('seq', seq)
+        return raised
+
+    def rename_users(self, renamed):
+        """Move the scores of merged usernames ({old: new}) to the kept spelling"""
+        moved = []
+        with self._lock, self.conn:
+            for old, new in renamed.items():
+                rows = self.conn.execute(
+                    "SELECT mode, score FROM crdt_scores WHERE username = ?", (old,)).fetchall()
+                self.conn.execute("DELETE FROM crdt_scores WHERE username = ?", (old,))
+                moved.extend((new, mode, score) for mode, score in rows)
+            self._apply(moved)
+
+    def _on_highscore_saved(self, filepath, username, game_mode, score, source='game'):
+        if source == 'game' and os.path.abspath(filepath) == os.path.abspath(self.highscore_file):
+            self._apply([(username, game_mode, score)])
+
+    def changes_since(self, seq, limit=BATCH_SIZE):
+        """Return (entries, last_seq) for local changes after `seq`, at most `limit` of them"""
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT username, mode, score, seq FROM crdt_scores WHERE seq > ? ORDER BY seq LIMIT ?",
+                (seq, limit)
+            ).fetchall()
+        if not rows:
+            return [], seq
+        return [(u, m, s) for u, m, s, _ in rows], rows[-1][3]
+
+    def _peer_seq(self, peer_id):
+        with self._lock:
+            row = self.conn.execute("SELECT last_seq FROM sync_peers WHERE peer_id = ?", (peer_id,)).fetchone()
+        return row[0] if row else 0
+
+    def merge(self, entries, peer_id=None, peer_seq=None):
+        """
+        Merge remote entries (must run on the UI thread, listeners update widgets)
+
+        Returns the number of scores that went up.
+        """
+        if self.username_index:
+            entries = [(self.username_index.resolve(username), mode, score) for username, mode, score in entries]
+        raised = self._apply(entries)
+        if raised:
+            # Recorded like any other best score so the JSON files and leaderboards follow
+            save_highscores(self.highscore_file, raised, source='sync')
+        if peer_id is not None and peer_seq is not None:
+            with self._lock, self.conn:
+                self.conn.execute(
+                    "INSERT INTO sync_peers (peer_id, last_seq) VALUES (?, ?) "
+                    "ON CONFLICT (peer_id) DO UPDATE SET last_seq = MAX(last_seq, excluded.last_seq)",
+                    (peer_id, peer_seq)
+                )
+        return len(raised)
+
+    def poll(self):
+        """Apply the deltas received by background threads, returns the number of raised scores"""
+        applied = 0
+        while True:
+            try:
+                peer_id, peer_seq, entries = self._incoming.get_nowait()
+            except queue.Empty:
+                return applied
+            applied += self.merge(entries, peer_id, peer_seq)
+
+    # --- File exchange -----------------------------------------------------
+
+    def export_delta(self, directory):
+        """Write local changes since the last export to a delta file in `directory`"""
+        exported = int(self._get_meta('exported_seq') or 0)
+        os.makedirs(directory, exist_ok=True)
+        written = None
+        while True:
+            entries, last_seq = self.changes_since(exported)
+            if not entries:
+                break
+            self._write_delta(directory, entries, last_seq)
+            with self.conn:
+                self._set_meta('exported_seq', last_seq)
+            exported = written = last_seq
+        if written is not None:
+            self._compact_deltas(directory)
+        return written
+
+    def _write_delta(self, directory, entries, last_seq):
+        name = f"{self.node_id}-{last_seq:012d}.jsonl"
+        tmp_path = os.path.join(directory, name + ".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for username, mode, score in entries:
+                f.write(json.dumps([username, mode, score], ensure_ascii=False, separators=(',', ':')) + "\n")
+        os.replace(tmp_path, os.path.join(directory, name))
+        return name
+
+    def _compact_deltas(self, directory):
+        """Replace this kiosk's delta files by its current state once there are too many of them"""
+        prefix = self.node_id + "-"
+        own = [name for name in os.listdir(directory) if name.startswith(prefix) and name.endswith(".jsonl")]
+        if len(own) <= COMPACT_FILES:
+            return
+        # crdt_scores holds the latest entry per user and mode, so everything
+        # since 0 is the whole state. A peer that saw seq N skips the files up
+        # to N and re-reads the rest, which merging makes harmless.
+        kept = set()
+        seq = 0
+        while True:
+            entries, last_seq = self.changes_since(seq)
+            if not entries:
+                break
+            kept.add(self._write_delta(directory, entries, last_seq))
+            seq = last_seq
+        for name in own:
+            if name not in kept:
+                try:
+                    os.remove(os.path.join(directory, name))
+                except FileNotFoundError:
+                    pass
+        with self.conn:
+            self._set_meta('exported_seq', seq)
+        log.info("Compacted %d delta files into %d", len(own), len(kept))
+
+    def import_deltas(self, directory):
+        """Merge the delta files of other kiosks not seen yet, returns the number of raised scores"""
+        try:
+            stamp = os.stat(directory).st_mtime_ns
+            if stamp == self._listed_stamp:
+                return 0  # No file was added or removed since the last listing
+            names = sorted(os.listdir(directory))
+        except FileNotFoundError:
+            return 0
+        with self._lock:
+            seen = dict(self.conn.execute("SELECT peer_id, last_seq FROM sync_peers"))
+        applied = 0
+        complete = True
+        for name in names:
+            if not name.endswith(".jsonl"):
+                continue
+            peer_id, _, seq_part = name[:-len(".jsonl")].rpartition('-')
+            if not peer_id or peer_id == self.node_id or not seq_part.isdigit():
+                continue
+            peer_seq = int(seq_part)
+            if peer_seq <= seen.get(peer_id, 0):
+                continue
+            entries = []
+            try:
+                with open(os.path.join(directory, name), 'r', encoding='utf-8') as f:
+                    for line in f:
+                        username, mode, score = json.loads(line)
+                        entries.append((username, mode, score))
+            except FileNotFoundError:
+                # Compacted by its kiosk meanwhile: its later files must wait for the next listing
+                seen[peer_id] = float('inf')
+                complete = False
+                continue
+            applied += self.merge(entries, peer_id, peer_seq)
+            seen[peer_id] = peer_seq
+        # A coarse mtime (2 s on FAT shares) could hide a file added right after the listing
+        recent = time.time() - stamp / 1e9 < DIRECTORY_MTIME_GRANULARITY
+        self._listed_stamp = stamp if complete and not recent else None
+        return applied
+
+    # --- Socket exchange ---------------------------------------------------
+
+    def serve(self, host='127.0.0.1', port=DEFAULT_SYNC_PORT):
+        """
+        Answer delta requests on a background thread
+
+        Only this machine can connect by default; the endpoint has no
+        authentication, so other kiosks are let in by explicitly serving on
+        another address (the 'host' sync setting).
+        """
+        engine = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                try:
+                    request = json.loads(self.rfile.readline(MAX_REQUEST_BYTES).decode('utf-8'))
+                    since = request.get('since', 0) if isinstance(request, dict) else None
+                    if not isinstance(since, int) or isinstance(since, bool) or since < 0:
+                        raise ValueError("'since' must be a non-negative integer")
+                except (UnicodeDecodeError, ValueError) as e:
+                    log.warning("Bad sync request from %s: %s", self.client_address[0], e)
+                    response = {'error': str(e)}
+                else:
+                    entries, last_seq = engine.changes_since(since)
+                    response = {'node': engine.node_id, 'seq': last_seq, 'entries': entries}
+                self.wfile.write((json.dumps(response, ensure_ascii=False, separators=(',', ':')) + "\n").encode('utf-8'))
+
+        socketserver.ThreadingTCPServer.allow_reuse_address = True
+        self._server = socketserver.ThreadingTCPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, name="sync-server", daemon=True).start()
+        log.info("Serving deltas on %s:%s", host, port)
+        return self._server
+
+    def pull(self, host, port=DEFAULT_SYNC_PORT, timeout=5.0):
+        """Fetch the deltas of one peer (safe on any thread); they are applied by poll()"""
+        peer_id = f"{host}:{port}"  # Progress is tracked per address
+        since = None
+        received = 0
+        while True:
+            if since is None:
+                since = self._peer_seq(peer_id)
+            with socket.create_connection((host, port), timeout=timeout) as sock:
+                stream = sock.makefile('rwb')
+                stream.write((json.dumps({'node': self.node_id, 'since': since}) + "\n").encode('utf-8'))
+                stream.flush()
+                response = json.loads(stream.readline().decode('utf-8'))
+            if not isinstance(response, dict) or 'error' in response:
+                raise ValueError(f"{peer_id} refused the request: {response}")
+            try:
+                entries = [(str(username), str(mode), int(score)) for username, mode, score in response['entries']]
+                seq = int(response['seq'])
+            except (KeyError, TypeError, ValueError) as e:
+                raise ValueError(f"Malformed response from {peer_id}: {e}")
+            if not entries:
+                return received
+            self._incoming.put((peer_id, seq, entries))
+            received += len(entries)
+            since = seq
+
+    def close(self):
+        remove_highscore_listener(self._on_highscore_saved)
+        if self._server:
+            self._server.shutdown()
+        self.conn.close()
+
+
+def start_periodic_sync(root, engine, sync_settings):
+    """Run the configured file/socket sync every few seconds from the Tk event loop"""
+    directory = sync_settings.get('directory')
+    peers = sync_settings.get('peers', [])
+    interval_ms = int(sync_settings.get('interval_seconds', 30) * 1000)
+    if sync_settings.get('port'):
+        engine.serve(host=sync_settings.get('host', '127.0.0.1'), port=sync_settings['port'])
+
+    def pull_peers():
+        for peer in peers:
+            host, _, port = peer.partition(':')
+            try:
+                engine.pull(host, int(port) if port else DEFAULT_SYNC_PORT)
+            except (OSError, ValueError) as e:
+                log.warning("Could not reach %s: %s", peer, e)
+
+    def tick():
+        try:
+            if directory:
+                engine.export_delta(directory)
+                engine.import_deltas(directory)
+            engine.poll()
+        except (OSError, ValueError) as e:
+            log.error("Sync error: %s", e)
+        if peers:
+            threading.Thread(target=pull_peers, name="sync-pull", daemon=True).start()
+        root.after(interval_ms, tick)
+
+    root.after(interval_ms, tick)
@@ -0,0 +1,145 @@
+"""
+Theme engine
+------------
+Each palette in settings['theme_colors'] is compiled once into a style
+table: widget role -> the exact configure() options for that role. Widgets
+are registered under a role when they are created, and switching themes is
+a single pass over the registered widgets with the precomputed options.
+"""
+import tkinter as tk
+from types import MappingProxyType
+
+from applog import get_logger
+
+log = get_logger(__name__)
+
+# Colors used when a palette leaves one out
+PALETTE_DEFAULTS = {
+    'background': '#f0f0f0',
+    'primary': '#4a7abc',
+    'accent': '#FF5722',
+    'secondary': '#2196F3',
+    'text': '#333333',
+    'button_text': 'white',
+    'danger_button_bg': '#FFA07A',        # LightSalmon
+    'danger_button_active_bg': '#FA8072'  # Salmon
+}
+
+
+def compile_palette(colors):
+    """Fill in the defaults and derived colors of a palette"""
+    palette = dict(PALETTE_DEFAULTS)
+    palette.update(colors)
+    palette.setdefault('secondary_background', palette['background'])
+    palette.setdefault('secondary_text', palette['text'])
+    return MappingProxyType(palette)
+
+
+def compile_style_table(palette):
+    """Return {role: configure options} and {role: {tag: options}} for a compiled palette"""
+    p = palette
+    table = {
+        'root': {'bg': p['background']},
+        'background': {'bg': p['background']},
+        'header': {'bg': p['primary']},
+        'label': {'bg': p['background'], 'fg': p['text']},
+        'result': {'bg': p['background']},
+        'entry': {'fg': p['text']},
+        'start_button': {'bg': p['primary'], 'fg': p['button_text'],
+                         'activebackground': p['accent'], 'activeforeground': p['button_text']},
+        'joker_button': {'bg': p['secondary'], 'fg': p['button_text'],
+                         'activebackground': p['accent'], 'activeforeground': p['button_text']},
+        'guess_button': {'bg': p['accent'], 'fg': p['button_text'],
+                         'activebackground': p['secondary'], 'activeforeground': p['button_text']},
+        'danger_button': {'bg': p['danger_button_bg'], 'fg': p['button_text'],
+                          'activebackground': p['danger_button_active_bg'], 'activeforeground': p['button_text']},
+        'leaderboard_text': {'bg': p['secondary_background'], 'fg': p['text']},
+    }
+    # Text widget tags are configured per role as well
+    tags = {
+        'leaderboard_text': {
+            'bold_title': {'foreground': p['primary']},
+            'score_entry': {'foreground': p['text']},
+            'no_score_message': {'foreground': p['secondary_text']},
+        }
+    }
+    return MappingProxyType(table), MappingProxyType(tags)
+
+
+def _changed(old, new):
+    """Options of `new` whose value differs from `old`"""
+    if not new:
+        return {}
+    if not old:
+        return dict(new)
+    return {key: value for key, value in new.items() if old.get(key) != value}
+
+
+class ThemeEngine:
+    """Applies compiled themes to the widgets registered by role"""
+
+    def __init__(self, theme_colors, theme=None):
+        self._theme_colors = theme_colors
+        self._compiled = {}   # theme -> (palette, table, tags)
+        self._widgets = {}    # role -> [widget]
+        self._applied = None  # (table, tags) currently on screen
+        self.theme = theme
+
+    def set_theme_colors(self, theme_colors):
+        """Replace the palettes (e.g. after a settings reload); they are recompiled on use"""
+        self._theme_colors = theme_colors
+        self._compiled.clear()
+
+    def _compile(self, theme):
+        compiled = self._compiled.get(theme)
+        if compiled is None:
+            palette = compile_palette(self._theme_colors.get(theme, {}))
+            compiled = (palette,) + compile_style_table(palette)
+            self._compiled[theme] = compiled
+        return compiled
+
+    def palette(self, theme=None):
+        """The compiled colors of a theme (the current one by default)"""
+        return self._compile(theme or self.theme)[0]
+
+    def register(self, widget, role):
+        """Put a widget under a role; it is styled right away if a theme is active"""
+        self._widgets.setdefault(role, []).append(widget)
+        if self.theme is not None:
+            _, table, tags = self._compile(self.theme)
+            self._configure(widget, table.get(role), tags.get(role))
+
+    def _configure(self, widget, options, tag_options):
+        if options:
+            widget.configure(**options)
+        if tag_options:
+            for tag, tag_config in tag_options.items():
+                widget.tag_configure(tag, **tag_config)
+
+    def apply(self, theme):
+        """
+        Restyle every registered widget for `theme` in one pass
+
+        Only the options that differ from the theme on screen are sent, so a
+        role whose colors are shared by both themes is skipped entirely.
+        """
+        _, table, tags = self._compile(theme)
+        self.theme = theme
+        old_table, old_tags = self._applied or ({}, {})
+        self._applied = (table, tags)
+        for role, widgets in self._widgets.items():
+            options = _changed(old_table.get(role), table.get(role))
+            tag_options = {tag: changes for tag, changes in
+                           ((tag, _changed(old_tags.get(role, {}).get(tag), config))
+                            for tag, config in tags.get(role, {}).items()) if changes}
+            if not options and not tag_options:
+                continue
+            alive = []
+            for widget in widgets:
+                try:
+                    self._configure(widget, options, tag_options)
+                    alive.append(widget)
+                except tk.TclError:
+                    pass  # Destroyed since it was registered
+            widgets[:] = alive
+        log.debug("Applied theme %s", theme)
@@ -0,0 +1,153 @@
+"""
+Canonical usernames
+-------------------
+Players type their name differently from one game to the next ("Ömer",
+"ömer", "IŞIK", "ışık"). Names are compared by a canonical key built with
+Unicode normalization and Turkish-aware casefolding, so every spelling of a
+name resolves to the one already on the leaderboard.
+
+    python usernames.py migrate   Merge the existing duplicate records in highscores.json
+"""
+import os
+import re
+import sys
+import threading
+import unicodedata
+
+from highscores import HIGHSCORE_FILE, load_highscores, rewrite_highscores, add_highscore_listener, remove_highscore_listener
+from applog import get_logger
+
+log = get_logger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+# str.lower() maps 'I' to 'i' and 'İ' to 'i' + combining dot; Turkish needs 'ı' and 'i'
+_TURKISH_UPPER_I = str.maketrans({'I': 'ı', 'İ': 'i'})
+
+
+def turkish_lower(text):
+    """Lowercase text with the Turkish dotted/dotless i rules"""
+    return text.translate(_TURKISH_UPPER_I).casefold()
+
+
+def canonical_username(username):
+    """
+    Return the key that all spellings of a username share
+
+    NFKC folds compatibility forms (full-width letters, decomposed 'Ö') into
+    one representation, surrounding whitespace is dropped and inner runs of
+    whitespace become a single space before Turkish casefolding.
+    """
+    text = unicodedata.normalize('NFKC', username)
+    text = _WHITESPACE.sub(' ', text.strip())
+    return unicodedata.normalize('NFC', turkish_lower(text))
+
+
+def _preferred_name(variants, scores):
+    """Pick the display name of a merged player: the spelling with the most points"""
+    return max(variants, key=lambda name: (sum(scores.get(name, {}).values()), name))
+
+
+def _group_by_key(usernames):
+    groups = {}
+    for username in usernames:
+        groups.setdefault(canonical_username(username), []).append(username)
+    return groups
+
+
+class UsernameIndex:
+    """
+    Maps canonical keys to the display name stored in highscores.json
+
+    The index is built on first use and kept up to date from the highscore
+    listener, so resolving a name is a single dict lookup.
+    """
+
+    def __init__(self, highscore_file=HIGHSCORE_FILE):
+        self.highscore_file = highscore_file
+        self._names = None
+        self._duplicates = 0
+        self._lock = threading.Lock()
+        add_highscore_listener(self._on_highscore_saved)
+
+    def _index(self):
+        if self._names is None:
+            scores = load_highscores(self.highscore_file)
+            self._names = {}
+            self._duplicates = 0
+            for key, variants in _group_by_key(scores).items():
+                self._names[key] = _preferred_name(variants, scores)
+                self._duplicates += len(variants) - 1
+        return self._names
+
+    def _on_highscore_saved(self, filepath, username, game_mode, score, source='game'):
+        if os.path.abspath(filepath) == os.path.abspath(self.highscore_file):
+            self.resolve(username)
+
+    def resolve(self, username):
+        """Return the stored spelling of a username, registering it if the player is new"""
+        display_name = _WHITESPACE.sub(' ', unicodedata.normalize('NFC', username).strip())
+        with self._lock:
+            return self._index().setdefault(canonical_username(username), display_name)
+
+    def has_duplicates(self):
+        """True if highscores.json holds several spellings of the same player"""
+        with self._lock:
+            self._index()
+            return self._duplicates > 0
+
+    def merge_duplicates(self):
+        """Merge the duplicate records on disk, returns {old spelling: kept spelling}"""
+        renamed = merge_duplicate_usernames(self.highscore_file)
+        with self._lock:
+            self._names = None  # Rebuilt from the merged file on next use
+        return renamed
+
+    def close(self):
+        remove_highscore_listener(self._on_highscore_saved)
+
+
+def merge_duplicate_usernames(filepath=HIGHSCORE_FILE):
+    """
+    Merge the records of every spelling of a player into one, keeping the best score per mode
+
+    Returns {old spelling: kept spelling} for the names that were merged away.
+    """
+    renamed = {}
+
+    def merge(scores):
+        merged = {}
+        for variants in _group_by_key(scores).values():
+            name = _preferred_name(variants, scores)
+            user_scores = merged.setdefault(name, {})
+            for variant in variants:
+                for mode, score in scores[variant].items():
+                    if score > user_scores.get(mode, -1):
+                        user_scores[mode] = score
+                if variant != name:
+                    renamed[variant] = name
+        return merged
+
+    # Check first so that a clean file is never rewritten
+    if not any(len(variants) > 1 for variants in _group_by_key(load_highscores(filepath)).values()):
+        return {}
+    if not rewrite_highscores(filepath, merge):
+        return {}
+    if renamed:
+        log.info("Merged %d duplicate usernames in %s", len(renamed), filepath)
+    return renamed
+
+
+def main():
+    if len(sys.argv) < 2 or sys.argv[1] != 'migrate':
+        print(__doc__)
+        return
+    filepath = sys.argv[2] if len(sys.argv) > 2 else HIGHSCORE_FILE
+    renamed = merge_duplicate_usernames(filepath)
+    for old, new in sorted(renamed.items()):
+        print(f"{old} -> {new}")
+    if not renamed:
+        print("[Usernames] No duplicate usernames found")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,249 @@
+"""
+Word board renderers
+--------------------
+Draw the displayed word ("_ _ K _ _", "K E L I M E") as a row of letter
+boxes. Each renderer exposes show(text, bg, fg), set_colors(bg, fg) and
+clear(), and keeps its widgets across words so that a hint or a new word
+only touches what changed.
+"""
+import time
+import tkinter as tk
+
+# Spacers are one character of the default font wide, as the original word display drew them
+SPACER_FONT = 'TkDefaultFont'
+SPACER_OPTIONS = {'relief': tk.FLAT, 'width': 1, 'font': SPACER_FONT}
+BOX_OPTIONS = {'relief': tk.SOLID, 'borderwidth': 1, 'width': 2}
+
+
+class LetterBoxRow:
+    """
+    Letter boxes as a pool of tk.Label cells
+
+    Cells are created once and reused: show() compares the wanted options
+    of every cell with the ones it last set and configures only the
+    differences. Cells beyond the current word are hidden, not destroyed,
+    so the next longer word costs no widget creation.
+    """
+
+    def __init__(self, parent, font, pool_size=16):
+        self.parent = parent
+        self.font = font
+        self.cells = []      # Every pooled label, visible ones first
+        self._options = []   # Options last applied to each cell
+        self._visible = 0
+        self._text = ""
+        self._colors = (None, None)
+        for _ in range(max(pool_size, 1)):
+            self._add_cell()
+        # Spacers keep the Label's default border, like the original spacer labels
+        self._spacer_options = dict(SPACER_OPTIONS, borderwidth=self.cells[0].cget('borderwidth'))
+        self._box_options = dict(BOX_OPTIONS, font=self.font)
+
+    def _add_cell(self):
+        cell = tk.Label(self.parent, font=self.font, anchor=tk.CENTER)
+        self.cells.append(cell)
+        self._options.append({})
+        return cell
+
+    @property
+    def boxes(self):
+        """The visible letter boxes (spacers excluded)"""
+        return [cell for cell, char in zip(self.cells, self._text) if char != ' ']
+
+    def show(self, text, bg, fg):
+        """Display `text`, one box per character and a narrow spacer for each space"""
+        while len(self.cells) < len(text):
+            self._add_cell()
+        for i, char in enumerate(text):
+            wanted = dict(self._spacer_options if char == ' ' else self._box_options, text=char, bg=bg, fg=fg)
+            applied = self._options[i]
+            changes = {key: value for key, value in wanted.items() if applied.get(key) != value}
+            if changes:
+                self.cells[i].configure(**changes)
+                applied.update(changes)
+        # Visible cells are always a prefix of the pool, so packing in index order keeps them in order
+        for i in range(self._visible, len(text)):
+            self.cells[i].pack(side=tk.LEFT)
+        for i in range(len(text), self._visible):
+            self.cells[i].pack_forget()
+        self._visible = len(text)
+        self._text = text
+        self._colors = (bg, fg)
+
+    def set_colors(self, bg, fg):
+        """Recolor the current word"""
+        if (bg, fg) != self._colors:
+            self.show(self._text, bg, fg)
+
+    def clear(self):
+        """Hide every cell"""
+        bg, fg = self._colors
+        self.show("", bg, fg)
+
+    def shake(self):
+        """Wrong-guess cue; only the canvas board animates it"""
+
+
+def _hex_to_rgb(color, widget):
+    r, g, b = widget.winfo_rgb(color)  # 16-bit channels, accepts any Tk color name
+    return r >> 8, g >> 8, b >> 8
+
+
+def _blend(start, end, t):
+    return "#%02x%02x%02x" % tuple(int(a + (b - a) * t) for a, b in zip(start, end))
+
+
+class CanvasWordBoard:
+    """
+    The whole letter board drawn on one tk.Canvas
+
+    Every cell is a rectangle and a text item whose IDs are kept, so a
+    change is an itemconfig/coords call on existing items and never a
+    geometry pass of child widgets. Cells past the end of the word are
+    hidden and reused. Animations run from a single after() loop at ~60 fps
+    and move all items through one shared tag.
+    """
+
+    FRAME_MS = 16
+    REVEAL_MS = 250
+    SHAKE_MS = 350
+
+    def __init__(self, parent, font, pool_size=16, padding=4):
+        self.font = font
+        self.padding = padding
+        zero = font.measure('0')
+        self.box_width = zero * 2 + 2 * padding  # Same footprint as a Label with width=2
+        probe = tk.Label(parent, text=" ", width=1, font=SPACER_FONT)  # The original spacer label
+        self.spacer_width = probe.winfo_reqwidth()
+        probe.destroy()
+        self.height = font.metrics('linespace') + 2 * padding
+        self.canvas = tk.Canvas(parent, height=self.height + 2, width=0, highlightthickness=0, borderwidth=0)
+        self.canvas.pack()
+        self.rects = []
+        self.texts = []
+        self._cells = []  # Last (char, x, bg, fg) drawn per cell
+        self._visible = 0
+        self._text = ""
+        self._colors = (None, None)
+        self._animations = []
+        self._after_id = None
+        self._offset = 0
+        for _ in range(pool_size):
+            self._add_cell()
+
+    def _add_cell(self):
+        rect = self.canvas.create_rectangle(0, 0, 0, 0, state=tk.HIDDEN, tags=('board',))
+        text = self.canvas.create_text(0, 0, font=self.font, state=tk.HIDDEN, tags=('board',))
+        self.rects.append(rect)
+        self.texts.append(text)
+        self._cells.append(None)
+
+    def show(self, text, bg, fg):
+        """Display `text`; letters revealed in the same word fade in"""
+        previous = self._text
+        if bg != self._colors[0]:
+            self.canvas.configure(bg=bg)
+        while len(self.rects) < len(text):
+            self._add_cell()
+        self._stop_shake()
+        canvas = self.canvas
+        x = 1
+        revealed = []
+        for i, char in enumerate(text):
+            cell = (char, x, bg, fg)
+            if self._cells[i] != cell:
+                if char == ' ':
+                    canvas.itemconfigure(self.rects[i], state=tk.HIDDEN)
+                    canvas.itemconfigure(self.texts[i], state=tk.HIDDEN)
+                else:
+                    canvas.coords(self.rects[i], x, 1, x + self.box_width, 1 + self.height)
+                    canvas.coords(self.texts[i], x + self.box_width / 2, 1 + self.height / 2)
+                    canvas.itemconfigure(self.rects[i], state=tk.NORMAL, fill=bg, outline=fg)
+                    canvas.itemconfigure(self.texts[i], state=tk.NORMAL, text=char, fill=fg)
+                    if len(previous) == len(text) and previous[i] == '_' and char != '_':
+                        revealed.append(i)
+                self._cells[i] = cell
+            x += self.spacer_width if char == ' ' else self.box_width
+        for i in range(len(text), self._visible):
+            canvas.itemconfigure(self.rects[i], state=tk.HIDDEN)
+            canvas.itemconfigure(self.texts[i], state=tk.HIDDEN)
+            self._cells[i] = None
+        if len(text) != len(previous):
+            canvas.configure(width=x + 1)
+        self._visible = len(text)
+        self._text = text
+        self._colors = (bg, fg)
+        for i in revealed:
+            self._start(self._reveal_step(i, bg, fg), 'reveal')
+
+    @property
+    def boxes(self):
+        return [text for text, char in zip(self.texts, self._text) if char != ' ']
+
+    def set_colors(self, bg, fg):
+        if (bg, fg) != self._colors:
+            self.show(self._text, bg, fg)
+
+    def clear(self):
+        bg, fg = self._colors
+        self.show("", bg, fg)
+
+    def shake(self):
+        """Shake the board sideways (wrong guess)"""
+        self._stop_shake()
+        self._start(self._shake_step(), 'shake')
+
+    # --- Animations --------------------------------------------------------
+
+    def _start(self, step, kind):
+        self._animations.append((kind, step))
+        if self._after_id is None:
+            self._after_id = self.canvas.after(self.FRAME_MS, self._tick)
+
+    def _tick(self):
+        self._after_id = None
+        now = time.monotonic() * 1000
+        self._animations = [(kind, step) for kind, step in self._animations if step(now)]
+        if self._animations:
+            self._after_id = self.canvas.after(self.FRAME_MS, self._tick)
+
+    def _stop_shake(self):
+        if any(kind == 'shake' for kind, _ in self._animations):
+            self._animations = [(kind, step) for kind, step in self._animations if kind != 'shake']
+        if self._offset:
+            self.canvas.move('board', -self._offset, 0)
+            self._offset = 0
+
+    def _reveal_step(self, index, bg, fg):
+        """Fade the letter in from the background color while it drops into place"""
+        start_rgb, end_rgb = _hex_to_rgb(bg, self.canvas), _hex_to_rgb(fg, self.canvas)
+        item = self.texts[index]
+        x, y = self.canvas.coords(item)
+        start = [None]
+        drop = self.height / 3
+
+        def step(now):
+            if start[0] is None:
+                start[0] = now
+            t = min(1.0, (now - start[0]) / self.REVEAL_MS)
+            if self._cells[index] is None or self._cells[index][2:] != (bg, fg):
+                return False  # Cell reused or recolored meanwhile
+            ease = 1 - (1 - t) ** 3
+            self.canvas.itemconfigure(item, fill=_blend(start_rgb, end_rgb, ease))
+            self.canvas.coords(item, x + self._offset, y - drop * (1 - ease))
+            return t < 1.0
+        return step
+
+    def _shake_step(self):
+        start = [None]
+
+        def step(now):
+            if start[0] is None:
+                start[0] = now
+            t = (now - start[0]) / self.SHAKE_MS
+            offset = 0 if t >= 1.0 else round(self.box_width / 4 * (1 - t) * ((-1) ** int(t * 8)))
+            if offset != self._offset:
+                self.canvas.move('board', offset - self._offset, 0)
+                self._offset = offset
+            return t < 1.0
+        return step
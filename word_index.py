@@ -0,0 +1,247 @@
+import sys
+import math
+import random
+import threading
+
+from usernames import turkish_lower
+from applog import get_logger
+
+log = get_logger(__name__)
+
+HIDDEN_LETTER = '_'
+
+
+def normalize_letter(char):
+    """Normalize a letter for index lookups ('İ' -> 'i', 'I' -> 'ı', one letter each)"""
+    return turkish_lower(char)
+
+
+if hasattr(int, 'bit_count'):
+    def popcount(bits):
+        return bits.bit_count()
+else:  # Python < 3.10
+    def popcount(bits):
+        return bin(bits).count('1')
+
+
+def parse_pattern(pattern):
+    """
+    Parse a display pattern into (length, {position: letter})
+
+    Accepts the spaced form shown by GameState.get_displayed_word
+    ("_ _ K _ _") as well as the compact form ("__k__").
+    """
+    pattern = pattern.strip()
+    cells = pattern.split() if ' ' in pattern else list(pattern)
+    known = {position: normalize_letter(cell) for position, cell in enumerate(cells)
+             if cell != HIDDEN_LETTER}
+    return len(cells), known
+
+
+def iter_bits(bits):
+    """Yield the positions of the set bits, lowest first"""
+    while bits:
+        low = bits & -bits
+        yield low.bit_length() - 1
+        bits ^= low
+
+
+class PositionalIndex:
+    """
+    Per-length positional letter index over the word corpus
+
+    Every distinct word gets an id within its length bucket. For each
+    length and position the index keeps one bitset (a Python int) per
+    letter, with bit `id` set when word `id` has that letter there. The
+    words matching a partially revealed word are then a handful of ANDs.
+    """
+
+    def __init__(self, words=()):
+        self._words = {}     # length -> [word]
+        self._ids = {}       # length -> {word: id}
+        self._bitsets = {}   # length -> [{letter: bitset} for each position]
+        self._pending = {}   # length -> [{letter: [id]} for each position], not yet in the bitsets
+        for word in words:
+            self.add(word)
+
+    def __len__(self):
+        return sum(len(words) for words in self._words.values())
+
+    def add(self, word):
+        """Add a word to the index, ignoring duplicates and words with spaces"""
+        word = ''.join(normalize_letter(c) for c in word.strip())
+        if not word or ' ' in word:
+            return
+        length = len(word)
+        ids = self._ids.setdefault(length, {})
+        if word in ids:
+            return
+        word_id = len(ids)
+        ids[word] = word_id
+        self._words.setdefault(length, []).append(word)
+        # Growing a big int one bit at a time is quadratic, so ids are
+        # collected here and turned into bitsets in one go on the next query
+        pending = self._pending.setdefault(length, [{} for _ in range(length)])
+        for position, letter in enumerate(word):
+            pending[position].setdefault(letter, []).append(word_id)
+
+    def _flush(self):
+        """Merge the pending ids into the bitsets"""
+        for length, pending in self._pending.items():
+            positions = self._bitsets.setdefault(length, [{} for _ in range(length)])
+            size = (len(self._words[length]) + 7) // 8
+            for position, letters in enumerate(pending):
+                for letter, ids in letters.items():
+                    buffer = bytearray(size)
+                    for word_id in ids:
+                        buffer[word_id >> 3] |= 1 << (word_id & 7)
+                    positions[position][letter] = (positions[position].get(letter, 0)
+                                                   | int.from_bytes(buffer, 'little'))
+        self._pending = {}
+
+    def all_words(self, length):
+        """Bitset of every word with the given length"""
+        return (1 << len(self._words.get(length, ()))) - 1
+
+    def letter_bits(self, length, position, letter):
+        """Bitset of the words with `letter` at `position`"""
+        if self._pending:
+            self._flush()
+        positions = self._bitsets.get(length)
+        if not positions:
+            return 0
+        return positions[position].get(normalize_letter(letter), 0)
+
+    def letters_at(self, length, position):
+        """Mapping of letter -> bitset for one position of one length bucket"""
+        if self._pending:
+            self._flush()
+        positions = self._bitsets.get(length)
+        return positions[position] if positions else {}
+
+    def candidates(self, length, known):
+        """Bitset of the words of `length` matching the known letters ({position: letter})"""
+        bits = self.all_words(length)
+        for position, letter in known.items():
+            bits &= self.letter_bits(length, position, letter)
+            if not bits:
+                break
+        return bits
+
+    def match(self, pattern):
+        """Bitset of the words matching a display pattern such as '_ a _ _ k'"""
+        length, known = parse_pattern(pattern)
+        return self.candidates(length, known)
+
+    def count(self, pattern):
+        """Number of words matching a display pattern"""
+        return popcount(self.match(pattern))
+
+    def words(self, pattern, limit=None):
+        """List the words matching a display pattern, at most `limit` of them"""
+        length, known = parse_pattern(pattern)
+        bits = self.candidates(length, known)
+        words = self._words.get(length, [])
+        result = []
+        for word_id in iter_bits(bits):
+            if limit is not None and len(result) >= limit:
+                break
+            result.append(words[word_id])
+        return result
+
+
+class HintEngine:
+    """
+    Picks the letter to reveal for a character hint
+
+    The engine reveals the hidden position whose actual letter leaves the
+    fewest dictionary words consistent with the revealed pattern, i.e. the
+    reveal carrying the most information (log2 of the cut) about the
+    answer. Ties go to the position whose letters are spread most evenly
+    over the candidates (highest entropy). Until an index is available the
+    engine falls back to a random hidden position.
+    """
+
+    def __init__(self, index=None):
+        self.index = index
+
+    def load_async(self, repository, WordClass):
+        """Build the index from the whole corpus on a background thread"""
+        def build():
+            try:
+                words_by_difficulty = repository.get_all_words(WordClass=WordClass)
+                index = PositionalIndex()
+                for word_list in words_by_difficulty.values():
+                    for w in word_list:
+                        index.add(w.word)
+                index.letters_at(0, 0)  # Materialize the bitsets off the UI thread
+                self.index = index  # Swap in only once fully built
+                log.info("Word index ready: %d words", len(index))
+            except Exception as e:
+                log.warning("Could not build word index, using random hints: %s", e)
+
+        thread = threading.Thread(target=build, name="hint-index", daemon=True)
+        thread.start()
+        return thread
+
+    def choose_position(self, word, revealed_indices):
+        """Return the index of the letter to reveal next, or None if all are revealed"""
+        hidden = [i for i in range(len(word)) if i not in revealed_indices]
+        if not hidden:
+            return None
+
+        index = self.index
+        if index is None:
+            return random.choice(hidden)
+
+        length = len(word)
+        known = {i: word[i] for i in revealed_indices}
+        candidates = index.candidates(length, known)
+        if not candidates:
+            return random.choice(hidden)  # Answer is not in the corpus
+
+        cuts = {position: popcount(candidates & index.letter_bits(length, position, word[position]))
+                for position in hidden}
+        fewest = min(cuts.values())
+        tied = [position for position in hidden if cuts[position] == fewest]
+        if len(tied) == 1:
+            return tied[0]
+        # Entropies are only computed to break ties
+        return max(tied, key=lambda position: self._entropy(index, length, position, candidates))
+
+    @staticmethod
+    def _entropy(index, length, position, candidates):
+        """Entropy in bits of the letter at `position` over the candidate words"""
+        total = popcount(candidates)
+        entropy = 0.0
+        for bits in index.letters_at(length, position).values():
+            count = popcount(candidates & bits)
+            if count:
+                p = count / total
+                entropy -= p * math.log2(p)
+        return entropy
+
+
+def main():
+    """Admin tool: list the corpus words matching a pattern given on the command line"""
+    from repository import WordRepository
+    from game import Word
+
+    if len(sys.argv) < 2:
+        print('Usage: python word_index.py "_ a _ _ k" [limit]')
+        return
+    pattern = sys.argv[1]
+    limit = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+
+    repository = WordRepository(server='localhost', database='kelimeOyunu')
+    index = PositionalIndex()
+    for word_list in repository.get_all_words(WordClass=Word).values():
+        for w in word_list:
+            index.add(w.word)
+    print(f"{index.count(pattern)} words match '{pattern}'")
+    for word in index.words(pattern, limit=limit):
+        print(f"  {word}")
+
+
+if __name__ == "__main__":
+    main()